@@ -0,0 +1,87 @@
+"""
+Compare the signing throughput of SecretKey.sign() with Signer and Keyring, and the
+verification throughput of PublicKey.verify() with verify_many().
+
+Run from the repository root:
+
+    python -m benchmarks.signing --count 2000
+"""
+import argparse
+import time
+from risesdk.protocol import Amount, Keyring, SecretKey, SendTx, Signer, Timestamp, verify_many
+
+
+def _transactions(signer: Signer, count: int):
+    return [
+        SendTx(
+            sender_public_key=signer.public_key,
+            recipient=signer.public_key.derive_address(),
+            amount=Amount(i + 1),
+            fee=Amount(10000000),
+            timestamp=Timestamp(1000),
+        )
+        for i in range(count)
+    ]
+
+
+def _secret_key(txs, secret: SecretKey, second_secret: SecretKey):
+    # The way callers sign without a Signer: two serialisations and a key expansion per signature
+    for tx in txs:
+        tx.signature = secret.sign(tx.to_bytes(skip_signature=True, skip_second_signature=True))
+        tx.second_signature = second_secret.sign(tx.to_bytes(skip_second_signature=True))
+
+
+def _signer(txs, signer: Signer):
+    for tx in txs:
+        signer.sign_tx(tx)
+
+
+def _verify(items):
+    for (pk, sig, msg) in items:
+        pk.verify(sig, msg)
+
+
+def _report(name: str, count: int, elapsed: float):
+    print('{:<20} {:>9.0f} tx/s  ({:.1f} us/tx)'.format(
+        name, count / elapsed, elapsed / count * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    secret = SecretKey.from_passphrase('benchmark')
+    second_secret = SecretKey.from_passphrase('benchmark second')
+    signer = Signer(secret, second_secret)
+    keyring = Keyring([signer])
+
+    cases = [
+        ('SecretKey.sign', lambda txs: _secret_key(txs, secret, second_secret)),
+        ('Signer.sign_tx', lambda txs: _signer(txs, signer)),
+        ('Keyring.sign_many', lambda txs: keyring.sign_many(txs, workers=args.workers)),
+    ]
+    for (name, sign) in cases:
+        txs = _transactions(signer, args.count)
+        started = time.perf_counter()
+        sign(txs)
+        _report(name, args.count, time.perf_counter() - started)
+
+    items = [
+        (tx.sender_public_key, tx.signature,
+         tx.to_bytes(skip_signature=True, skip_second_signature=True))
+        for tx in txs
+    ]
+    cases = [
+        ('PublicKey.verify', _verify),
+        ('verify_many', lambda items: verify_many(items, workers=args.workers)),
+    ]
+    for (name, verify) in cases:
+        started = time.perf_counter()
+        verify(items)
+        _report(name, args.count, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,37 @@ from risesdk.api.blocks import BlocksAPI
 from risesdk.api.delegates import DelegatesAPI
 from risesdk.api.transactions import TransactionsAPI
 from risesdk.api.client import Client
+from risesdk.api.head import ChainHead
+from risesdk.api.query import TransactionStore
+from risesdk.api.follower import (
+    BlockFollower,
+    BlockApplied,
+    BlockReverted,
+    BlockVerificationError,
+)
+from risesdk.api.backfill import BlockBackfill, BackfillProgress
+from risesdk.api.mirror import ChainMirror
+from risesdk.api.bloom import AddressBloomIndex
+from risesdk.api.archive import TransactionArchive, ArchivedTransaction
+from risesdk.api.ledger import BalanceLedger, BalanceChange
+from risesdk.api.history import BalanceHistory
+from risesdk.api.mempool import MempoolWatcher, PendingAdded, PendingRemoved, PendingConfirmed
+from risesdk.api.fees import FeeSchedule
+from risesdk.api.registry import DelegateRegistry
+from risesdk.api.voters import VoterGraph
+from risesdk.api.forging import ForgingSchedule, MissedSlot
+from risesdk.api.rewards import RewardCalculator, RewardShare
+from risesdk.api.payouts import PayoutBuilder
+from risesdk.api.submit import SubmissionPipeline, TransactionRejectedError
+from risesdk.api.journal import TransactionJournal, JournalState, JournalEntry
+from risesdk.api.tracker import ConfirmationTracker, TransactionDroppedError
+from risesdk.api.deposits import (
+    DepositWatcher,
+    Deposit,
+    DepositSeen,
+    DepositConfirmed,
+    DepositReverted,
+)
 
 __all__ = [
     'APIError',
@@ -13,4 +44,43 @@ __all__ = [
     'DelegatesAPI',
     'TransactionsAPI',
     'Client',
+    'ChainHead',
+    'TransactionStore',
+    'BlockFollower',
+    'BlockApplied',
+    'BlockReverted',
+    'BlockBackfill',
+    'BackfillProgress',
+    'ChainMirror',
+    'AddressBloomIndex',
+    'TransactionArchive',
+    'ArchivedTransaction',
+    'BalanceLedger',
+    'BalanceChange',
+    'DepositWatcher',
+    'Deposit',
+    'DepositSeen',
+    'DepositConfirmed',
+    'DepositReverted',
+    'BalanceHistory',
+    'MempoolWatcher',
+    'PendingAdded',
+    'PendingRemoved',
+    'PendingConfirmed',
+    'ConfirmationTracker',
+    'TransactionDroppedError',
+    'FeeSchedule',
+    'DelegateRegistry',
+    'VoterGraph',
+    'ForgingSchedule',
+    'MissedSlot',
+    'RewardCalculator',
+    'RewardShare',
+    'PayoutBuilder',
+    'SubmissionPipeline',
+    'TransactionRejectedError',
+    'TransactionJournal',
+    'JournalState',
+    'JournalEntry',
+    'BlockVerificationError',
 ]
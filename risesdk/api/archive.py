@@ -0,0 +1,199 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+from risesdk.protocol import Amount, BaseTx
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.transactions import TransactionInfo
+
+# tx_id, block_id, fee, height, type, flags, length
+_RECORD = struct.Struct('<QQQIBBI')
+# tx_id, height, offset
+_INDEX = struct.Struct('<QIQ')
+
+
+class ArchivedTransaction(NamedTuple):
+    tx_id: str
+    block_id: str
+    height: int
+    type_id: int
+    fee: Amount
+    flags: int
+    data: memoryview
+
+    def decode(self) -> BaseTx:
+        """
+        Parse the stored binary form (BaseTx.to_bytes()) back into a transaction object.
+        """
+        return BaseTx.from_bytes_with_flags(bytes(self.data), self.fee, self.flags)
+
+
+class TransactionArchive(object):
+    """
+    Append-only archive of confirmed transactions in their binary form.
+
+    Each record in the data file consists of a fixed layout header (tx id, block id, fee,
+    height, type, flags and length) followed by the BaseTx.to_bytes() encoding of the
+    transaction. A sidecar index file (path + '.idx') stores fixed size entries with the id,
+    height and data file offset of each record. Both files are read through mmap and the
+    transaction bytes are returned as memoryview slices of the mapping, without copying.
+
+    Transactions have to be appended in height order. Records can be looked up by position,
+    by height (binary search over the index) or by id.
+    """
+
+    def __init__(self, path: str):
+        self._data_file = open(path, 'a+b')
+        self._index_file = open(path + '.idx', 'a+b')
+        self._dirty = False
+        self._data_map: Optional[mmap.mmap] = None
+        self._index_map: Optional[mmap.mmap] = None
+        self._ids: Optional[Dict[int, int]] = None
+
+        self._data_size = os.path.getsize(path)
+        self._count = os.path.getsize(path + '.idx') // _INDEX.size
+        self._last_height = self._entry(self._count - 1)[1] if self._count else 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        self.flush()
+        # Mappings are left to the garbage collector, since memoryviews of them may still exist
+        self._data_map = None
+        self._index_map = None
+        self._data_file.close()
+        self._index_file.close()
+
+    def flush(self):
+        if self._dirty:
+            self._data_file.flush()
+            self._index_file.flush()
+            self._dirty = False
+
+    def append(self, info: TransactionInfo):
+        if info.height < self._last_height:
+            raise ValueError('Transactions must be appended in height order')
+        tx = info.tx
+        flags = tx.bytes_flags()
+        data = tx.to_bytes()
+        tx_id = int(info.tx_id)
+
+        self._data_file.write(_RECORD.pack(
+            tx_id, int(info.block_id), int(tx.fee), info.height,
+            tx._type_id(), flags, len(data),
+        ))
+        self._data_file.write(data)
+        self._index_file.write(_INDEX.pack(tx_id, info.height, self._data_size))
+        if self._ids is not None:
+            self._ids[tx_id] = self._count
+
+        self._data_size += _RECORD.size + len(data)
+        self._count += 1
+        self._last_height = info.height
+        self._dirty = True
+
+    def extend(self, infos: Iterable[TransactionInfo]):
+        for info in infos:
+            self.append(info)
+
+    def append_block(self, block: BlockInfo):
+        self.extend(block.transactions)
+
+    def truncate(self, height: int):
+        """
+        Remove the transactions above the height, for example after the blocks were reverted.
+        """
+        count = self._bisect_height(height + 1)
+        if count == self._count:
+            return
+        offset = self._entry(count)[2]
+        self.flush()
+        self._data_map = None
+        self._index_map = None
+        self._data_file.truncate(offset)
+        self._index_file.truncate(count * _INDEX.size)
+        self._data_size = offset
+        self._count = count
+        self._last_height = self._entry(count - 1)[1] if count else 0
+        self._ids = None
+
+    def _maps(self):
+        self.flush()
+        # Old mappings aren't closed explicitly, since there may be memoryviews that reference them
+        if self._data_map is None or len(self._data_map) != self._data_size:
+            self._data_map = mmap.mmap(self._data_file.fileno(), self._data_size,
+                                       access=mmap.ACCESS_READ) if self._data_size else None
+        index_size = self._count * _INDEX.size
+        if self._index_map is None or len(self._index_map) != index_size:
+            self._index_map = mmap.mmap(self._index_file.fileno(), index_size,
+                                        access=mmap.ACCESS_READ) if index_size else None
+        return (self._data_map, self._index_map)
+
+    def _entry(self, pos: int):
+        (_, index_map) = self._maps()
+        return _INDEX.unpack_from(index_map, pos * _INDEX.size)
+
+    def _record(self, offset: int) -> ArchivedTransaction:
+        (data_map, _) = self._maps()
+        (tx_id, block_id, fee, height, type_id, flags, length) = _RECORD.unpack_from(data_map, offset)
+        start = offset + _RECORD.size
+        return ArchivedTransaction(
+            tx_id=str(tx_id),
+            block_id=str(block_id),
+            height=height,
+            type_id=type_id,
+            fee=Amount(fee),
+            flags=flags,
+            data=memoryview(data_map)[start:start + length],
+        )
+
+    def __getitem__(self, pos: int) -> ArchivedTransaction:
+        if pos < 0:
+            pos += self._count
+        if not 0 <= pos < self._count:
+            raise IndexError('Archive index out of range')
+        return self._record(self._entry(pos)[2])
+
+    def __iter__(self) -> Iterator[ArchivedTransaction]:
+        offset = 0
+        end = self._data_size
+        while offset < end:
+            record = self._record(offset)
+            offset += _RECORD.size + len(record.data)
+            yield record
+
+    def _bisect_height(self, height: int) -> int:
+        # Position of the first record with a height >= the provided height
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[1] < height:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def at_height(self, height: int) -> List[ArchivedTransaction]:
+        pos = self._bisect_height(height)
+        records = []
+        while pos < self._count:
+            (_, entry_height, offset) = self._entry(pos)
+            if entry_height != height:
+                break
+            records.append(self._record(offset))
+            pos += 1
+        return records
+
+    def get(self, tx_id: str) -> Optional[ArchivedTransaction]:
+        if self._ids is None:
+            # The id lookup table is built on first use from the index
+            (_, index_map) = self._maps()
+            self._ids = {}
+            if index_map is not None:
+                for (i, (entry_id, _, _)) in enumerate(_INDEX.iter_unpack(index_map)):
+                    self._ids[entry_id] = i
+        pos = self._ids.get(int(tx_id))
+        if pos is None:
+            return None
+        return self[pos]
@@ -0,0 +1,150 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from risesdk.api.base import APIError, TRANSPORT_ERRORS
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+
+
+class BackfillProgress(NamedTuple):
+    height: int
+    blocks: int
+    total: int
+    elapsed: float
+    blocks_per_sec: float
+
+
+class BlockBackfill(object):
+    """
+    Fetches a (historical) height range of blocks using concurrent requests.
+
+    The range is split into chunks that are fetched in parallel, spread over all of the
+    provided clients. The blocks are yielded strictly in height order. At most
+    max_buffered_chunks chunks are fetched ahead of the consumer, which keeps the memory
+    usage bounded when the consumer is slower than the nodes.
+
+    Every block is checked to link to the previous one through previous_block_id. A chunk that
+    fails to fetch, or doesn't link up, is retried on the other clients before giving up.
+
+    For example:
+
+        backfill = BlockBackfill([Client(url) for url in urls], from_height=1, to_height=100000)
+        for block in backfill:
+            ...
+    """
+    from_height: int
+    to_height: Optional[int]
+    chunk_size: int
+
+    def __init__(
+        self,
+        clients: Union[Client, Sequence[Client]],
+        from_height: int = 1,
+        to_height: Optional[int] = None,
+        chunk_size: int = 100,
+        workers: int = 4,
+        max_buffered_chunks: Optional[int] = None,
+        previous_block_id: Optional[str] = None,
+        on_progress: Optional[Callable[[BackfillProgress], None]] = None,
+    ):
+        if isinstance(clients, Client):
+            clients = [clients]
+        if not clients:
+            raise ValueError('At least one client is required')
+        if from_height < 1:
+            raise ValueError('Heights start from 1')
+        self._clients = list(clients)
+        self.from_height = from_height
+        self.to_height = to_height
+        self.chunk_size = chunk_size
+        self._workers = workers
+        self._max_buffered_chunks = max_buffered_chunks or workers * 2
+        self._previous_block_id = previous_block_id
+        self._on_progress = on_progress
+        self._progress: Optional[BackfillProgress] = None
+
+    @property
+    def progress(self) -> Optional[BackfillProgress]:
+        return self._progress
+
+    def _chunks(self, to_height: int) -> Iterator[Tuple[int, int, int]]:
+        for (index, start) in enumerate(range(self.from_height, to_height + 1, self.chunk_size)):
+            yield (index, start, min(self.chunk_size, to_height - start + 1))
+
+    def _fetch_chunk(self, index: int, start: int, count: int, attempt: int = 0) -> List[BlockInfo]:
+        attempts = max(2, len(self._clients))
+        while True:
+            client = self._clients[(index + attempt) % len(self._clients)]
+            try:
+                blocks = client.blocks.get_blocks(
+                    offset=start - 1,
+                    limit=count,
+                    order_by='height:asc',
+                ).blocks
+                self._check_chunk(blocks, start, count)
+                return blocks
+            except TRANSPORT_ERRORS:
+                attempt += 1
+                if attempt >= attempts:
+                    raise
+
+    @staticmethod
+    def _check_chunk(blocks: List[BlockInfo], start: int, count: int):
+        if [b.height for b in blocks] != list(range(start, start + count)):
+            raise APIError('Incomplete chunk of blocks at height {}'.format(start))
+        for (prev, block) in zip(blocks, blocks[1:]):
+            if block.previous_block_id != prev.block_id:
+                raise APIError('Block {} does not link to the previous block'.format(block.height))
+
+    def __iter__(self) -> Iterator[BlockInfo]:
+        to_height = self.to_height
+        if to_height is None:
+            to_height = self._clients[0].blocks.get_status().height
+        total = max(0, to_height - self.from_height + 1)
+        chunks = self._chunks(to_height)
+        pending: Deque[Tuple[Tuple[int, int, int], Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self._workers)
+
+        def submit_next():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append((chunk, executor.submit(self._fetch_chunk, *chunk)))
+
+        started = time.monotonic()
+        done = 0
+        previous_block_id = self._previous_block_id
+        try:
+            for _ in range(self._max_buffered_chunks):
+                submit_next()
+
+            while pending:
+                (chunk, future) = pending.popleft()
+                blocks = future.result()
+                if previous_block_id is not None and blocks[0].previous_block_id != previous_block_id:
+                    # The chunk was served by a node on a different fork, try the others
+                    blocks = self._fetch_chunk(*chunk, attempt=1)
+                    if blocks[0].previous_block_id != previous_block_id:
+                        raise APIError('Block {} does not link to the previous block'.format(
+                            blocks[0].height))
+                submit_next()
+
+                for block in blocks:
+                    yield block
+                previous_block_id = blocks[-1].block_id
+                done += len(blocks)
+
+                elapsed = time.monotonic() - started
+                self._progress = BackfillProgress(
+                    height=blocks[-1].height,
+                    blocks=done,
+                    total=total,
+                    elapsed=elapsed,
+                    blocks_per_sec=done / elapsed if elapsed > 0 else 0.0,
+                )
+                if self._on_progress is not None:
+                    self._on_progress(self._progress)
+        finally:
+            for (_, future) in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -6,6 +6,11 @@ class APIError(Exception):
     pass
 
 
+# Errors of a single request that may succeed when retried (on another node): node errors,
+# connection failures and timeouts, and responses that aren't valid JSON
+TRANSPORT_ERRORS = (APIError, requests.RequestException, ValueError)
+
+
 class BaseAPI(object):
     def __init__(
         self,
@@ -4,7 +4,9 @@ from risesdk.protocol import (
     Amount,
     PublicKey,
     Signature,
-    BaseTx,
+    BlockHeader,
+    BlockVerification,
+    verify_blocks,
 )
 from risesdk.api.base import BaseAPI, APIError
 from risesdk.api.transactions import TransactionInfo
@@ -24,7 +26,7 @@ class BlockInfo(object):
     payload_hash: bytes
     generator_public_key: PublicKey
     block_signature: Signature
-    transactions: List[BaseTx]
+    transactions: List[TransactionInfo]
 
     def __init__(self, raw):
         self.block_id = str(raw['id'])
@@ -45,6 +47,51 @@ class BlockInfo(object):
         self.block_signature = Signature.fromhex(raw['blockSignature'])
         self.transactions = [TransactionInfo(t) for t in raw['transactions']]
 
+    def to_json(self):
+        """
+        Serialize the block info back to the node's JSON format.
+        """
+        return {
+            'id': self.block_id,
+            'version': self.version,
+            'timestamp': self.timestamp,
+            'height': self.height,
+            'previousBlock': self.previous_block_id,
+            'numberOfTransactions': self.number_of_transactions,
+            'totalAmount': self.total_amount,
+            'totalFee': self.total_fee,
+            'reward': self.reward,
+            'payloadLength': self.payload_length,
+            'payloadHash': self.payload_hash.hex(),
+            'generatorPublicKey': self.generator_public_key.hex(),
+            'blockSignature': self.block_signature.hex(),
+            'transactions': [t.to_json() for t in self.transactions],
+        }
+
+    def to_header(self) -> BlockHeader:
+        return BlockHeader(
+            version=self.version,
+            timestamp=self.timestamp,
+            previous_block_id=self.previous_block_id,
+            number_of_transactions=self.number_of_transactions,
+            total_amount=self.total_amount,
+            total_fee=self.total_fee,
+            reward=self.reward,
+            payload_length=self.payload_length,
+            payload_hash=self.payload_hash,
+            generator_public_key=self.generator_public_key,
+            block_signature=self.block_signature,
+        )
+
+    def verify(self, transactions: bool = False) -> BlockVerification:
+        """
+        Check the block id, payload and generator signature, see verify_blocks().
+        """
+        return verify_blocks(
+            [(self.block_id, self.to_header(), [t.tx for t in self.transactions])],
+            transactions=transactions,
+        )[0]
+
 
 class BlocksResult(object):
     blocks: List[BlockInfo]
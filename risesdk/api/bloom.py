@@ -0,0 +1,193 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple, Union
+from risesdk.protocol import Address, PublicKey
+from risesdk.api.blocks import BlockInfo
+
+_MAGIC = b'RBLM'
+_HEADER = struct.Struct('<4sHHIIQQ')
+
+# Translation tables that turn a byte into 1 when the given bit is set, 0 otherwise
+_BIT_TABLES = [bytes(1 if b & (1 << bit) else 0 for b in range(256)) for bit in range(8)]
+
+
+def _bit_positions(key: bytes, bits: int, hashes: int) -> List[int]:
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], byteorder='little')
+    h2 = int.from_bytes(digest[8:], byteorder='little') | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+class AddressBloomIndex(object):
+    """
+    Compact on-disk index of the blocks that involve an address.
+
+    For every group of group_size blocks the index stores a Bloom filter of the sender public
+    keys, sender addresses and recipient addresses of the transactions, and of the block
+    generator. The filters are stored back to back in a memory-mapped file, so looking up an
+    address only tests a handful of bits per group. A lookup returns the height ranges that
+    may contain transactions of the address (with a small chance of false positives), all
+    other blocks can be skipped.
+
+    Blocks have to be added in height order. Reverted blocks leave their bits in the filter,
+    which only adds false positives.
+    """
+    group_size: int
+    filter_bytes: int
+    hashes: int
+    start_height: int
+
+    def __init__(
+        self,
+        path: str,
+        group_size: int = 100,
+        filter_bytes: int = 256,
+        hashes: int = 4,
+        start_height: int = 1,
+    ):
+        self._path = path
+        self._mmap: Optional[mmap.mmap] = None
+        if os.path.exists(path) and os.path.getsize(path) >= _HEADER.size:
+            self._file = open(path, 'r+b')
+            (magic, _, self.hashes, self.group_size, self.filter_bytes,
+             self.start_height, self._height) = _HEADER.unpack(self._file.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError('{} is not an address index file'.format(path))
+        else:
+            self._file = open(path, 'w+b')
+            self.group_size = group_size
+            self.filter_bytes = filter_bytes
+            self.hashes = hashes
+            self.start_height = start_height
+            self._height = start_height - 1
+        self._group = self._group_index(self._height + 1)
+        self._filter = self._read_group(self._group)
+        self._write_header()
+
+    @property
+    def height(self) -> int:
+        """
+        Height of the last indexed block.
+        """
+        return self._height
+
+    def _group_index(self, height: int) -> int:
+        return (height - self.start_height) // self.group_size
+
+    def _group_offset(self, group: int) -> int:
+        return _HEADER.size + group * self.filter_bytes
+
+    def _read_group(self, group: int) -> bytearray:
+        self._file.seek(self._group_offset(group))
+        data = self._file.read(self.filter_bytes)
+        return bytearray(data.ljust(self.filter_bytes, b'\0'))
+
+    def _write_header(self):
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(
+            _MAGIC, 1, self.hashes, self.group_size, self.filter_bytes,
+            self.start_height, self._height,
+        ))
+
+    def _add_key(self, key: bytes):
+        for pos in _bit_positions(key, self.filter_bytes * 8, self.hashes):
+            self._filter[pos >> 3] |= 1 << (pos & 7)
+
+    def add_block(self, block: BlockInfo):
+        if block.height != self._height + 1:
+            raise ValueError('Expected block at height {}, got {}'.format(
+                self._height + 1, block.height))
+
+        group = self._group_index(block.height)
+        if group != self._group:
+            self._flush_group()
+            self._group = group
+            self._filter = bytearray(self.filter_bytes)
+
+        self._add_key(block.generator_public_key.derive_address().to_bytes())
+        for info in block.transactions:
+            tx = info.tx
+            self._add_key(bytes(tx.sender_public_key))
+            self._add_key(tx.sender_public_key.derive_address().to_bytes())
+            if tx._recipient:
+                self._add_key(tx._recipient.to_bytes())
+        self._height = block.height
+
+    def revert_to(self, height: int):
+        """
+        Forget the blocks above the height, so that they can be indexed again.
+        """
+        if height >= self._height:
+            return
+        self._flush_group()
+        self._height = height
+        self._group = self._group_index(height + 1)
+        self._filter = self._read_group(self._group)
+
+    def _flush_group(self):
+        self._file.seek(self._group_offset(self._group))
+        self._file.write(self._filter)
+
+    def flush(self):
+        self._flush_group()
+        self._write_header()
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def _map(self) -> mmap.mmap:
+        self.flush()
+        size = self._group_offset(self._group + 1)
+        if self._mmap is None or len(self._mmap) != size:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _matching_groups(self, key: bytes) -> int:
+        # Test each bit position for all groups at once: take the column of bytes that holds
+        # the bit in every filter, reduce it to 0/1 per group and AND the columns together as
+        # big integers (one byte per group).
+        mm = self._map()
+        groups = self._group + 1
+        result = None
+        for pos in _bit_positions(key, self.filter_bytes * 8, self.hashes):
+            start = _HEADER.size + (pos >> 3)
+            column = mm[start:start + groups * self.filter_bytes:self.filter_bytes]
+            column = column.translate(_BIT_TABLES[pos & 7])
+            value = int.from_bytes(column, byteorder='big')
+            result = value if result is None else result & value
+        return result or 0
+
+    def candidate_ranges(self, key: Union[Address, PublicKey]) -> List[Tuple[int, int]]:
+        """
+        Return the (inclusive) height ranges of blocks that may involve the address or public key.
+        """
+        if self._height < self.start_height:
+            return []
+        if isinstance(key, PublicKey):
+            matches = self._matching_groups(bytes(key)) | \
+                self._matching_groups(key.derive_address().to_bytes())
+        else:
+            matches = self._matching_groups(Address(key).to_bytes())
+
+        groups = self._group + 1
+        flags = matches.to_bytes(groups, byteorder='big')
+        ranges: List[Tuple[int, int]] = []
+        group = flags.find(1)
+        while group >= 0:
+            start = self.start_height + group * self.group_size
+            end = min(start + self.group_size - 1, self._height)
+            if ranges and ranges[-1][1] + 1 == start:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+            group = flags.find(1, group + 1)
+        return ranges
@@ -3,6 +3,7 @@ import requests
 from risesdk.api.accounts import AccountsAPI
 from risesdk.api.blocks import BlocksAPI
 from risesdk.api.delegates import DelegatesAPI
+from risesdk.api.head import ChainHead
 from risesdk.api.transactions import TransactionsAPI
 
 
@@ -10,6 +11,7 @@ class Client(object):
     accounts: AccountsAPI
     blocks: BlocksAPI
     delegates: DelegatesAPI
+    head: ChainHead
     transactions: TransactionsAPI
 
     def __init__(
@@ -21,3 +23,4 @@ class Client(object):
         self.blocks = BlocksAPI(base_url, session)
         self.delegates = DelegatesAPI(base_url, session)
         self.transactions = TransactionsAPI(base_url, session)
+        self.head = ChainHead(self.blocks)
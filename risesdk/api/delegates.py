@@ -54,7 +54,7 @@ class DelegateInfo(object):
         if 'register_timestamp' in raw:
             self.registration_time = Timestamp(raw['register_timestamp'])
         else:
-            self.register_timestamp = None
+            self.registration_time = None
 
 
 class DelegatesResult(object):
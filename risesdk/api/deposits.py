@@ -0,0 +1,129 @@
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Iterable, List, NamedTuple, Union
+from risesdk.protocol import Address, Amount, SendTx
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.follower import BlockApplied, BlockEvent
+
+
+class Deposit(NamedTuple):
+    address: Address
+    sender: Address
+    amount: Amount
+    tx_id: str
+    height: int
+    block_id: str
+    confirmations: int
+
+
+class DepositSeen(NamedTuple):
+    deposit: Deposit
+
+
+class DepositConfirmed(NamedTuple):
+    deposit: Deposit
+
+
+class DepositReverted(NamedTuple):
+    deposit: Deposit
+
+
+DepositEvent = Union[DepositSeen, DepositConfirmed, DepositReverted]
+
+
+class DepositWatcher(object):
+    """
+    Detects incoming transfers to a large set of watched addresses.
+
+    The watched addresses are kept as a sorted array of their 64-bit numeric values (8 bytes
+    per address), and every SendTx recipient of a block is matched against it with a binary
+    search. The cost of processing a block depends on the number of transactions in it, not on
+    the number of watched addresses.
+
+    Feed the watcher with BlockFollower events. It reports a DepositSeen event when a deposit
+    is included in a block, DepositConfirmed once it has the required number of confirmations
+    and DepositReverted when a block with a deposit is reverted.
+    """
+    confirmations: int
+
+    def __init__(
+        self,
+        addresses: Iterable[Address] = (),
+        confirmations: int = 101,
+    ):
+        self.confirmations = confirmations
+        self._addresses = array('Q', sorted({self._key(a) for a in addresses}))
+        self._pending: Deque[Deposit] = deque()
+
+    @staticmethod
+    def _key(address: Address) -> int:
+        return int.from_bytes(Address(address).to_bytes(), byteorder='big')
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __contains__(self, address: Address) -> bool:
+        return self._contains_key(self._key(address))
+
+    def _contains_key(self, key: int) -> bool:
+        addresses = self._addresses
+        i = bisect_left(addresses, key)
+        return i < len(addresses) and addresses[i] == key
+
+    def watch(self, addresses: Iterable[Address]):
+        keys = {self._key(a) for a in addresses}
+        keys.update(self._addresses)
+        self._addresses = array('Q', sorted(keys))
+
+    @property
+    def pending(self) -> List[Deposit]:
+        """
+        Deposits that don't have the required number of confirmations yet.
+        """
+        return list(self._pending)
+
+    def _deposits(self, block: BlockInfo) -> List[Deposit]:
+        deposits = []
+        for info in block.transactions:
+            tx = info.tx
+            if not isinstance(tx, SendTx):
+                continue
+            if self._contains_key(self._key(tx.recipient)):
+                deposits.append(Deposit(
+                    address=tx.recipient,
+                    sender=tx.sender_public_key.derive_address(),
+                    amount=tx.amount,
+                    tx_id=info.tx_id,
+                    height=block.height,
+                    block_id=block.block_id,
+                    confirmations=1,
+                ))
+        return deposits
+
+    def apply(self, event: BlockEvent) -> List[DepositEvent]:
+        if isinstance(event, BlockApplied):
+            return self.apply_block(event.block)
+        return self.revert_block(event.block)
+
+    def apply_block(self, block: BlockInfo) -> List[DepositEvent]:
+        events: List[DepositEvent] = []
+        for deposit in self._deposits(block):
+            events.append(DepositSeen(deposit))
+            self._pending.append(deposit)
+
+        # Pending deposits are ordered by height, so only the oldest ones need to be checked
+        while self._pending:
+            deposit = self._pending[0]
+            confirmations = block.height - deposit.height + 1
+            if confirmations < self.confirmations:
+                break
+            self._pending.popleft()
+            events.append(DepositConfirmed(deposit._replace(confirmations=confirmations)))
+        return events
+
+    def revert_block(self, block: BlockInfo) -> List[DepositEvent]:
+        deposits = self._deposits(block)
+        reverted = {d.tx_id for d in deposits}
+        self._pending = deque(d for d in self._pending if d.tx_id not in reverted)
+        return [DepositReverted(d._replace(confirmations=0)) for d in deposits]
@@ -0,0 +1,262 @@
+import csv
+import itertools
+import json
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+from risesdk.protocol import Address
+from risesdk.protocol.primitives import RISE_EPOCH
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.transactions import TransactionInfo
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None  # type: ignore
+
+FORMATS = ('csv', 'jsonl', 'parquet')
+
+# Column name, kind ('str', 'int', 'amount' or 'timestamp') and value getter
+Column = Tuple[str, str, Callable[[Any], Any]]
+
+TRANSACTION_COLUMNS: List[Column] = [
+    ('id', 'str', lambda i: i.tx_id),
+    ('height', 'int', lambda i: i.height),
+    ('block_id', 'str', lambda i: i.block_id),
+    ('type', 'int', lambda i: i.tx._type_id()),
+    ('timestamp', 'timestamp', lambda i: i.tx.timestamp),
+    ('sender_id', 'str', lambda i: i.tx.sender_public_key.derive_address()),
+    ('sender_public_key', 'str', lambda i: i.tx.sender_public_key.hex()),
+    ('recipient_id', 'str', lambda i: i.tx._recipient or ''),
+    ('amount', 'amount', lambda i: i.tx._amount),
+    ('fee', 'amount', lambda i: i.tx.fee),
+]
+
+BLOCK_COLUMNS: List[Column] = [
+    ('id', 'str', lambda b: b.block_id),
+    ('height', 'int', lambda b: b.height),
+    ('timestamp', 'timestamp', lambda b: b.timestamp),
+    ('previous_block_id', 'str', lambda b: b.previous_block_id or ''),
+    ('generator_public_key', 'str', lambda b: b.generator_public_key.hex()),
+    ('number_of_transactions', 'int', lambda b: b.number_of_transactions),
+    ('total_amount', 'amount', lambda b: b.total_amount),
+    ('total_fee', 'amount', lambda b: b.total_fee),
+    ('reward', 'amount', lambda b: b.reward),
+]
+
+_UNIT_DIGITS = 8
+_EPOCH = np.datetime64(RISE_EPOCH, 's') if np is not None else None
+
+
+def _convert(columns: Sequence[Column], records: List[Any]) -> Dict[str, Any]:
+    """
+    Turn a batch of records into NumPy column arrays.
+
+    Amounts become int64 arrays of raws and timestamps datetime64 arrays.
+    """
+    arrays: Dict[str, Any] = {}
+    for (name, kind, getter) in columns:
+        values = [getter(r) for r in records]
+        if kind == 'str':
+            arrays[name] = np.array(values, dtype=object)
+        elif kind == 'timestamp':
+            arrays[name] = _EPOCH + np.array(values, dtype=np.int64).astype('timedelta64[s]')
+        else:
+            arrays[name] = np.array(values, dtype=np.int64)
+    return arrays
+
+
+def _unit_strings(raws: Any) -> Any:
+    """
+    Format an int64 array of raws as exact decimal unit values.
+    """
+    (whole, frac) = np.divmod(raws, 10 ** _UNIT_DIGITS)
+    return np.char.add(
+        np.char.add(whole.astype(str), '.'),
+        np.char.zfill(frac.astype(str), _UNIT_DIGITS),
+    )
+
+
+def _text_columns(columns: Sequence[Column], arrays: Dict[str, Any]) -> List[Any]:
+    text = []
+    for (name, kind, _) in columns:
+        values = arrays[name]
+        if kind == 'amount':
+            text.append(_unit_strings(values))
+        elif kind == 'timestamp':
+            text.append(np.char.add(np.datetime_as_string(values, unit='s'), 'Z'))
+        else:
+            text.append(values)
+    return [c.tolist() for c in text]
+
+
+class _CsvWriter(object):
+    def __init__(self, f: IO[str], columns: Sequence[Column]):
+        self._columns = columns
+        self._writer = csv.writer(f)
+        self._writer.writerow([name for (name, _, _) in columns])
+
+    def write(self, arrays: Dict[str, Any]):
+        self._writer.writerows(zip(*_text_columns(self._columns, arrays)))
+
+    def close(self):
+        pass
+
+
+class _JsonlWriter(object):
+    def __init__(self, f: IO[str], columns: Sequence[Column]):
+        self._f = f
+        self._columns = columns
+        self._names = [name for (name, _, _) in columns]
+
+    def write(self, arrays: Dict[str, Any]):
+        names = self._names
+        lines = (
+            json.dumps(dict(zip(names, row))) + '\n'
+            for row in zip(*_text_columns(self._columns, arrays))
+        )
+        self._f.writelines(lines)
+
+    def close(self):
+        pass
+
+
+class _ParquetWriter(object):
+    def __init__(self, path: str, columns: Sequence[Column]):
+        fields = []
+        for (name, kind, _) in columns:
+            if kind == 'str':
+                fields.append(pyarrow.field(name, pyarrow.string()))
+            elif kind == 'int':
+                fields.append(pyarrow.field(name, pyarrow.int64()))
+            elif kind == 'amount':
+                fields.append(pyarrow.field(name, pyarrow.decimal128(20, _UNIT_DIGITS)))
+            else:
+                fields.append(pyarrow.field(name, pyarrow.timestamp('s', tz='UTC')))
+        self._schema = pyarrow.schema(fields)
+        self._columns = columns
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write(self, arrays: Dict[str, Any]):
+        data = []
+        for ((name, kind, _), field) in zip(self._columns, self._schema):
+            values = arrays[name]
+            if kind == 'amount':
+                # Decimals are stored as 128-bit unscaled integers, which are exactly the raws
+                buf = np.empty((len(values), 2), dtype=np.int64)
+                buf[:, 0] = values
+                buf[:, 1] = values >> 63
+                data.append(pyarrow.Array.from_buffers(
+                    field.type, len(values), [None, pyarrow.py_buffer(buf.tobytes())]))
+            else:
+                data.append(pyarrow.array(values, type=field.type))
+        self._writer.write_table(pyarrow.Table.from_arrays(data, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def export(
+    records: Iterable[Any],
+    path: str,
+    columns: Sequence[Column],
+    format: Optional[str] = None,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Stream the records to a CSV, JSONL or Parquet file, batch_size records at a time.
+
+    The format is derived from the file extension unless given. Amounts are written as unit
+    values (exact decimals) and timestamps as UTC datetimes. Returns the number of rows.
+    """
+    if np is None:
+        raise ImportError('Exporting requires numpy')
+    if format is None:
+        format = path.rsplit('.', 1)[-1].lower()
+    if format not in FORMATS:
+        raise ValueError('Unsupported export format {}'.format(format))
+    if format == 'parquet' and pyarrow is None:
+        raise ImportError('Exporting to Parquet requires pyarrow')
+
+    f: Optional[IO[str]] = None
+    writer: Any
+    if format == 'parquet':
+        writer = _ParquetWriter(path, columns)
+    else:
+        f = open(path, 'w', newline='', encoding='utf8')
+        writer = _CsvWriter(f, columns) if format == 'csv' else _JsonlWriter(f, columns)
+
+    rows = 0
+    try:
+        it = iter(records)
+        while True:
+            batch = list(itertools.islice(it, batch_size))
+            if not batch:
+                break
+            writer.write(_convert(columns, batch))
+            rows += len(batch)
+    finally:
+        writer.close()
+        if f is not None:
+            f.close()
+    return rows
+
+
+def export_transactions(
+    records: Iterable[TransactionInfo],
+    path: str,
+    format: Optional[str] = None,
+    batch_size: int = 10000,
+) -> int:
+    return export(records, path, TRANSACTION_COLUMNS, format, batch_size)
+
+
+def export_blocks(
+    records: Iterable[BlockInfo],
+    path: str,
+    format: Optional[str] = None,
+    batch_size: int = 10000,
+) -> int:
+    return export(records, path, BLOCK_COLUMNS, format, batch_size)
+
+
+def iter_transactions(
+    client: Client,
+    addresses: Sequence[Address],
+    page_size: int = 1000,
+) -> Iterator[TransactionInfo]:
+    """
+    Stream the transactions sent or received by the addresses from the node, page by page.
+
+    The transactions are grouped by address and ordered by height. A transaction between two
+    of the addresses is only returned for the first of them.
+    """
+    positions: Dict[Address, int] = {}
+    for a in addresses:
+        positions.setdefault(Address(a), len(positions))
+    height = client.head.refresh().height
+    for (address, i) in positions.items():
+        offset = 0
+        while True:
+            r = client.transactions.get_transactions(
+                sender=address,
+                recipient=address,
+                and__to_height=height,
+                order_by='height:asc',
+                limit=page_size,
+                offset=offset,
+            )
+            for info in r.transactions:
+                tx = info.tx
+                sender = tx.sender_public_key.derive_address()
+                other = tx._recipient if sender == address else sender
+                if other is None or positions.get(other, i) >= i:
+                    yield info
+            offset += len(r.transactions)
+            if not r.transactions or offset >= r.count:
+                break
@@ -0,0 +1,62 @@
+from bisect import bisect_right
+from typing import List, Optional
+from risesdk.api.blocks import FeesInfo, FeesResult
+from risesdk.api.client import Client
+
+
+class FeeSchedule(object):
+    """
+    Caches the fee schedules of the chain by the height ranges they apply to.
+
+    Every result of BlocksAPI.get_fees covers a range of heights, so the schedules are kept
+    sorted by their starting height and looked up with a binary search. The node is only
+    queried for heights that aren't covered by any of the cached schedules.
+
+    The current schedule is open-ended (it has no to_height) until a new milestone starts, so
+    it's only trusted as long as the milestone reported by the chain head of the client stays
+    the same.
+    """
+
+    def __init__(self, client: Client):
+        self._client = client
+        self._starts: List[int] = []
+        self._schedules: List[FeesResult] = []
+        self._milestone: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._schedules)
+
+    def get_fees(self, height: Optional[int] = None) -> FeesResult:
+        """
+        Return the fee schedule that applies at the height (the current one by default).
+        """
+        if height is None:
+            height = self._client.head.height
+        i = bisect_right(self._starts, height) - 1
+        if i >= 0:
+            schedule = self._schedules[i]
+            if schedule.to_height is not None:
+                if height <= schedule.to_height:
+                    return schedule
+            elif self._client.head.status().milestone == self._milestone:
+                return schedule
+            else:
+                # A new milestone has started, so the open-ended schedule has ended
+                del self._starts[i]
+                del self._schedules[i]
+        return self._fetch(height)
+
+    def fees_at(self, height: Optional[int] = None) -> FeesInfo:
+        return self.get_fees(height).fees
+
+    def _fetch(self, height: int) -> FeesResult:
+        schedule = self._client.blocks.get_fees(height)
+        if schedule.to_height is None:
+            self._milestone = self._client.head.status().milestone
+        i = bisect_right(self._starts, schedule.from_height)
+        if i > 0 and self._starts[i - 1] == schedule.from_height:
+            self._schedules[i - 1] = schedule
+        else:
+            self._starts.insert(i, schedule.from_height)
+            self._schedules.insert(i, schedule)
+        return schedule
@@ -0,0 +1,198 @@
+from collections import deque
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional, Union
+from risesdk.protocol import BlockVerification, verify_blocks
+from risesdk.api.base import APIError
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+
+
+class BlockVerificationError(APIError):
+    verification: BlockVerification
+
+    def __init__(self, verification: BlockVerification):
+        super().__init__('Block {} failed verification'.format(verification.block_id))
+        self.verification = verification
+
+
+class BlockApplied(NamedTuple):
+    block: BlockInfo
+
+
+class BlockReverted(NamedTuple):
+    block: BlockInfo
+
+
+BlockEvent = Union[BlockApplied, BlockReverted]
+
+
+class BlockFollower(object):
+    """
+    Follows the chain of a node and emits each new block exactly once, in height order.
+
+    When the node switches to a different fork, the follower emits BlockReverted events for
+    the blocks that are no longer part of the chain (newest first) back to the common
+    ancestor, after which it continues with BlockApplied events for the new fork.
+
+    The follower can be resumed from the last block the consumer processed (from_block_id)
+    or from the first height that the consumer wants to receive (from_height). Without
+    either, only blocks forged after the follower was created are emitted.
+
+    With verify=True, the id, payload and generator signature of every fetched batch of blocks
+    are checked with verify_blocks() before any of them is emitted, and a block that doesn't
+    match raises BlockVerificationError.
+
+    For example:
+
+        follower = BlockFollower(client, from_height=1)
+        for event in follower:
+            if isinstance(event, BlockApplied):
+                ...
+    """
+    poll_interval: float
+    batch_size: int
+    verify: bool
+
+    def __init__(
+        self,
+        client: Client,
+        from_height: Optional[int] = None,
+        from_block_id: Optional[str] = None,
+        poll_interval: float = 5.0,
+        batch_size: int = 100,
+        max_rollback: int = 101,
+        verify: bool = False,
+    ):
+        if from_height is not None and from_block_id is not None:
+            raise ValueError('Only one of from_height and from_block_id can be specified')
+        self._client = client
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.verify = verify
+        self._emitted: Deque[BlockInfo] = deque(maxlen=max_rollback)
+        self._next_height: Optional[int] = from_height
+
+        if from_block_id is not None:
+            block = client.blocks.get_block(from_block_id)
+            if block is None:
+                raise APIError('Block {} not found'.format(from_block_id))
+            self._emitted.append(block)
+            self._next_height = block.height + 1
+
+    @property
+    def last_block(self) -> Optional[BlockInfo]:
+        """
+        The last block that was emitted by the follower.
+        """
+        if self._emitted:
+            return self._emitted[-1]
+        return None
+
+    def __iter__(self) -> Iterator[BlockEvent]:
+        yield from self.poll()
+        while True:
+            # Sleep until the shared chain head sees the next block. Forks that replace blocks
+            # without growing the chain are picked up by the regular poll after poll_interval.
+            try:
+                status = self._client.head.wait_for_height(
+                    self._next_height or 0, timeout=self.poll_interval)
+                events = self._poll(status.height)
+            except TimeoutError:
+                events = self.poll()
+            yield from events
+
+    def poll(self) -> List[BlockEvent]:
+        """
+        Query the node once and return the events since the previous poll.
+        """
+        return self._poll(self._client.head.refresh().height)
+
+    def _poll(self, height: int) -> List[BlockEvent]:
+        if self._next_height is None:
+            self._next_height = height + 1
+
+        events: List[BlockEvent] = []
+        last = self.last_block
+        if last is not None and height < last.height:
+            # The node is behind us, which can only happen after it switched forks
+            events += self._rollback()
+
+        while self._next_height <= height:
+            blocks = self._fetch(self._next_height, height - self._next_height + 1)
+            if not blocks:
+                if not self._emitted:
+                    break
+                reverted = self._rollback()
+                if not reverted:
+                    # The node still has our last block, but doesn't serve the blocks up to
+                    # the height of its status yet (e.g. while syncing); retry on next poll
+                    break
+                events += reverted
+                continue
+            for block in blocks:
+                last = self.last_block
+                if last is not None and block.previous_block_id != last.block_id:
+                    events += self._rollback()
+                    break
+                self._emitted.append(block)
+                self._next_height = block.height + 1
+                events.append(BlockApplied(block))
+        return events
+
+    def _fetch(self, from_height: int, count: int) -> List[BlockInfo]:
+        blocks = self._fetch_blocks(from_height, count)
+        if self.verify and blocks:
+            verified = verify_blocks(
+                (b.block_id, b.to_header(), [t.tx for t in b.transactions]) for b in blocks)
+            for v in verified:
+                if not v.valid:
+                    raise BlockVerificationError(v)
+        return blocks
+
+    def _fetch_blocks(self, from_height: int, count: int) -> List[BlockInfo]:
+        last = self.last_block
+        if count == 1 and last is not None:
+            # Cheapest way to get the direct descendant of the last emitted block
+            blocks = self._client.blocks.get_blocks(previous_block_id=last.block_id).blocks
+            if blocks:
+                return blocks
+
+        return self._client.blocks.get_blocks(
+            offset=from_height - 1,
+            limit=min(count, self.batch_size),
+            order_by='height:asc',
+        ).blocks
+
+    def _rollback(self) -> List[BlockEvent]:
+        if not self._emitted:
+            return []
+
+        # Fetch the ids of the node's blocks for the heights we remember in as few requests
+        # as possible and walk back until we find a block that both chains share.
+        first_height = self._emitted[0].height
+        node_ids: Dict[int, str] = {}
+        offset = first_height - 1
+        while offset < self._emitted[-1].height:
+            blocks = self._client.blocks.get_blocks(
+                offset=offset,
+                limit=self.batch_size,
+                order_by='height:asc',
+            ).blocks
+            if not blocks:
+                break
+            for b in blocks:
+                node_ids[b.height] = b.block_id
+            offset = blocks[-1].height
+
+        events: List[BlockEvent] = []
+        while self._emitted:
+            block = self._emitted[-1]
+            if node_ids.get(block.height) == block.block_id:
+                break
+            self._emitted.pop()
+            events.append(BlockReverted(block))
+
+        if not self._emitted:
+            raise APIError('Unable to find common ancestor, fork is deeper than {} blocks'.format(
+                self._emitted.maxlen))
+        self._next_height = self._emitted[-1].height + 1
+        return events
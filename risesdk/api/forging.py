@@ -0,0 +1,129 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from risesdk.protocol import PublicKey, Timestamp
+from risesdk.protocol.slots import (
+    ACTIVE_DELEGATES,
+    generate_delegate_list,
+    round_of,
+    slot_delegate,
+    slot_number,
+    slot_time,
+)
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.follower import BlockApplied, BlockEvent
+from risesdk.api.registry import DelegateRegistry
+
+
+class MissedSlot(NamedTuple):
+    slot: int
+    timestamp: Timestamp
+    public_key: PublicKey
+    # Height of the block that should have been forged in the slot
+    height: int
+
+
+class ForgingSchedule(object):
+    """
+    Predicts which delegate forges each slot and detects missed slots as they happen.
+
+    The forging order of a round is computed locally from the active delegates (as ranked by a
+    DelegateRegistry, refreshed once per round) with the same shuffle as the node. Knowing the
+    order, the schedule only needs the new blocks of the chain, for example from a
+    BlockFollower: every slot between two consecutive blocks was missed by its delegate.
+
+    check() reports the slots that have ended since the last block without waiting for the
+    next block, grace seconds after the end of the slot.
+    """
+    grace: float
+
+    def __init__(
+        self,
+        client: Client,
+        registry: Optional[DelegateRegistry] = None,
+        grace: float = 5.0,
+    ):
+        self._client = client
+        self._registry = registry or DelegateRegistry(client)
+        self.grace = grace
+        self._lists: Dict[int, List[PublicKey]] = {}
+        self._last_block: Optional[BlockInfo] = None
+        # Slots up to this one have been checked
+        self._checked_slot: Optional[int] = None
+
+    def delegate_list(self, round_number: int) -> List[PublicKey]:
+        """
+        Return the forging order of the round.
+
+        The order is based on the delegate ranks at the time it's first computed, so it's only
+        accurate for the current and the next round.
+        """
+        delegates = self._lists.get(round_number)
+        if delegates is None:
+            self._registry.refresh()
+            active = [d.public_key for d in self._registry.top(ACTIVE_DELEGATES)]
+            delegates = generate_delegate_list(round_number, active)
+            self._lists[round_number] = delegates
+            for old in [r for r in self._lists if r < round_number - 1]:
+                del self._lists[old]
+        return delegates
+
+    def forger_at(self, slot: int, height: int) -> PublicKey:
+        """
+        Return the delegate that may forge the block at the height in the slot.
+        """
+        return slot_delegate(slot, self.delegate_list(round_of(height)))
+
+    def upcoming(
+        self,
+        count: int = 10,
+        now: Optional[Timestamp] = None,
+    ) -> List[Tuple[int, Timestamp, PublicKey]]:
+        """
+        Predict the delegates of the next slots as (slot, timestamp, public key) tuples.
+
+        The prediction assumes that a block is forged in every slot from now on.
+        """
+        if now is None:
+            now = Timestamp.now()
+        height = self._client.head.height + 1
+        first = slot_number(now) + 1
+        return [
+            (slot, slot_time(slot), self.forger_at(slot, height + i))
+            for (i, slot) in enumerate(range(first, first + count))
+        ]
+
+    def apply(self, event: BlockEvent) -> List[MissedSlot]:
+        if isinstance(event, BlockApplied):
+            return self.apply_block(event.block)
+        return []
+
+    def apply_block(self, block: BlockInfo) -> List[MissedSlot]:
+        """
+        Process a new block, returning the slots that were missed before it.
+        """
+        slot = slot_number(block.timestamp)
+        missed = self._missed(slot - 1, block.height)
+        self._last_block = block
+        self._checked_slot = slot
+        return missed
+
+    def check(self, now: Optional[Timestamp] = None) -> List[MissedSlot]:
+        """
+        Return the slots since the last block that have ended without a block.
+        """
+        if self._last_block is None:
+            return []
+        if now is None:
+            now = Timestamp.now()
+        last_ended = slot_number(Timestamp(max(0, int(now - self.grace)))) - 1
+        return self._missed(last_ended, self._last_block.height + 1)
+
+    def _missed(self, to_slot: int, height: int) -> List[MissedSlot]:
+        if self._checked_slot is None:
+            return []
+        missed = [
+            MissedSlot(slot, slot_time(slot), self.forger_at(slot, height), height)
+            for slot in range(self._checked_slot + 1, to_slot + 1)
+        ]
+        self._checked_slot = max(self._checked_slot, to_slot)
+        return missed
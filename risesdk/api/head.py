@@ -0,0 +1,120 @@
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from risesdk.protocol.primitives import RISE_EPOCH, Timestamp
+from risesdk.protocol.slots import slot_number, slot_time
+from risesdk.api.blocks import BlocksAPI, StatusResult
+
+
+class ChainHead(object):
+    """
+    Shared, cached view of the head of the chain (the result of BlocksAPI.get_status).
+
+    Blocks are only forged at the start of a slot, so the status of the node can only change
+    shortly after a slot boundary. The cached status is served to any number of readers until
+    the next slot starts (plus propagation_delay seconds for the block to reach the node), and
+    only then refreshed. When the refresh doesn't see a new block (a missed slot or a late
+    block), it's retried after retry_interval seconds, doubling the interval up to the next
+    slot. Concurrent readers share a single request to the node.
+
+    Threads can block in wait_for_height() until the node reaches a height; the waiters sleep
+    until the next scheduled refresh instead of polling.
+    """
+    propagation_delay: float
+    retry_interval: float
+
+    def __init__(
+        self,
+        blocks: BlocksAPI,
+        propagation_delay: float = 2.0,
+        retry_interval: float = 2.0,
+    ):
+        self._blocks = blocks
+        self.propagation_delay = propagation_delay
+        self.retry_interval = retry_interval
+        self._cond = threading.Condition()
+        self._status: Optional[StatusResult] = None
+        self._next_refresh = 0.0
+        self._misses = 0
+        self._refreshing = False
+
+    @staticmethod
+    def _now() -> float:
+        """
+        Seconds since the RISE epoch, with the same clock as Timestamp.now().
+        """
+        return (datetime.utcnow() - RISE_EPOCH).total_seconds()
+
+    @property
+    def height(self) -> int:
+        return self.status().height
+
+    def status(self) -> StatusResult:
+        """
+        Return the status of the node, refreshing it only when a new block can be expected.
+        """
+        with self._cond:
+            while True:
+                if self._refreshing:
+                    self._cond.wait()
+                elif self._status is None or self._now() >= self._next_refresh:
+                    return self._refresh_locked()
+                else:
+                    return self._status
+
+    def refresh(self) -> StatusResult:
+        """
+        Fetch the status from the node now, regardless of the schedule.
+        """
+        with self._cond:
+            while self._refreshing:
+                self._cond.wait()
+            return self._refresh_locked()
+
+    def wait_for_height(self, height: int, timeout: Optional[float] = None) -> StatusResult:
+        """
+        Block until the node reaches the height, returning its status.
+
+        Raises TimeoutError if the height isn't reached within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                status = self._status
+                if status is not None and status.height >= height:
+                    return status
+                wait: Optional[float] = None
+                if not self._refreshing:
+                    wait = self._next_refresh - self._now()
+                    if status is None or wait <= 0:
+                        self._refresh_locked()
+                        continue
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError('Timed out waiting for height {}'.format(height))
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+
+    def _refresh_locked(self) -> StatusResult:
+        # The request is made without holding the lock, other threads wait for the result
+        self._refreshing = True
+        self._cond.release()
+        try:
+            status = self._blocks.get_status()
+        finally:
+            self._cond.acquire()
+            self._refreshing = False
+            self._cond.notify_all()
+
+        now = self._now()
+        next_slot = slot_time(slot_number(Timestamp(int(now))) + 1) + self.propagation_delay
+        if self._status is None or status.height > self._status.height:
+            self._misses = 0
+            self._next_refresh = next_slot
+        else:
+            self._next_refresh = min(next_slot, now + self.retry_interval * 2 ** self._misses)
+            self._misses += 1
+        self._status = status
+        return status
@@ -0,0 +1,201 @@
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from risesdk.protocol import Address, PublicKey, Timestamp
+from risesdk.api.base import APIError
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.follower import BlockApplied, BlockEvent
+from risesdk.api.ledger import block_balance_deltas, transaction_balance_deltas
+
+# Most blocks the node returns per request
+_BLOCKS_PAGE = 100
+
+
+class _AccountHistory(object):
+    __slots__ = ('heights', 'timestamps', 'balances', 'height')
+
+    def __init__(self, height: int):
+        # Heights at which the balance changed, with the balance after each change
+        self.heights: List[int] = []
+        self.timestamps: List[int] = []
+        self.balances: List[int] = []
+        self.height = height
+
+    def add(self, height: int, timestamp: int, delta: int):
+        if self.timestamps:
+            # Keep the timestamps sorted for bisecting, even if the node reports a block
+            # timestamp that is earlier than the one of its parent
+            timestamp = max(timestamp, self.timestamps[-1])
+        if self.heights and self.heights[-1] == height:
+            self.balances[-1] += delta
+            self.timestamps[-1] = timestamp
+        else:
+            prev = self.balances[-1] if self.balances else 0
+            self.heights.append(height)
+            self.timestamps.append(timestamp)
+            self.balances.append(prev + delta)
+
+    def revert(self, height: int):
+        while self.heights and self.heights[-1] >= height:
+            self.heights.pop()
+            self.timestamps.pop()
+            self.balances.pop()
+        self.height = height - 1
+
+
+class BalanceHistory(object):
+    """
+    Answers balance queries for accounts at any past height (or timestamp).
+
+    For every loaded account, the balance changes of its full history (sent and received
+    transactions, fees and forging rewards) are stored as running balances per height, so
+    balance_at() is a binary search. The histories are kept up to date by applying new blocks,
+    for example from a BlockFollower.
+
+    Balance changes are placed in time by the timestamp of their block, both when loading and
+    when applying blocks. Loading fetches the blocks of the heights with a balance change in
+    pages of 100 blocks, with up to workers concurrent requests, and caches their timestamps. The balances are plain integers, as a partial history (for example of
+    an account funded in the genesis block) can have negative intermediate balances.
+    """
+
+    workers: int
+
+    def __init__(self, client: Client, page_size: int = 1000, workers: int = 4):
+        self._client = client
+        self._page_size = page_size
+        self.workers = workers
+        self._accounts: Dict[Address, _AccountHistory] = {}
+        self._block_times: Dict[int, int] = {}
+
+    def __contains__(self, address: Address) -> bool:
+        return address in self._accounts
+
+    def load(self, address: Address, public_key: Optional[PublicKey] = None):
+        """
+        Fetch the full history of the account from the node.
+
+        The public key is needed to find the forged blocks of delegates, it's looked up from
+        the node when not provided.
+        """
+        address = Address(address)
+        height = self._client.blocks.get_status().height
+        if public_key is None:
+            account = self._client.accounts.get_account(address)
+            if account is not None:
+                public_key = account.public_key
+
+        deltas: List[Tuple[int, int]] = []
+        offset = 0
+        while True:
+            r = self._client.transactions.get_transactions(
+                sender=address,
+                recipient=address,
+                and__to_height=height,
+                order_by='height:asc',
+                limit=self._page_size,
+                offset=offset,
+            )
+            for info in r.transactions:
+                for (delta_address, delta) in transaction_balance_deltas(info.tx):
+                    if delta_address == address:
+                        deltas.append((info.height, delta))
+            offset += len(r.transactions)
+            if not r.transactions or offset >= r.count:
+                break
+
+        if public_key is not None:
+            offset = 0
+            while True:
+                blocks = self._client.blocks.get_blocks(
+                    generator_public_key=public_key,
+                    order_by='height:asc',
+                    limit=_BLOCKS_PAGE,
+                    offset=offset,
+                ).blocks
+                for block in blocks:
+                    if block.height <= height:
+                        self._block_times[block.height] = int(block.timestamp)
+                        deltas.append((block.height, block.reward + block.total_fee))
+                offset += len(blocks)
+                if len(blocks) < _BLOCKS_PAGE:
+                    break
+
+        self._load_block_times(h for (h, _) in deltas)
+        history = _AccountHistory(height)
+        for (delta_height, delta) in sorted(deltas, key=lambda d: d[0]):
+            history.add(delta_height, self._block_time(delta_height), delta)
+        self._accounts[address] = history
+
+    def _load_block_times(self, heights: Iterable[int]):
+        # Every page covers the 100 blocks from the lowest height that isn't covered yet, so
+        # nearby heights share a request and distant ones don't fetch the blocks in between
+        starts: List[int] = []
+        for height in sorted(set(heights) - self._block_times.keys()):
+            if not starts or height >= starts[-1] + _BLOCKS_PAGE:
+                starts.append(height)
+        if not starts:
+            return
+
+        def fetch(start: int) -> List[BlockInfo]:
+            return self._client.blocks.get_blocks(
+                offset=start - 1,
+                limit=_BLOCKS_PAGE,
+                order_by='height:asc',
+            ).blocks
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for blocks in executor.map(fetch, starts):
+                for block in blocks:
+                    self._block_times[block.height] = int(block.timestamp)
+
+    def _block_time(self, height: int) -> int:
+        timestamp = self._block_times.get(height)
+        if timestamp is None:
+            raise APIError('Block at height {} not found'.format(height))
+        return timestamp
+
+    def unload(self, address: Address):
+        self._accounts.pop(address, None)
+
+    def balance_at(self, address: Address, height: int) -> int:
+        """
+        Return the balance of the account after the block at the height.
+        """
+        history = self._accounts[address]
+        i = bisect_right(history.heights, height)
+        return history.balances[i - 1] if i else 0
+
+    def balance_at_time(self, address: Address, timestamp: Timestamp) -> int:
+        """
+        Return the balance of the account after the last block forged at or before the time.
+        """
+        history = self._accounts[address]
+        i = bisect_right(history.timestamps, int(timestamp))
+        return history.balances[i - 1] if i else 0
+
+    def changes(self, address: Address) -> List[Tuple[int, int]]:
+        """
+        Return the (height, balance) pairs of all balance changes of the account.
+        """
+        history = self._accounts[address]
+        return list(zip(history.heights, history.balances))
+
+    def apply(self, event: BlockEvent):
+        if isinstance(event, BlockApplied):
+            self.apply_block(event.block)
+        else:
+            self.revert_block(event.block)
+
+    def apply_block(self, block: BlockInfo):
+        for (address, delta, _) in block_balance_deltas(block):
+            history = self._accounts.get(address)
+            # Blocks up to the load height are already part of the history
+            if history is not None and block.height > history.height:
+                history.add(block.height, int(block.timestamp), delta)
+        for history in self._accounts.values():
+            history.height = max(history.height, block.height)
+
+    def revert_block(self, block: BlockInfo):
+        for history in self._accounts.values():
+            if block.height <= history.height:
+                history.revert(block.height)
@@ -0,0 +1,253 @@
+import os
+import struct
+import threading
+import zlib
+from enum import IntEnum
+from typing import Dict, Iterator, List, NamedTuple, Optional
+from risesdk.protocol import Amount, BaseTx
+
+# length, crc32 of the body
+_HEADER = struct.Struct('<II')
+# state, tx_id
+_STATE = struct.Struct('<BQ')
+# flags, fee (followed by the transaction bytes)
+_TX = struct.Struct('<BQ')
+
+
+def _fsync_dir(path: str):
+    # Make a rename durable; directories can't be opened on Windows
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class JournalState(IntEnum):
+    SIGNED = 1
+    SUBMITTED = 2
+    ACCEPTED = 3
+    REJECTED = 4
+    CONFIRMED = 5
+
+
+# States after which the transaction needs no further work
+_FINAL_STATES = (JournalState.REJECTED, JournalState.CONFIRMED)
+
+
+class JournalEntry(NamedTuple):
+    tx_id: str
+    state: JournalState
+    tx: BaseTx
+
+
+class TransactionJournal(object):
+    """
+    Write-ahead journal of outgoing transactions and their submission state.
+
+    Every record is length-prefixed and checksummed: the first record of a transaction stores
+    its state along with the BaseTx.to_bytes() form (plus the fee and the flags needed to
+    parse it back), later records only the new state. Appends are buffered and made durable
+    by commit(); concurrent committers are grouped so that a single write and fsync covers
+    all of the records appended until then. When a commit fails, the part of the records that
+    reached the file is truncated and they are written again by the next commit.
+
+    On open, the journal is replayed to rebuild the set of in-flight transactions (those that
+    are neither rejected nor confirmed). A partially written record at the end of the file,
+    left by a crash, is truncated. compact() rewrites the journal with only the in-flight
+    transactions.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._committed = threading.Condition(self._lock)
+        self._buffer = bytearray()
+        self._appended = 0
+        self._durable = 0
+        self._committing = False
+        # Size of the durable part of the file, and the error that left the file in an unknown
+        # state, after which the journal refuses to write
+        self._size = 0
+        self._failed: Optional[OSError] = None
+        self._states: Dict[str, JournalState] = {}
+        self._txs: Dict[str, BaseTx] = {}
+        self._size = self._replay()
+        # Unbuffered, so that a failed write can't leave records behind in a buffer
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b', buffering=0)
+        self._file.truncate(self._size)
+        self._file.seek(self._size)
+
+    def _replay(self) -> int:
+        if not os.path.exists(self._path):
+            return 0
+        with open(self._path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset + _HEADER.size <= len(data):
+            (length, crc) = _HEADER.unpack_from(data, offset)
+            body = data[offset + _HEADER.size:offset + _HEADER.size + length]
+            if len(body) < length or length < _STATE.size or zlib.crc32(body) != crc:
+                break
+            (state, tx_id) = _STATE.unpack_from(body)
+            self._apply(str(tx_id), JournalState(state), body[_STATE.size:])
+            offset += _HEADER.size + length
+        return offset
+
+    def _apply(self, tx_id: str, state: JournalState, payload: bytes):
+        if payload:
+            (flags, fee) = _TX.unpack_from(payload)
+            self._txs[tx_id] = BaseTx.from_bytes_with_flags(payload[_TX.size:], Amount(fee), flags)
+        self._states[tx_id] = state
+        if state in _FINAL_STATES:
+            self._txs.pop(tx_id, None)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, tx_id: str) -> bool:
+        return tx_id in self._states
+
+    def state(self, tx_id: str) -> Optional[JournalState]:
+        return self._states.get(tx_id)
+
+    def in_flight(self, *states: JournalState) -> Iterator[JournalEntry]:
+        """
+        Iterate over the transactions that are neither rejected nor confirmed.
+
+        When states are given, only the transactions in one of those states are returned.
+        """
+        for (tx_id, tx) in list(self._txs.items()):
+            state = self._states[tx_id]
+            if not states or state in states:
+                yield JournalEntry(tx_id, state, tx)
+
+    def to_submit(self) -> List[BaseTx]:
+        """
+        Transactions that were signed, but possibly not submitted to the node.
+        """
+        return [e.tx for e in self.in_flight(JournalState.SIGNED, JournalState.SUBMITTED)]
+
+    def to_track(self) -> List[str]:
+        """
+        Ids of the transactions that were accepted by the node, but not yet confirmed.
+        """
+        return [e.tx_id for e in self.in_flight(JournalState.ACCEPTED)]
+
+    def add(self, tx: BaseTx, state: JournalState = JournalState.SIGNED) -> int:
+        """
+        Record a new transaction, returning the sequence number to pass to commit().
+        """
+        tx_id = tx.derive_id()
+        payload = _TX.pack(tx.bytes_flags(), int(tx.fee)) + tx.to_bytes()
+        return self._append(tx_id, state, payload, tx)
+
+    def update(self, tx_id: str, state: JournalState) -> int:
+        """
+        Record a state change of a transaction, returning the sequence number for commit().
+        """
+        if tx_id not in self._states:
+            raise KeyError(tx_id)
+        return self._append(tx_id, state, b'', None)
+
+    def _append(self, tx_id: str, state: JournalState, payload: bytes, tx: Optional[BaseTx]) -> int:
+        body = _STATE.pack(state, int(tx_id)) + payload
+        with self._lock:
+            self._check_failed()
+            self._buffer += _HEADER.pack(len(body), zlib.crc32(body))
+            self._buffer += body
+            if tx is not None:
+                self._txs[tx_id] = tx
+            self._states[tx_id] = state
+            if state in _FINAL_STATES:
+                self._txs.pop(tx_id, None)
+            self._appended += 1
+            return self._appended
+
+    def commit(self, sequence: Optional[int] = None):
+        """
+        Make the records appended so far (or up to the sequence number) durable.
+
+        When another thread is already writing, this waits for it and then writes everything
+        that was appended in the meantime with a single fsync.
+        """
+        with self._lock:
+            if sequence is None:
+                sequence = self._appended
+            while self._durable < sequence:
+                if self._committing:
+                    self._committed.wait()
+                    continue
+                self._check_failed()
+                self._committing = True
+                (data, self._buffer) = (bytes(self._buffer), bytearray())
+                target = self._appended
+                self._lock.release()
+                written = False
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[self._file.write(view):]
+                    os.fsync(self._file.fileno())
+                    written = True
+                finally:
+                    if not written:
+                        self._discard_write()
+                    self._lock.acquire()
+                    self._committing = False
+                    if written:
+                        self._durable = target
+                        self._size += len(data)
+                    else:
+                        self._buffer[:0] = data
+                    self._committed.notify_all()
+
+    def _discard_write(self):
+        # Part of the records may have reached the file; cut them off so that the next commit
+        # doesn't write them again after a torn record, which would hide everything after it
+        try:
+            self._file.truncate(self._size)
+            self._file.seek(self._size)
+        except OSError as err:
+            self._failed = err
+
+    def _check_failed(self):
+        if self._failed is not None:
+            raise OSError('Journal {} is unusable after a failed write: {}'.format(
+                self._path, self._failed))
+
+    def compact(self):
+        """
+        Rewrite the journal with only the in-flight transactions.
+        """
+        self.commit()
+        with self._lock:
+            # Another thread may still be writing to the file outside of the lock
+            while self._committing:
+                self._committed.wait()
+            tmp_path = self._path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                for (tx_id, tx) in self._txs.items():
+                    payload = _TX.pack(tx.bytes_flags(), int(tx.fee)) + tx.to_bytes()
+                    body = _STATE.pack(self._states[tx_id], int(tx_id)) + payload
+                    f.write(_HEADER.pack(len(body), zlib.crc32(body)))
+                    f.write(body)
+                f.flush()
+                os.fsync(f.fileno())
+            self._file.close()
+            os.replace(tmp_path, self._path)
+            _fsync_dir(os.path.dirname(os.path.abspath(self._path)))
+            self._file = open(self._path, 'r+b', buffering=0)
+            self._size = self._file.seek(0, os.SEEK_END)
+            self._states = {tx_id: self._states[tx_id] for tx_id in self._txs}
+            # The rewritten file includes the records that were still buffered
+            self._buffer = bytearray()
+            self._durable = self._appended
+            self._committed.notify_all()
+
+    def close(self):
+        self.commit()
+        self._file.close()
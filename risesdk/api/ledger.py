@@ -0,0 +1,166 @@
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from risesdk.protocol import Address, Amount, BaseTx
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.follower import BlockApplied, BlockEvent
+
+
+class BalanceChange(NamedTuple):
+    address: Address
+    delta: int
+    balance: int
+    height: int
+    block_id: str
+    tx_id: Optional[str]
+
+
+def transaction_balance_deltas(tx: BaseTx) -> List[Tuple[Address, int]]:
+    """
+    Compute the balance changes caused by the transaction as (address, delta) tuples.
+
+    The sender pays the amount and the fee of the transaction, the recipient receives the amount.
+    """
+    amount = tx._amount
+    deltas = [(tx.sender_public_key.derive_address(), -(amount + tx.fee))]
+    if tx._recipient and amount:
+        deltas.append((tx._recipient, amount))
+    return deltas
+
+
+def block_balance_deltas(block: BlockInfo) -> List[Tuple[Address, int, Optional[str]]]:
+    """
+    Compute the balance changes caused by the block as (address, delta, tx_id) tuples.
+
+    In addition to the changes of the transactions, the generator of the block is credited with
+    the block reward and the fees of the block (tx_id is None for that change). The node
+    distributes the fees between the delegates of a round at the end of the round, so
+    intra-round balances of delegates can differ slightly.
+    """
+    deltas: List[Tuple[Address, int, Optional[str]]] = []
+    for info in block.transactions:
+        for (address, delta) in transaction_balance_deltas(info.tx):
+            deltas.append((address, delta, info.tx_id))
+    forged = block.reward + block.total_fee
+    if forged:
+        deltas.append((block.generator_public_key.derive_address(), forged, None))
+    return deltas
+
+
+class BalanceLedger(object):
+    """
+    Keeps track of the balances of a set of watched addresses from the blocks of the chain.
+
+    The ledger is seeded with the balances reported by the node (see load()) and then updated
+    from confirmed blocks, for example from the events of a BlockFollower. Reverted blocks are
+    undone. Every change of a watched balance is reported as a BalanceChange to the on_change
+    callback (and returned by apply()).
+
+    With reconcile_every set, the balances are compared with AccountsAPI.get_account every so
+    many blocks and corrected when they differ.
+    """
+    height: Optional[int]
+    reconcile_every: Optional[int]
+
+    def __init__(
+        self,
+        client: Client,
+        addresses: Iterable[Address] = (),
+        on_change: Optional[Callable[[BalanceChange], None]] = None,
+        reconcile_every: Optional[int] = None,
+    ):
+        self._client = client
+        self._balances: Dict[Address, int] = {Address(a): 0 for a in addresses}
+        self._on_change = on_change
+        self.reconcile_every = reconcile_every
+        self.height = None
+
+    def __contains__(self, address: Address) -> bool:
+        return address in self._balances
+
+    @property
+    def addresses(self) -> List[Address]:
+        return list(self._balances)
+
+    def balance(self, address: Address) -> Amount:
+        return Amount(self._balances[address])
+
+    def watch(self, address: Address, balance: Optional[Amount] = None):
+        """
+        Start watching an address, fetching its current balance unless provided.
+        """
+        address = Address(address)
+        if balance is None:
+            balance = self._fetch_balance(address)
+        self._balances[address] = balance
+
+    def unwatch(self, address: Address):
+        self._balances.pop(address, None)
+
+    def _fetch_balance(self, address: Address) -> Amount:
+        account = self._client.accounts.get_account(address)
+        return Amount(0) if account is None else account.balance
+
+    def load(self) -> int:
+        """
+        Fetch the current balances of all of the watched addresses from the node.
+
+        Returns the height the balances correspond to, the following blocks should be applied
+        to the ledger from there on.
+        """
+        self.height = self._client.blocks.get_status().height
+        for address in self._balances:
+            self._balances[address] = self._fetch_balance(address)
+        return self.height
+
+    def apply(self, event: BlockEvent) -> List[BalanceChange]:
+        if isinstance(event, BlockApplied):
+            return self.apply_block(event.block)
+        return self.revert_block(event.block)
+
+    def apply_block(self, block: BlockInfo) -> List[BalanceChange]:
+        changes = self._update(block, 1)
+        self.height = block.height
+        if self.reconcile_every and block.height % self.reconcile_every == 0:
+            self.reconcile()
+        return changes
+
+    def revert_block(self, block: BlockInfo) -> List[BalanceChange]:
+        changes = self._update(block, -1)
+        self.height = block.height - 1
+        return changes
+
+    def _update(self, block: BlockInfo, sign: int) -> List[BalanceChange]:
+        changes: List[BalanceChange] = []
+        balances = self._balances
+        for (address, delta, tx_id) in block_balance_deltas(block):
+            if address not in balances:
+                continue
+            balances[address] += sign * delta
+            changes.append(BalanceChange(
+                address=address,
+                delta=sign * delta,
+                balance=balances[address],
+                height=block.height,
+                block_id=block.block_id,
+                tx_id=tx_id,
+            ))
+        if self._on_change is not None:
+            for change in changes:
+                self._on_change(change)
+        return changes
+
+    def reconcile(self) -> Dict[Address, int]:
+        """
+        Compare the balances with the node and correct them, returning the differences found.
+
+        Nothing is compared when the node is at a different height than the ledger.
+        """
+        if self._client.blocks.get_status().height != self.height:
+            return {}
+        diffs: Dict[Address, int] = {}
+        for address in self._balances:
+            balance = self._fetch_balance(address)
+            if balance != self._balances[address]:
+                diffs[address] = balance - self._balances[address]
+                self._balances[address] = balance
+        return diffs
@@ -0,0 +1,121 @@
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from risesdk.api.client import Client
+from risesdk.api.transactions import PendingTransactionInfo, TransactionInfo
+
+
+class PendingAdded(NamedTuple):
+    info: PendingTransactionInfo
+    pool: str
+
+
+class PendingRemoved(NamedTuple):
+    tx_id: str
+
+
+class PendingConfirmed(NamedTuple):
+    info: TransactionInfo
+
+
+PendingEvent = Union[PendingAdded, PendingRemoved, PendingConfirmed]
+
+POOLS = ('unconfirmed', 'queued')
+
+
+class MempoolWatcher(object):
+    """
+    Watches the unconfirmed and queued transaction pools of a node.
+
+    Every poll first checks the transaction counts of the node and only fetches the pools when
+    they have changed. The pools are diffed by transaction id, and the transactions are only
+    parsed when the tx of a reported PendingTransactionInfo is accessed. Transactions that
+    left the pools are looked up once to tell apart the confirmed ones (PendingConfirmed)
+    from the dropped ones (PendingRemoved).
+
+    When iterated, the watcher polls on an adaptive schedule: the interval shrinks towards
+    min_interval while the pools are changing and grows towards max_interval when idle.
+    """
+    min_interval: float
+    max_interval: float
+    interval: float
+
+    def __init__(
+        self,
+        client: Client,
+        min_interval: float = 1.0,
+        max_interval: float = 10.0,
+        full_fetch_every: int = 30,
+    ):
+        self._client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._full_fetch_every = full_fetch_every
+        self._skipped = 0
+        self._counts: Optional[Tuple[int, int, int]] = None
+        self._pool: Dict[str, str] = {}
+        self._infos: Dict[str, PendingTransactionInfo] = {}
+
+    def __contains__(self, tx_id: str) -> bool:
+        return tx_id in self._pool
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def get(self, tx_id: str) -> Optional[PendingTransactionInfo]:
+        return self._infos.get(tx_id)
+
+    def pool_of(self, tx_id: str) -> Optional[str]:
+        return self._pool.get(tx_id)
+
+    def __iter__(self) -> Iterator[PendingEvent]:
+        while True:
+            yield from self.poll()
+            time.sleep(self.interval)
+
+    def _fetch_pool(self, pool: str) -> List[PendingTransactionInfo]:
+        if pool == 'queued':
+            return self._client.transactions.get_queued_transactions().transactions
+        return self._client.transactions.get_unconfirmed_transactions().transactions
+
+    def poll(self) -> List[PendingEvent]:
+        """
+        Query the node once and return the changes since the previous poll.
+        """
+        r = self._client.transactions.get_transaction_count()
+        counts = (r.confirmed, r.unconfirmed, r.queued)
+        if counts == self._counts and self._skipped < self._full_fetch_every:
+            self._skipped += 1
+            self.interval = min(self.max_interval, self.interval * 1.5)
+            return []
+        self._counts = counts
+        self._skipped = 0
+
+        events: List[PendingEvent] = []
+        pool: Dict[str, str] = {}
+        for name in POOLS:
+            for info in self._fetch_pool(name):
+                tx_id = info.tx_id
+                if tx_id in pool:
+                    continue
+                pool[tx_id] = name
+                if tx_id not in self._infos:
+                    self._infos[tx_id] = info
+                    events.append(PendingAdded(info, name))
+
+        for tx_id in self._pool:
+            if tx_id in pool:
+                continue
+            del self._infos[tx_id]
+            confirmed = self._client.transactions.get_transaction(tx_id)
+            if confirmed is not None:
+                events.append(PendingConfirmed(confirmed))
+            else:
+                events.append(PendingRemoved(tx_id))
+        self._pool = pool
+
+        if events:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+        return events
@@ -0,0 +1,272 @@
+import json
+import sqlite3
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+from risesdk.api.backfill import BlockBackfill, BackfillProgress
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.follower import BlockFollower, BlockApplied, BlockEvent
+from risesdk.api.transactions import TransactionInfo
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    id TEXT PRIMARY KEY,
+    height INTEGER NOT NULL UNIQUE,
+    previous_block_id TEXT,
+    timestamp INTEGER NOT NULL,
+    generator_public_key TEXT NOT NULL,
+    number_of_transactions INTEGER NOT NULL,
+    total_amount INTEGER NOT NULL,
+    total_fee INTEGER NOT NULL,
+    reward INTEGER NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    block_id TEXT NOT NULL,
+    height INTEGER NOT NULL,
+    type INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    sender_id TEXT NOT NULL,
+    sender_public_key TEXT NOT NULL,
+    recipient_id TEXT,
+    amount INTEGER NOT NULL,
+    fee INTEGER NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_block_id ON transactions (block_id);
+CREATE INDEX IF NOT EXISTS transactions_height ON transactions (height);
+CREATE INDEX IF NOT EXISTS transactions_type ON transactions (type);
+CREATE INDEX IF NOT EXISTS transactions_sender_id ON transactions (sender_id);
+CREATE INDEX IF NOT EXISTS transactions_recipient_id ON transactions (recipient_id);
+CREATE INDEX IF NOT EXISTS blocks_generator_public_key ON blocks (generator_public_key);
+"""
+
+
+class ChainMirror(object):
+    """
+    Local SQLite copy of the blocks and transactions of the chain.
+
+    The mirror is synced incrementally: sync() continues from the last stored block, uses
+    BlockBackfill to catch up on larger gaps and BlockFollower near the tip of the chain.
+    Blocks that the node has reverted are removed from the mirror.
+
+    The transactions table has indexes on sender, recipient, height, type and block id, and
+    the connection is available for ad-hoc queries. For example:
+
+        mirror = ChainMirror('chain.db', client)
+        mirror.sync()
+        mirror.connection.execute('SELECT SUM(amount) FROM transactions WHERE recipient_id = ?',
+                                  [str(address)])
+    """
+    connection: sqlite3.Connection
+    commit_every: int
+
+    def __init__(
+        self,
+        path: str,
+        client: Client,
+        commit_every: int = 5000,
+    ):
+        self._client = client
+        self.commit_every = commit_every
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    @property
+    def height(self) -> int:
+        """
+        Height of the last stored block, 0 when the mirror is empty.
+        """
+        row = self.connection.execute('SELECT MAX(height) FROM blocks').fetchone()
+        return row[0] or 0
+
+    def _last_block_id(self) -> Optional[str]:
+        row = self.connection.execute(
+            'SELECT id FROM blocks ORDER BY height DESC LIMIT 1').fetchone()
+        return None if row is None else row[0]
+
+    def sync(
+        self,
+        clients: Optional[Sequence[Client]] = None,
+        workers: int = 4,
+        backfill_margin: int = 101,
+        on_progress: Optional[Callable[[BackfillProgress], None]] = None,
+    ) -> int:
+        """
+        Bring the mirror up to date with the chain and return the number of stored blocks.
+
+        Blocks older than backfill_margin blocks from the tip are fetched in parallel (from the
+        clients, if provided, otherwise from the mirror's client), the rest are followed one
+        by one so that forks near the tip are handled.
+        """
+        count = 0
+        self._revert_orphaned()
+
+        tip = self._client.blocks.get_status().height
+        if tip - self.height > backfill_margin:
+            backfill = BlockBackfill(
+                clients or [self._client],
+                from_height=self.height + 1,
+                to_height=tip - backfill_margin,
+                workers=workers,
+                previous_block_id=self._last_block_id(),
+                on_progress=on_progress,
+            )
+            count += self.insert_blocks(backfill)
+
+        last_block_id = self._last_block_id()
+        if last_block_id is None:
+            follower = BlockFollower(self._client, from_height=1)
+        else:
+            follower = BlockFollower(self._client, from_block_id=last_block_id)
+        while True:
+            events = follower.poll()
+            if not events:
+                break
+            self.apply(events)
+            count += sum(1 for e in events if isinstance(e, BlockApplied))
+        return count
+
+    def _revert_orphaned(self):
+        # Drop the stored blocks that the node no longer knows about, these have been orphaned
+        # by a fork while the mirror wasn't syncing.
+        while True:
+            block_id = self._last_block_id()
+            if block_id is None or self._client.blocks.get_block(block_id) is not None:
+                return
+            with self.connection:
+                self._delete_block(block_id)
+
+    def apply(self, events: Iterable[BlockEvent]):
+        """
+        Apply BlockFollower events to the mirror in a single database transaction.
+        """
+        with self.connection:
+            for event in events:
+                if isinstance(event, BlockApplied):
+                    self._insert([event.block])
+                else:
+                    self._delete_block(event.block.block_id)
+
+    def insert_blocks(self, blocks: Iterable[BlockInfo]) -> int:
+        """
+        Store the blocks (in height order), committing every commit_every blocks.
+        """
+        count = 0
+        batch: List[BlockInfo] = []
+        for block in blocks:
+            batch.append(block)
+            if len(batch) >= self.commit_every:
+                with self.connection:
+                    self._insert(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            with self.connection:
+                self._insert(batch)
+            count += len(batch)
+        return count
+
+    def _insert(self, blocks: List[BlockInfo]):
+        block_rows = []
+        tx_rows = []
+        for block in blocks:
+            raw = block.to_json()
+            del raw['transactions']
+            block_rows.append((
+                block.block_id,
+                block.height,
+                block.previous_block_id,
+                int(block.timestamp),
+                block.generator_public_key.hex(),
+                block.number_of_transactions,
+                int(block.total_amount),
+                int(block.total_fee),
+                int(block.reward),
+                json.dumps(raw),
+            ))
+            for info in block.transactions:
+                tx = info.tx
+                raw = info.to_json()
+                del raw['confirmations']
+                tx_rows.append((
+                    info.tx_id,
+                    info.block_id,
+                    info.height,
+                    tx._type_id(),
+                    int(tx.timestamp),
+                    raw['senderId'],
+                    tx.sender_public_key.hex(),
+                    tx._recipient,
+                    int(tx._amount),
+                    int(tx.fee),
+                    json.dumps(raw),
+                ))
+        # A block that replaces a stored one at the same height (re-forged on another fork)
+        # replaces its row, but the transactions of the old block have to be removed explicitly
+        self.connection.executemany(
+            'DELETE FROM transactions WHERE height = ?', [(b.height,) for b in blocks])
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', block_rows)
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', tx_rows)
+
+    def _delete_block(self, block_id: str):
+        self.connection.execute('DELETE FROM transactions WHERE block_id = ?', [block_id])
+        self.connection.execute('DELETE FROM blocks WHERE id = ?', [block_id])
+
+    def _transaction_info(self, raw: str, height: int) -> TransactionInfo:
+        data = json.loads(raw)
+        data['confirmations'] = max(0, height - data['height'] + 1)
+        return TransactionInfo(data)
+
+    def get_block(
+        self,
+        block_id: Optional[str] = None,
+        height: Optional[int] = None,
+    ) -> Optional[BlockInfo]:
+        if block_id is not None:
+            row = self.connection.execute(
+                'SELECT raw FROM blocks WHERE id = ?', [block_id]).fetchone()
+        else:
+            row = self.connection.execute(
+                'SELECT raw FROM blocks WHERE height = ?', [height]).fetchone()
+        if row is None:
+            return None
+
+        raw = json.loads(row[0])
+        raw['transactions'] = [
+            t.to_json() for t in self.transactions('block_id = ?', [raw['id']])
+        ]
+        return BlockInfo(raw)
+
+    def get_transaction(self, tx_id: str) -> Optional[TransactionInfo]:
+        for info in self.transactions('id = ?', [tx_id]):
+            return info
+        return None
+
+    def transactions(
+        self,
+        where: Optional[str] = None,
+        params: Sequence[Any] = (),
+        order_by: str = 'height, rowid',
+    ) -> Iterator[TransactionInfo]:
+        """
+        Iterate over the stored transactions that match the SQL where clause.
+
+        For example:
+
+            mirror.transactions('sender_id = ? OR recipient_id = ?', [address, address])
+        """
+        height = self.height
+        sql = 'SELECT raw FROM transactions'
+        if where:
+            sql += ' WHERE {}'.format(where)
+        sql += ' ORDER BY {}'.format(order_by)
+        for (raw,) in self.connection.execute(sql, params):
+            yield self._transaction_info(raw, height)
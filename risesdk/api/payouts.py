@@ -0,0 +1,91 @@
+import itertools
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from risesdk.protocol import Address, Amount, SecretKey, SendTx, Timestamp
+from risesdk.protocol.signer import Signer
+from risesdk.api.client import Client
+from risesdk.api.fees import FeeSchedule
+
+
+class PayoutBuilder(object):
+    """
+    Builds and signs SendTx transactions for large numbers of payouts.
+
+    The payouts are (address, amount) pairs, given as a list or any other iterable (which is
+    consumed lazily). The fee is looked up once per build from the node (or a FeeSchedule).
+    The transactions are signed in chunks of chunk_size with Signer.sign_many() in a pool of
+    worker processes. The signed transactions are returned in batches of batch_size, ready
+    for TransactionsAPI.add_transactions.
+
+    Transactions with the same recipient and amount would have the same id when created at
+    the same time, so repeated payouts get timestamps that are one second apart, counting down
+    from the build timestamp (the node rejects timestamps in the future). A build timestamp
+    that is too close to the epoch for the repeats raises ValueError.
+    """
+    batch_size: int
+    chunk_size: int
+    workers: Optional[int]
+
+    def __init__(
+        self,
+        client: Client,
+        secret: SecretKey,
+        second_secret: Optional[SecretKey] = None,
+        fees: Optional[FeeSchedule] = None,
+        batch_size: int = 25,
+        chunk_size: int = 500,
+        workers: Optional[int] = None,
+    ):
+        self._client = client
+        self._signer = Signer(secret, second_secret)
+        self._public_key = self._signer.public_key
+        self._fees = fees
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def _fee(self) -> Amount:
+        if self._fees is not None:
+            return self._fees.fees_at().send
+        return self._client.blocks.get_fees().fees.send
+
+    def _transactions(
+        self,
+        payouts: Iterable[Tuple[Address, Amount]],
+        fee: Amount,
+        timestamp: Timestamp,
+    ) -> Iterator[SendTx]:
+        seen: Dict[Tuple[Address, int], int] = {}
+        for (address, amount) in payouts:
+            address = Address(address)
+            key = (address, int(amount))
+            repeats = seen.get(key, 0)
+            seen[key] = repeats + 1
+            if repeats > timestamp:
+                raise ValueError('Timestamp {} is too early for {} repeated payouts to {}'.format(
+                    timestamp, repeats + 1, address))
+            yield SendTx(
+                sender_public_key=self._public_key,
+                recipient=address,
+                amount=Amount(amount),
+                fee=fee,
+                timestamp=Timestamp(timestamp - repeats),
+            )
+
+    def build(
+        self,
+        payouts: Iterable[Tuple[Address, Amount]],
+        timestamp: Optional[Timestamp] = None,
+    ) -> Iterator[List[SendTx]]:
+        """
+        Create and sign the payout transactions, yielding them in batches in payout order.
+        """
+        fee = self._fee()
+        if timestamp is None:
+            timestamp = Timestamp.now()
+        txs = self._transactions(payouts, fee, timestamp)
+        signed = self._signer.sign_iter(txs, self.workers, self.chunk_size)
+        while True:
+            batch = list(itertools.islice(signed, self.batch_size))
+            if not batch:
+                return
+            yield batch
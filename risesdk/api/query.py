@@ -0,0 +1,367 @@
+import copy
+from bisect import bisect_left, bisect_right
+from typing import Any, Optional, List, Type, Dict, Iterable, Callable, Tuple
+from risesdk.protocol import (
+    Timestamp,
+    Amount,
+    Address,
+    PublicKey,
+    BaseTx,
+)
+from risesdk.api.transactions import TransactionInfo, TransactionsResult
+
+DEFAULT_LIMIT = 100
+DEFAULT_ORDER_BY = 'height:desc'
+
+
+class _Entry(object):
+    __slots__ = (
+        'info',
+        'seq',
+        'block_id',
+        'height',
+        'type_id',
+        'timestamp',
+        'sender',
+        'sender_public_key',
+        'recipient',
+        'amount',
+        'fee',
+    )
+
+    def __init__(self, info: TransactionInfo, seq: int):
+        tx = info.tx
+        self.info = info
+        self.seq = seq
+        self.block_id = info.block_id
+        self.height = info.height
+        self.type_id = tx._type_id()
+        self.timestamp = tx.timestamp
+        self.sender = tx.sender_public_key.derive_address()
+        self.sender_public_key = tx.sender_public_key
+        self.recipient = tx._recipient
+        self.amount = tx._amount
+        self.fee = tx.fee
+
+
+_ORDER_KEYS: Dict[str, Callable[[_Entry], Any]] = {
+    'height': lambda e: e.height,
+    'timestamp': lambda e: e.timestamp,
+    'amount': lambda e: e.amount,
+    'fee': lambda e: e.fee,
+    'type': lambda e: e.type_id,
+    'blockId': lambda e: e.block_id,
+    'senderId': lambda e: e.sender,
+    'recipientId': lambda e: e.recipient or '',
+    'senderPublicKey': lambda e: e.sender_public_key.hex(),
+    'id': lambda e: e.info.tx_id,
+}
+
+# A filter condition is a predicate paired with a function that returns the
+# subset of entries that can possibly match it (or None when no index helps).
+_Condition = Tuple[Callable[[_Entry], bool], Callable[[], Optional[List[_Entry]]]]
+
+
+class LocalTransactionsResult(TransactionsResult):
+    def __init__(self, transactions: List[TransactionInfo], count: int):
+        self.transactions = transactions
+        self.count = count
+
+
+class TransactionStore(object):
+    """
+    In-memory store of confirmed transactions that can be queried with the same filters as
+    TransactionsAPI.get_transactions.
+
+    The store keeps indexes by block, sender, recipient and height, so that most queries only
+    look at a fraction of the stored transactions. Filters without the "and__" prefix are
+    combined with OR, filters with the prefix must all match, just like on the node.
+
+    When chain_height is set, the confirmation counts of the returned transactions (and the
+    min_confirmations filters) are computed from it, otherwise the stored values are used.
+    """
+    chain_height: Optional[int]
+
+    def __init__(
+        self,
+        transactions: Optional[Iterable[TransactionInfo]] = None,
+        chain_height: Optional[int] = None,
+    ):
+        self.chain_height = chain_height
+        self._seq = 0
+        self._by_id: Dict[str, _Entry] = {}
+        self._by_block: Dict[str, List[_Entry]] = {}
+        self._by_sender: Dict[str, List[_Entry]] = {}
+        self._by_recipient: Dict[str, List[_Entry]] = {}
+        self._by_height: Dict[int, List[_Entry]] = {}
+        self._heights: List[int] = []
+        if transactions is not None:
+            self.add(*transactions)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, tx_id: str) -> bool:
+        return tx_id in self._by_id
+
+    def get(self, tx_id: str) -> Optional[TransactionInfo]:
+        e = self._by_id.get(tx_id)
+        if e is None:
+            return None
+        return self._with_confirmations(e)
+
+    def add(self, *infos: TransactionInfo):
+        """
+        Add (or replace) transactions in the store.
+        """
+        for info in infos:
+            if info.tx_id in self._by_id:
+                self._unindex(self._by_id[info.tx_id])
+            self._seq += 1
+            self._index(_Entry(info, self._seq))
+
+    def remove(self, tx_id: str) -> Optional[TransactionInfo]:
+        e = self._by_id.get(tx_id)
+        if e is None:
+            return None
+        self._unindex(e)
+        return e.info
+
+    def remove_block(self, block_id: str) -> List[TransactionInfo]:
+        """
+        Remove all transactions of the block, for example when the block has been reverted.
+        """
+        entries = list(self._by_block.get(block_id, []))
+        for e in entries:
+            self._unindex(e)
+        return [e.info for e in entries]
+
+    def _index(self, e: _Entry):
+        self._by_id[e.info.tx_id] = e
+        self._by_block.setdefault(e.block_id, []).append(e)
+        self._by_sender.setdefault(e.sender, []).append(e)
+        if e.recipient:
+            self._by_recipient.setdefault(e.recipient, []).append(e)
+        if e.height not in self._by_height:
+            self._by_height[e.height] = []
+            if not self._heights or self._heights[-1] < e.height:
+                self._heights.append(e.height)
+            else:
+                self._heights.insert(bisect_left(self._heights, e.height), e.height)
+        self._by_height[e.height].append(e)
+
+    def _unindex(self, e: _Entry):
+        del self._by_id[e.info.tx_id]
+        self._discard(self._by_block, e.block_id, e)
+        self._discard(self._by_sender, e.sender, e)
+        if e.recipient:
+            self._discard(self._by_recipient, e.recipient, e)
+        if self._discard(self._by_height, e.height, e):
+            del self._heights[bisect_left(self._heights, e.height)]
+
+    @staticmethod
+    def _discard(index: Dict, key, e: _Entry) -> bool:
+        entries = index[key]
+        entries.remove(e)
+        if not entries:
+            del index[key]
+            return True
+        return False
+
+    def _range(self, from_height: Optional[int], to_height: Optional[int]) -> List[_Entry]:
+        lo = 0 if from_height is None else bisect_left(self._heights, from_height)
+        hi = len(self._heights) if to_height is None else bisect_right(self._heights, to_height)
+        entries: List[_Entry] = []
+        for h in self._heights[lo:hi]:
+            entries.extend(self._by_height[h])
+        return entries
+
+    def _confirmations(self, e: _Entry) -> int:
+        if self.chain_height is None:
+            return e.info.confirmations
+        return max(0, self.chain_height - e.height + 1)
+
+    def _with_confirmations(self, e: _Entry) -> TransactionInfo:
+        if self.chain_height is None:
+            return e.info
+        info = copy.copy(e.info)
+        info.confirmations = self._confirmations(e)
+        return info
+
+    def _conditions(
+        self,
+        block_id: Optional[str] = None,
+        type_cls: Optional[Type[BaseTx]] = None,
+        sender: Optional[Address] = None,
+        sender_public_key: Optional[PublicKey] = None,
+        recipient: Optional[Address] = None,
+        from_height: Optional[int] = None,
+        to_height: Optional[int] = None,
+        from_timestamp: Optional[Timestamp] = None,
+        to_timestamp: Optional[Timestamp] = None,
+        min_amount: Optional[Amount] = None,
+        max_amount: Optional[Amount] = None,
+        min_confirmations: Optional[int] = None,
+    ) -> List[_Condition]:
+        conds: List[_Condition] = []
+        if block_id is not None:
+            conds.append((
+                lambda e: e.block_id == block_id,
+                lambda: self._by_block.get(block_id, []),
+            ))
+        if type_cls is not None:
+            type_id = type_cls._type_id()
+            conds.append((lambda e: e.type_id == type_id, lambda: None))
+        if sender is not None:
+            conds.append((
+                lambda e: e.sender == sender,
+                lambda: self._by_sender.get(sender, []),
+            ))
+        if sender_public_key is not None:
+            pk_address = sender_public_key.derive_address()
+            conds.append((
+                lambda e: e.sender_public_key == sender_public_key,
+                lambda: self._by_sender.get(pk_address, []),
+            ))
+        if recipient is not None:
+            conds.append((
+                lambda e: e.recipient == recipient,
+                lambda: self._by_recipient.get(recipient, []),
+            ))
+        if from_height is not None:
+            conds.append((
+                lambda e: e.height >= from_height,
+                lambda: self._range(from_height, None),
+            ))
+        if to_height is not None:
+            conds.append((
+                lambda e: e.height <= to_height,
+                lambda: self._range(None, to_height),
+            ))
+        if from_timestamp is not None:
+            conds.append((lambda e: e.timestamp >= from_timestamp, lambda: None))
+        if to_timestamp is not None:
+            conds.append((lambda e: e.timestamp <= to_timestamp, lambda: None))
+        if min_amount is not None:
+            conds.append((lambda e: e.amount >= min_amount, lambda: None))
+        if max_amount is not None:
+            conds.append((lambda e: e.amount <= max_amount, lambda: None))
+        if min_confirmations is not None:
+            conds.append((lambda e: self._confirmations(e) >= min_confirmations, lambda: None))
+        return conds
+
+    def _candidates(
+        self,
+        and_conds: List[_Condition],
+        or_conds: List[_Condition],
+        and_from_height: Optional[int],
+        and_to_height: Optional[int],
+    ) -> Iterable[_Entry]:
+        best: Optional[List[_Entry]] = None
+        if and_from_height is not None or and_to_height is not None:
+            best = self._range(and_from_height, and_to_height)
+        for (_, candidates) in and_conds:
+            entries = candidates()
+            if entries is not None and (best is None or len(entries) < len(best)):
+                best = list(entries)
+
+        if or_conds:
+            union: Optional[Dict[int, _Entry]] = {}
+            for (_, candidates) in or_conds:
+                entries = candidates()
+                if entries is None or union is None:
+                    union = None
+                    break
+                for e in entries:
+                    union[e.seq] = e
+            if union is not None and (best is None or len(union) < len(best)):
+                best = list(union.values())
+
+        if best is None:
+            return self._by_id.values()
+        return best
+
+    def get_transactions(
+        self,
+        block_id: Optional[str] = None,
+        and__block_id: Optional[str] = None,
+        type_cls: Optional[Type[BaseTx]] = None,
+        and__type_cls: Optional[Type[BaseTx]] = None,
+        sender: Optional[Address] = None,
+        and__sender: Optional[Address] = None,
+        sender_public_key: Optional[PublicKey] = None,
+        and__sender_public_key: Optional[PublicKey] = None,
+        recipient: Optional[Address] = None,
+        and__recipient: Optional[Address] = None,
+        sender_public_keys: Optional[List[PublicKey]] = None,
+        senders: Optional[List[Address]] = None,
+        recipients: Optional[List[Address]] = None,
+        from_height: Optional[int] = None,
+        and__from_height: Optional[int] = None,
+        to_height: Optional[int] = None,
+        and__to_height: Optional[int] = None,
+        from_timestamp: Optional[Timestamp] = None,
+        and__from_timestamp: Optional[Timestamp] = None,
+        to_timestamp: Optional[Timestamp] = None,
+        and__to_timestamp: Optional[Timestamp] = None,
+        min_amount: Optional[Amount] = None,
+        and__min_amount: Optional[Amount] = None,
+        max_amount: Optional[Amount] = None,
+        and__max_amount: Optional[Amount] = None,
+        min_confirmations: Optional[int] = None,
+        and__min_confirmations: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ) -> TransactionsResult:
+        """
+        Query the stored transactions, see TransactionsAPI.get_transactions for the arguments.
+
+        Like on the node, the results are ordered by "height:desc" and limited to 100 items
+        unless specified otherwise.
+        """
+        or_conds = self._conditions(
+            block_id, type_cls, sender, sender_public_key, recipient,
+            from_height, to_height, from_timestamp, to_timestamp,
+            min_amount, max_amount, min_confirmations,
+        )
+        for pk in sender_public_keys or []:
+            or_conds += self._conditions(sender_public_key=pk)
+        for addr in senders or []:
+            or_conds += self._conditions(sender=addr)
+        for addr in recipients or []:
+            or_conds += self._conditions(recipient=addr)
+
+        # Height range is handled as a single index lookup in _candidates
+        and_conds = self._conditions(
+            and__block_id, and__type_cls, and__sender, and__sender_public_key, and__recipient,
+            None, None, and__from_timestamp, and__to_timestamp,
+            and__min_amount, and__max_amount, and__min_confirmations,
+        )
+        and_preds = [pred for (pred, _) in and_conds]
+        if and__from_height is not None:
+            and_preds.append(lambda e: e.height >= and__from_height)
+        if and__to_height is not None:
+            and_preds.append(lambda e: e.height <= and__to_height)
+        or_preds = [pred for (pred, _) in or_conds]
+
+        matches = [
+            e for e in self._candidates(and_conds, or_conds, and__from_height, and__to_height)
+            if all(p(e) for p in and_preds) and (not or_preds or any(p(e) for p in or_preds))
+        ]
+
+        field, _, direction = (order_by or DEFAULT_ORDER_BY).partition(':')
+        if field not in _ORDER_KEYS:
+            raise ValueError('Unsupported order_by field "{}"'.format(field))
+        if direction not in ('', 'asc', 'desc'):
+            raise ValueError('Unsupported order_by direction "{}"'.format(direction))
+        key = _ORDER_KEYS[field]
+        matches.sort(key=lambda e: e.seq)
+        matches.sort(key=key, reverse=direction == 'desc')
+
+        start = offset or 0
+        end = start + (DEFAULT_LIMIT if limit is None else limit)
+        return LocalTransactionsResult(
+            transactions=[self._with_confirmations(e) for e in matches[start:end]],
+            count=len(matches),
+        )
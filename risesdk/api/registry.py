@@ -0,0 +1,153 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from risesdk.protocol import Address, PublicKey
+from risesdk.protocol.slots import ACTIVE_DELEGATES, round_of
+from risesdk.api.client import Client
+from risesdk.api.delegates import DelegateInfo
+
+
+def _record(info: DelegateInfo) -> Tuple:
+    return (
+        info.address,
+        info.username,
+        info.approval,
+        info.productivity,
+        info.consecutive_missed_blocks,
+        info.missed_blocks,
+        info.produced_blocks,
+        info.rank,
+        info.rate,
+        info.vote,
+        info.votes_weight,
+        info.voters_count,
+        info.registration_time,
+    )
+
+
+class DelegateRegistry(object):
+    """
+    In-memory registry of all of the registered delegates.
+
+    The delegates are loaded in bulk with DelegatesAPI.get_delegates and indexed by public key,
+    username and address, so lookups don't need a request to the node. The ranked views are
+    ordered by the rank reported by the node.
+
+    Delegate records only change when blocks are forged and votes are cast, and the ranks are
+    only relevant per round, so refresh() reloads the delegates at most once per round. Only
+    the records that changed are replaced; unchanged DelegateInfo objects are kept.
+    """
+    page_size: int
+
+    def __init__(self, client: Client, page_size: int = 101):
+        self._client = client
+        self.page_size = page_size
+        self._by_public_key: Dict[PublicKey, DelegateInfo] = {}
+        self._by_username: Dict[str, DelegateInfo] = {}
+        self._by_address: Dict[Address, DelegateInfo] = {}
+        self._records: Dict[PublicKey, Tuple] = {}
+        self._ranked: List[DelegateInfo] = []
+        self._round: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._by_public_key)
+
+    def __iter__(self) -> Iterator[DelegateInfo]:
+        return iter(self._ranked)
+
+    def __contains__(self, public_key: PublicKey) -> bool:
+        return public_key in self._by_public_key
+
+    def get(
+        self,
+        public_key: Optional[PublicKey] = None,
+        username: Optional[str] = None,
+        address: Optional[Address] = None,
+    ) -> Optional[DelegateInfo]:
+        if public_key is not None:
+            return self._by_public_key.get(public_key)
+        if username is not None:
+            return self._by_username.get(username)
+        if address is not None:
+            return self._by_address.get(address)
+        raise ValueError('One of public_key, username or address must be specified')
+
+    def by_public_key(self, public_key: PublicKey) -> Optional[DelegateInfo]:
+        return self._by_public_key.get(public_key)
+
+    def by_username(self, username: str) -> Optional[DelegateInfo]:
+        return self._by_username.get(username)
+
+    def by_address(self, address: Address) -> Optional[DelegateInfo]:
+        return self._by_address.get(address)
+
+    @property
+    def ranked(self) -> List[DelegateInfo]:
+        return list(self._ranked)
+
+    @property
+    def active(self) -> List[DelegateInfo]:
+        """
+        The delegates that forge in the current round.
+        """
+        return self._ranked[:ACTIVE_DELEGATES]
+
+    def top(self, count: int) -> List[DelegateInfo]:
+        return self._ranked[:count]
+
+    def refresh(self) -> List[DelegateInfo]:
+        """
+        Reload the delegates when a new round has started since the last load.
+
+        Returns the delegates whose records changed.
+        """
+        current = round_of(self._client.head.height)
+        if current == self._round:
+            return []
+        return self.load()
+
+    def load(self) -> List[DelegateInfo]:
+        """
+        Load all of the delegates from the node, returning the ones whose records changed.
+        """
+        self._round = round_of(self._client.head.height)
+        count = self._client.delegates.get_delegate_count()
+        fetched: List[DelegateInfo] = []
+        offset = 0
+        while offset < count:
+            delegates = self._client.delegates.get_delegates(
+                limit=self.page_size,
+                offset=offset,
+                order_by='rank:asc',
+            ).delegates
+            if not delegates:
+                break
+            fetched += delegates
+            offset += len(delegates)
+
+        changed: List[DelegateInfo] = []
+        seen = set()
+        for info in fetched:
+            seen.add(info.public_key)
+            record = _record(info)
+            if self._records.get(info.public_key) == record:
+                continue
+            self._remove(info.public_key)
+            self._records[info.public_key] = record
+            self._by_public_key[info.public_key] = info
+            self._by_username[info.username] = info
+            self._by_address[info.address] = info
+            changed.append(info)
+        for public_key in list(self._by_public_key):
+            if public_key not in seen:
+                self._remove(public_key)
+
+        if changed or len(self._ranked) != len(self._by_public_key):
+            self._ranked = sorted(self._by_public_key.values(), key=lambda d: d.rank)
+        return changed
+
+    def _remove(self, public_key: PublicKey):
+        info = self._by_public_key.pop(public_key, None)
+        if info is None:
+            return
+        del self._records[public_key]
+        del self._by_username[info.username]
+        del self._by_address[info.address]
@@ -0,0 +1,155 @@
+from fractions import Fraction
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+from risesdk.protocol import Address, Amount, PublicKey
+from risesdk.api.client import Client
+from risesdk.api.voters import VoterGraph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+class RewardShare(NamedTuple):
+    address: Address
+    weight: Amount
+    amount: Amount
+
+
+class ForgedSummary(NamedTuple):
+    blocks: int
+    rewards: Amount
+    fees: Amount
+
+    @property
+    def forged(self) -> Amount:
+        return Amount(self.rewards + self.fees)
+
+
+def distribute(amount: int, weights: Sequence[int]) -> Any:
+    """
+    Split the amount between the weights proportionally, as exact integers.
+
+    Every weight gets the floor of its proportional share, and the remaining units go to the
+    ones with the largest remainders (largest remainder method), so the shares always add up
+    to the amount exactly. Returns a NumPy array of the shares. The computation uses int64
+    arrays when the intermediate products fit, and Python integers otherwise.
+    """
+    if np is None:
+        raise ImportError('distribute requires numpy')
+    amount = int(amount)
+    if amount < 0:
+        raise ValueError('Amount must not be negative')
+    w = None
+    if len(weights):
+        try:
+            w = np.asarray(weights, dtype=np.int64)
+        except OverflowError:
+            pass
+    if w is not None and int(w.min()) >= 0:
+        # The sum can't overflow as long as every weight is small enough
+        max_weight = int(w.max())
+        if max_weight > _INT64_MAX // len(w) or amount * max_weight > _INT64_MAX:
+            w = None
+    else:
+        w = None
+    if w is None:
+        w = np.array([int(x) for x in weights], dtype=object)
+    total = int(w.sum()) if len(w) else 0
+    if total <= 0:
+        return np.zeros(len(weights), dtype=np.int64)
+    scaled = w * amount
+    shares = scaled // total
+    remainders = scaled % total
+    leftover = amount - int(shares.sum())
+    if leftover:
+        # Stable sort so that ties go to the earlier weights
+        order = np.argsort(-remainders, kind='stable')
+        shares[order[:leftover]] += 1
+    return shares
+
+
+class RewardCalculator(object):
+    """
+    Computes how the forging income of a delegate is shared with its voters.
+
+    The income over a height range is summed from the reward and total_fee of the blocks
+    forged by the delegate. The voters are weighted by their balances, taken from a
+    VoterGraph snapshot when one is given and from DelegatesAPI.get_voters otherwise, and their
+    shares are computed with distribute().
+
+    Requires NumPy, which can be installed with the risesdk[numpy] extra.
+    """
+    page_size: int
+
+    def __init__(
+        self,
+        client: Client,
+        graph: Optional[VoterGraph] = None,
+        page_size: int = 100,
+    ):
+        if np is None:
+            raise ImportError('RewardCalculator requires numpy')
+        self._client = client
+        self._graph = graph
+        self.page_size = page_size
+
+    def forged(self, public_key: PublicKey, from_height: int, to_height: int) -> ForgedSummary:
+        """
+        Sum the rewards and fees of the blocks forged by the delegate in the height range.
+        """
+        blocks = 0
+        rewards = 0
+        fees = 0
+        offset = 0
+        while True:
+            page = self._client.blocks.get_blocks(
+                generator_public_key=public_key,
+                order_by='height:desc',
+                limit=self.page_size,
+                offset=offset,
+            ).blocks
+            for block in page:
+                if from_height <= block.height <= to_height:
+                    blocks += 1
+                    rewards += block.reward
+                    fees += block.total_fee
+            offset += len(page)
+            if len(page) < self.page_size or page[-1].height < from_height:
+                break
+        return ForgedSummary(blocks, Amount(rewards), Amount(fees))
+
+    def voters(self, public_key: PublicKey) -> List[Tuple[Address, Amount]]:
+        if self._graph is not None:
+            return self._graph.voters_of(public_key)
+        return [(v.address, v.balance) for v in self._client.delegates.get_voters(public_key)]
+
+    def calculate(
+        self,
+        public_key: PublicKey,
+        from_height: int,
+        to_height: int,
+        share: Union[Fraction, int, str] = 1,
+        include_fees: bool = True,
+    ) -> List[RewardShare]:
+        """
+        Compute the share of every voter of the income of the delegate in the height range.
+
+        share is the part of the income that is shared with the voters, for example
+        Fraction(4, 5) or '0.8'. The shared amount is rounded down to whole units.
+        """
+        ratio = Fraction(share)
+        if not 0 <= ratio <= 1:
+            raise ValueError('Share must be between 0 and 1')
+        summary = self.forged(public_key, from_height, to_height)
+        income = summary.forged if include_fees else summary.rewards
+        pool = income * ratio.numerator // ratio.denominator
+
+        voters = self.voters(public_key)
+        amounts = distribute(pool, [balance for (_, balance) in voters])
+        return [
+            RewardShare(address, balance, Amount(amount))
+            for ((address, balance), amount) in zip(voters, amounts.tolist())
+        ]
@@ -0,0 +1,150 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from risesdk.protocol import BaseTx
+from risesdk.api.base import APIError
+from risesdk.api.client import Client
+
+
+class TransactionRejectedError(APIError):
+    tx: BaseTx
+    reason: str
+
+    def __init__(self, tx: BaseTx, reason: str):
+        super().__init__(reason)
+        self.tx = tx
+        self.reason = reason
+
+
+class SubmissionPipeline(object):
+    """
+    Submits transactions from any number of threads to the node in small, concurrent batches.
+
+    submit() queues a transaction and returns a Future. A dispatcher thread collects the queued
+    transactions into batches of up to batch_size, waiting at most max_delay seconds for a
+    batch to fill up, and sends them with TransactionsAPI.add_transactions, with at most
+    max_in_flight requests at a time. The Future resolves to the transaction id when the node
+    accepts the transaction, and fails with TransactionRejectedError when it's rejected, or
+    with the error of the request when the request fails.
+
+    Submitting a transaction that is already queued or in flight (by derive_id) returns the
+    Future of the earlier submission.
+
+    The pipeline can be used as a context manager, which closes it (sending everything that
+    was queued) on exit.
+    """
+    batch_size: int
+    max_delay: float
+    max_in_flight: int
+
+    def __init__(
+        self,
+        client: Client,
+        batch_size: int = 25,
+        max_delay: float = 0.05,
+        max_in_flight: int = 4,
+    ):
+        self._client = client
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.max_in_flight = max_in_flight
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'SubmissionPipeline':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, tx: BaseTx) -> Future:
+        tx_id = tx.derive_id()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Submission pipeline has been closed')
+            future = self._pending.get(tx_id)
+            if future is None:
+                future = self._pending[tx_id] = Future()
+                self._queue.put((tx_id, tx))
+        return future
+
+    def submit_many(self, txs: Iterable[BaseTx]) -> List[Future]:
+        return [self.submit(tx) for tx in txs]
+
+    def close(self):
+        """
+        Send the queued transactions and wait for all of the requests to finish.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self):
+        closing = False
+        while not closing:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            # Wait for a free slot before starting another request
+            self._slots.acquire()
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: List[Tuple[str, BaseTx]]):
+        try:
+            try:
+                r = self._client.transactions.add_transactions(*(tx for (_, tx) in batch))
+            except Exception as err:
+                self._resolve(batch, {}, err)
+                return
+            results: Dict[str, Optional[Exception]] = {}
+            for tx in r.accepted:
+                results[tx.derive_id()] = None
+            for rejected in r.rejected:
+                results[rejected.tx.derive_id()] = TransactionRejectedError(
+                    rejected.tx, rejected.reason)
+            self._resolve(batch, results, None)
+        finally:
+            self._slots.release()
+
+    def _resolve(
+        self,
+        batch: List[Tuple[str, BaseTx]],
+        results: Dict[str, Optional[Exception]],
+        error: Optional[Exception],
+    ):
+        with self._lock:
+            futures = [(tx_id, self._pending.pop(tx_id)) for (tx_id, _) in batch]
+        for (tx_id, future) in futures:
+            if error is not None:
+                exc: Optional[Exception] = error
+            elif tx_id in results:
+                exc = results[tx_id]
+            else:
+                exc = APIError('Node did not report the result of transaction {}'.format(tx_id))
+            if exc is None:
+                future.set_result(tx_id)
+            else:
+                future.set_exception(exc)
@@ -0,0 +1,182 @@
+import copy
+import heapq
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from risesdk.protocol import BaseTx
+from risesdk.api.base import APIError
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.follower import BlockApplied, BlockReverted, BlockEvent
+from risesdk.api.mempool import PendingEvent, PendingRemoved
+from risesdk.api.transactions import TransactionInfo
+
+
+class TransactionDroppedError(APIError):
+    pass
+
+
+class ConfirmationTracker(object):
+    """
+    Tracks the confirmations of many submitted transactions at once.
+
+    Instead of querying the node for every transaction, the tracker checks the transactions of
+    each new block against the set of tracked ids and computes the confirmations from the
+    height of the chain. track() returns a Future that resolves to the TransactionInfo once the
+    transaction has the requested number of confirmations; the same transaction can be tracked
+    at several depths. Reverted blocks put their transactions back to pending.
+
+    Feed the tracker with BlockFollower events and, optionally, MempoolWatcher events. When a
+    tracked transaction leaves the node's pools and doesn't appear in a block within
+    drop_grace blocks, its futures fail with TransactionDroppedError.
+
+    With a client, track() looks the transaction up on the node once, so that transactions
+    that were already included before tracking started (for example when resuming from a
+    TransactionJournal) are resolved as well. Without one, only the blocks applied after
+    track() are checked, so transactions have to be tracked before they're submitted.
+    """
+    height: Optional[int]
+    drop_grace: int
+
+    def __init__(self, client: Optional[Client] = None, drop_grace: int = 3):
+        self._client = client
+        self.height = None
+        self.drop_grace = drop_grace
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._waiting: Dict[str, List[Tuple[int, Future]]] = {}
+        self._included: Dict[str, Tuple[int, TransactionInfo]] = {}
+        self._left_pool: Dict[str, int] = {}
+        # Heap of (target height, seq, tx id, inclusion height, future)
+        self._due: List[Tuple[int, int, str, int, Future]] = []
+
+    def __len__(self) -> int:
+        return len(self._waiting)
+
+    def track(self, tx: Union[str, BaseTx], confirmations: int = 1) -> Future:
+        """
+        Start tracking the transaction (or transaction id) until it reaches the confirmations.
+        """
+        tx_id = tx if isinstance(tx, str) else tx.derive_id()
+        future: Future = Future()
+        settled: List[Tuple[Future, Any]] = []
+        with self._lock:
+            self._waiting.setdefault(tx_id, []).append((confirmations, future))
+            if tx_id in self._included:
+                self._schedule(tx_id, confirmations, future)
+                settled = self._resolve_due()
+            included = tx_id in self._included
+        _settle(settled)
+        if self._client is not None and not included:
+            self._lookup(self._client, tx_id, confirmations, future)
+        return future
+
+    def _lookup(self, client: Client, tx_id: str, confirmations: int, future: Future):
+        info = client.transactions.get_transaction(tx_id)
+        if info is None:
+            return
+        settled: List[Tuple[Future, Any]] = []
+        with self._lock:
+            waiters = self._waiting.get(tx_id, [])
+            if not any(f is future for (_, f) in waiters):
+                # Resolved by a block in the meantime
+                return
+            if info.confirmations >= confirmations:
+                self._waiting[tx_id] = [w for w in waiters if w[1] is not future]
+                if not self._waiting[tx_id]:
+                    del self._waiting[tx_id]
+                    self._included.pop(tx_id, None)
+                settled.append((future, info))
+            if tx_id in self._waiting and tx_id not in self._included:
+                self._include(info.height, info)
+                settled += self._resolve_due()
+        _settle(settled)
+
+    def track_many(self, txs: Iterable[Union[str, BaseTx]], confirmations: int = 1) -> List[Future]:
+        return [self.track(tx, confirmations) for tx in txs]
+
+    def _include(self, height: int, info: TransactionInfo):
+        self._included[info.tx_id] = (height, info)
+        self._left_pool.pop(info.tx_id, None)
+        for (confirmations, future) in self._waiting[info.tx_id]:
+            self._schedule(info.tx_id, confirmations, future)
+
+    def _schedule(self, tx_id: str, confirmations: int, future: Future):
+        height = self._included[tx_id][0]
+        self._seq += 1
+        heapq.heappush(self._due, (height + confirmations - 1, self._seq, tx_id, height, future))
+
+    def _resolve_due(self) -> List[Tuple[Future, Any]]:
+        # Futures are settled by the caller after releasing the lock, as their callbacks may
+        # call back into the tracker
+        settled: List[Tuple[Future, Any]] = []
+        if self.height is None:
+            return settled
+        while self._due and self._due[0][0] <= self.height:
+            (_, _, tx_id, height, future) = heapq.heappop(self._due)
+            included = self._included.get(tx_id)
+            waiters = self._waiting.get(tx_id, [])
+            if (included is None or included[0] != height
+                    or not any(f is future for (_, f) in waiters)):
+                # Stale entry of a reverted inclusion, or of a future resolved by _lookup()
+                continue
+            self._waiting[tx_id] = [w for w in waiters if w[1] is not future]
+            if not self._waiting[tx_id]:
+                del self._waiting[tx_id]
+                del self._included[tx_id]
+            info = copy.copy(included[1])
+            info.confirmations = self.height - height + 1
+            settled.append((future, info))
+        return settled
+
+    def apply(self, event: Union[BlockEvent, PendingEvent]):
+        if isinstance(event, BlockApplied):
+            self.apply_block(event.block)
+        elif isinstance(event, BlockReverted):
+            self.revert_block(event.block)
+        elif isinstance(event, PendingRemoved):
+            with self._lock:
+                if event.tx_id in self._waiting and event.tx_id not in self._included:
+                    self._left_pool.setdefault(event.tx_id, self.height or 0)
+
+    def apply_block(self, block: BlockInfo):
+        settled: List[Tuple[Future, Any]] = []
+        with self._lock:
+            self.height = block.height
+            for info in block.transactions:
+                if info.tx_id in self._waiting:
+                    self._include(block.height, info)
+            settled += self._resolve_due()
+            settled += self._drop_expired()
+        _settle(settled)
+
+    def revert_block(self, block: BlockInfo):
+        with self._lock:
+            self.height = block.height - 1
+            for info in block.transactions:
+                included = self._included.get(info.tx_id)
+                if included is not None and included[0] == block.height:
+                    del self._included[info.tx_id]
+
+    def _drop_expired(self) -> List[Tuple[Future, Any]]:
+        settled: List[Tuple[Future, Any]] = []
+        if self.height is None:
+            return settled
+        for (tx_id, height) in list(self._left_pool.items()):
+            if self.height - height < self.drop_grace:
+                continue
+            del self._left_pool[tx_id]
+            for (_, future) in self._waiting.pop(tx_id, []):
+                settled.append((future, TransactionDroppedError(
+                    'Transaction {} left the pool without being confirmed'.format(tx_id))))
+        return settled
+
+
+def _settle(settled: List[Tuple[Future, Any]]):
+    for (future, result) in settled:
+        if future.done():
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
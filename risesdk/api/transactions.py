@@ -23,14 +23,39 @@ class TransactionInfo(object):
         self.confirmations = int(raw['confirmations'])
         self.tx = BaseTx.from_json(raw)
 
+    def to_json(self):
+        """
+        Serialize the transaction info back to the node's JSON format.
+        """
+        return {
+            **self.tx.to_json(),
+            'id': self.tx_id,
+            'height': self.height,
+            'blockId': self.block_id,
+            'confirmations': self.confirmations,
+        }
+
 
 class PendingTransactionInfo(object):
+    """
+    A transaction in one of the pools of the node.
+
+    The transaction is only parsed when tx is first accessed, so that listing a large pool to
+    diff it by tx_id stays cheap.
+    """
     tx_id: str
-    tx: BaseTx
+    _tx: Optional[BaseTx]
 
     def __init__(self, raw):
         self.tx_id = str(raw['id'])
-        self.tx = BaseTx.from_json(raw)
+        self._raw = raw
+        self._tx = None
+
+    @property
+    def tx(self) -> BaseTx:
+        if self._tx is None:
+            self._tx = BaseTx.from_json(self._raw)
+        return self._tx
 
 
 class TransactionsResult(object):
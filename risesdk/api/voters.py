@@ -0,0 +1,229 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from risesdk.protocol import Address, Amount, PublicKey, VoteTx
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.client import Client
+from risesdk.api.follower import BlockApplied, BlockEvent
+from risesdk.api.history import BalanceHistory
+from risesdk.api.ledger import block_balance_deltas
+from risesdk.api.registry import DelegateRegistry
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+_SHIFT = 32
+_MASK = (1 << _SHIFT) - 1
+
+
+class VoterGraph(object):
+    """
+    Index of who votes for which delegate, with the balances (vote weights) of the voters.
+
+    The voters of all delegates are fetched concurrently with DelegatesAPI.get_voters.
+    Delegates and voters are interned to integer ids, and the votes are stored as compressed
+    sparse row adjacency lists (NumPy arrays) in both directions, delegate to voters and voter
+    to delegates. The vote weights of all delegates are computed at once with vectorised sums.
+
+    The graph is kept up to date by applying blocks, for example from a BlockFollower: VoteTx
+    transactions add and remove edges and the balance changes of known voters are applied.
+    The balances of voters that are new to the graph are fetched from the node; when the block
+    is older than the head of the node (a replay), the balance changes of the account after
+    the block are looked up with a BalanceHistory and undone.
+
+    Requires NumPy, which can be installed with the risesdk[numpy] extra.
+    """
+    workers: int
+
+    def __init__(self, client: Client, workers: int = 8):
+        if np is None:
+            raise ImportError('VoterGraph requires numpy')
+        self._client = client
+        self.workers = workers
+        self._delegates: List[PublicKey] = []
+        self._delegate_index: Dict[PublicKey, int] = {}
+        self._voters: List[Address] = []
+        self._voter_index: Dict[Address, int] = {}
+        # Balances of the voters, a view of the first len(self._voters) items of a buffer that
+        # grows geometrically as voters are added
+        self._balance_buf = np.zeros(0, dtype=np.int64)
+        self._balances = self._balance_buf
+        self._history = BalanceHistory(client)
+        # Edges as sorted (delegate << 32 | voter) keys and the matching CSR arrays
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._voter_indptr = np.zeros(1, dtype=np.int64)
+        self._voter_indices = np.zeros(0, dtype=np.int64)
+        # Vote changes that haven't been merged into the arrays yet, in order
+        self._edits: List[Tuple[int, bool]] = []
+
+    def __len__(self) -> int:
+        return len(self._voters)
+
+    @property
+    def edge_count(self) -> int:
+        self._compact()
+        return len(self._keys)
+
+    def build(self, registry: Optional[DelegateRegistry] = None):
+        """
+        Fetch the voters of all of the delegates (of the registry, if given) from the node.
+        """
+        if registry is None:
+            registry = DelegateRegistry(self._client)
+            registry.load()
+        delegates = [d.public_key for d in registry.ranked]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(self._client.delegates.get_voters, delegates))
+
+        self._delegates = []
+        self._delegate_index = {}
+        self._voters = []
+        self._voter_index = {}
+        self._edits = []
+        balances: List[int] = []
+        keys: List[int] = []
+        for (public_key, voters) in zip(delegates, results):
+            d = self._intern_delegate(public_key)
+            for voter in voters:
+                v = self._voter_index.get(voter.address)
+                if v is None:
+                    v = self._voter_index[voter.address] = len(self._voters)
+                    self._voters.append(voter.address)
+                    balances.append(voter.balance)
+                keys.append(d << _SHIFT | v)
+        self._balance_buf = np.array(balances, dtype=np.int64)
+        self._balances = self._balance_buf
+        self._set_edges(np.unique(np.array(keys, dtype=np.int64)))
+
+    def _intern_delegate(self, public_key: PublicKey) -> int:
+        d = self._delegate_index.get(public_key)
+        if d is None:
+            d = self._delegate_index[public_key] = len(self._delegates)
+            self._delegates.append(public_key)
+        return d
+
+    def _intern_voter(self, address: Address, height: int) -> int:
+        v = self._voter_index.get(address)
+        if v is None:
+            balance = self._voter_balance(address, height)
+            v = self._voter_index[address] = len(self._voters)
+            self._voters.append(address)
+            if len(self._balance_buf) <= v:
+                buf = np.zeros(max(16, 2 * len(self._balance_buf)), dtype=np.int64)
+                buf[:v] = self._balances
+                self._balance_buf = buf
+            self._balance_buf[v] = balance
+            self._balances = self._balance_buf[:v + 1]
+        return v
+
+    def _voter_balance(self, address: Address, height: int) -> int:
+        # The node only reports the current balance of the account
+        account = self._client.accounts.get_account(address)
+        if account is None:
+            return 0
+        balance = int(account.balance)
+        head = self._client.blocks.get_status().height
+        if height < head:
+            self._history.load(address, account.public_key)
+            balance -= (self._history.balance_at(address, head)
+                        - self._history.balance_at(address, height))
+            self._history.unload(address)
+        return balance
+
+    def _set_edges(self, keys: Any):
+        self._keys = keys
+        rows = keys >> _SHIFT
+        cols = keys & _MASK
+        self._indptr = np.zeros(len(self._delegates) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self._delegates)), out=self._indptr[1:])
+        self._indices = cols
+        order = np.argsort(cols, kind='stable')
+        self._voter_indptr = np.zeros(len(self._voters) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(self._voters)), out=self._voter_indptr[1:])
+        self._voter_indices = rows[order]
+
+    def _compact(self):
+        if (not self._edits and len(self._indptr) == len(self._delegates) + 1
+                and len(self._voter_indptr) == len(self._voters) + 1):
+            return
+        # Only the last change of each edge matters
+        final: Dict[int, bool] = {}
+        for (key, added) in self._edits:
+            final[key] = added
+        self._edits = []
+        removed = np.array([k for (k, a) in final.items() if not a], dtype=np.int64)
+        added = np.array([k for (k, a) in final.items() if a], dtype=np.int64)
+        keys = self._keys[~np.isin(self._keys, removed)]
+        self._set_edges(np.union1d(keys, added))
+
+    def voters_of(self, public_key: PublicKey) -> List[Tuple[Address, Amount]]:
+        """
+        Return the voters of the delegate with their balances.
+        """
+        self._compact()
+        d = self._delegate_index.get(public_key)
+        if d is None:
+            return []
+        voters = self._indices[self._indptr[d]:self._indptr[d + 1]]
+        return [(self._voters[v], Amount(b)) for (v, b) in zip(voters, self._balances[voters])]
+
+    def delegates_of(self, address: Address) -> List[PublicKey]:
+        """
+        Return the delegates that the account votes for.
+        """
+        self._compact()
+        v = self._voter_index.get(address)
+        if v is None:
+            return []
+        delegates = self._voter_indices[self._voter_indptr[v]:self._voter_indptr[v + 1]]
+        return [self._delegates[d] for d in delegates]
+
+    def balance(self, address: Address) -> Amount:
+        return Amount(self._balances[self._voter_index[address]])
+
+    def weights(self) -> Dict[PublicKey, Amount]:
+        """
+        Return the total vote weight (sum of the balances of the voters) of every delegate.
+        """
+        self._compact()
+        sums = np.zeros(len(self._indices) + 1, dtype=np.int64)
+        np.cumsum(self._balances[self._indices], out=sums[1:])
+        totals = sums[self._indptr[1:]] - sums[self._indptr[:-1]]
+        return {pk: Amount(t) for (pk, t) in zip(self._delegates, totals.tolist())}
+
+    def weight_of(self, public_key: PublicKey) -> Amount:
+        return Amount(sum(b for (_, b) in self.voters_of(public_key)))
+
+    def apply(self, event: BlockEvent):
+        if isinstance(event, BlockApplied):
+            self.apply_block(event.block)
+        else:
+            self.revert_block(event.block)
+
+    def apply_block(self, block: BlockInfo):
+        self._update(block, 1)
+
+    def revert_block(self, block: BlockInfo):
+        self._update(block, -1)
+
+    def _update(self, block: BlockInfo, sign: int):
+        for (address, delta, _) in block_balance_deltas(block):
+            v = self._voter_index.get(address)
+            if v is not None:
+                self._balances[v] += sign * delta
+
+        # New voters get their balance after the block (or before it, when reverting)
+        height = block.height if sign > 0 else block.height - 1
+        infos = block.transactions if sign > 0 else reversed(block.transactions)
+        for info in infos:
+            tx = info.tx
+            if not isinstance(tx, VoteTx):
+                continue
+            v = self._intern_voter(tx.sender_public_key.derive_address(), height)
+            for (public_keys, added) in ((tx.remove_votes, False), (tx.add_votes, True)):
+                for public_key in public_keys:
+                    d = self._intern_delegate(public_key)
+                    self._edits.append((d << _SHIFT | v, added == (sign > 0)))
@@ -0,0 +1,505 @@
+"""
+Load generator for measuring the transaction throughput of a RISE node.
+
+Derives a number of sender accounts from passphrases, pre-signs SendTx transactions between
+them in parallel and submits them through TransactionsAPI.add_transactions, either at a
+target rate or as fast as the node accepts them. At the end it reports the accepted and
+rejected counts, the submission latency percentiles and the end-to-end latency until the
+transactions were included in a block.
+
+The sender accounts need to be funded on the node beforehand. With --stub the transactions
+are sent to an in-process StubNode instead, which is useful for testing the tool itself and
+for measuring the client side of the pipeline.
+
+For example:
+
+    rise-loadgen --node http://127.0.0.1:5566 --senders 10 --count 5000 --rate 200
+"""
+import argparse
+import functools
+import hashlib
+import itertools
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Dict, IO, Iterator, List, NamedTuple, Optional, Sequence
+from urllib.parse import urlparse
+from risesdk.protocol import (
+    Amount,
+    BaseTx,
+    Keyring,
+    PublicKey,
+    SecretKey,
+    SendTx,
+    Signer,
+    Timestamp,
+)
+from risesdk.api import (
+    Client,
+    BlockFollower,
+    ConfirmationTracker,
+    SubmissionPipeline,
+    TransactionRejectedError,
+)
+
+STUB_URL = 'http://stub'
+
+
+class _StubResponse(object):
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class StubNode(object):
+    """
+    In-process stand-in for a RISE node, usable as the requests session of a Client.
+
+    The stub accepts every transaction it hasn't seen before (without validating signatures
+    or balances) and forges a block with the pending transactions every block_time seconds.
+    It serves just enough of the API for submitting transactions and following blocks.
+    latency adds a fixed delay to every request.
+    """
+    block_time: float
+    latency: float
+
+    def __init__(self, block_time: float = 2.0, latency: float = 0.0):
+        self.block_time = block_time
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._blocks: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._seen: set = set()
+        self._generator = SecretKey.from_passphrase('stub').derive_public_key()
+        self._forge()
+        self._next_block = time.monotonic() + block_time
+
+    def get(self, url: str, params: Any = None) -> _StubResponse:
+        return self._dispatch('GET', url, params)
+
+    def put(self, url: str, json: Any = None) -> _StubResponse:
+        return self._dispatch('PUT', url, json)
+
+    def post(self, url: str, json: Any = None) -> _StubResponse:
+        return self._dispatch('POST', url, json)
+
+    def _dispatch(self, method: str, url: str, data: Any) -> _StubResponse:
+        if self.latency:
+            time.sleep(self.latency)
+        path = urlparse(url).path
+        params = {k: v for (k, v) in (data or {}).items() if v is not None}
+        name = '_{}_{}'.format(method.lower(), path.strip('/').replace('/', '_'))
+        handler = getattr(self, name, None)
+        if handler is None:
+            return _StubResponse({'success': False, 'error': 'Unknown endpoint {}'.format(path)})
+        with self._lock:
+            while time.monotonic() >= self._next_block:
+                self._forge()
+                self._next_block += self.block_time
+            try:
+                result = handler(params)
+            except LookupError as err:
+                return _StubResponse({'success': False, 'error': err.args[0]})
+        return _StubResponse({'success': True, **result})
+
+    @property
+    def height(self) -> int:
+        return len(self._blocks)
+
+    def _forge(self):
+        (txs, self._pending) = (self._pending, [])
+        previous = self._blocks[-1]['id'] if self._blocks else None
+        height = self.height + 1
+        payload = b''.join(bytes.fromhex(t['signature']) for t in txs)
+        block_id = str(int.from_bytes(
+            hashlib.sha256('{}:{}'.format(previous, height).encode() + payload).digest()[:8],
+            'little'))
+        block = {
+            'id': block_id,
+            'version': 0,
+            'timestamp': Timestamp.now(),
+            'height': height,
+            'previousBlock': previous,
+            'numberOfTransactions': len(txs),
+            'totalAmount': sum(int(t['amount']) for t in txs),
+            'totalFee': sum(int(t['fee']) for t in txs),
+            'reward': 0,
+            'payloadLength': len(payload),
+            'payloadHash': hashlib.sha256(payload).hexdigest(),
+            'generatorPublicKey': self._generator.hex(),
+            'blockSignature': '00' * 64,
+            'transactions': [{**t, 'height': height, 'blockId': block_id} for t in txs],
+        }
+        self._blocks.append(block)
+        self._by_id[block_id] = block
+
+    def _raw_block(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        confirmations = self.height - block['height'] + 1
+        return {
+            **block,
+            'transactions': [
+                {**t, 'confirmations': confirmations} for t in block['transactions']
+            ],
+        }
+
+    def _get_blocks_getStatus(self, params) -> Dict:
+        return {
+            'broadhash': self._blocks[-1]['payloadHash'],
+            'epoch': '2016-05-24T17:00:00.000Z',
+            'fee': 10000000,
+            'height': self.height,
+            'milestone': 0,
+            'nethash': '00' * 32,
+            'reward': 0,
+            'supply': 10000000000000000,
+        }
+
+    def _get_blocks_getFees(self, params) -> Dict:
+        return {
+            'fees': {
+                'send': 10000000,
+                'vote': 100000000,
+                'secondsignature': 500000000,
+                'delegate': 2500000000,
+                'multisignature': 500000000,
+                'dapp': 2500000000,
+            },
+            'fromHeight': 1,
+            'toHeight': None,
+            'height': int(params.get('height', self.height)),
+        }
+
+    def _get_blocks(self, params) -> Dict:
+        blocks = self._blocks
+        if 'height' in params:
+            blocks = [b for b in blocks if b['height'] == int(params['height'])]
+        if 'previousBlock' in params:
+            blocks = [b for b in blocks if b['previousBlock'] == params['previousBlock']]
+        (field, _, direction) = params.get('orderBy', 'height:desc').partition(':')
+        blocks = sorted(blocks, key=lambda b: b[field], reverse=direction == 'desc')
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 100))
+        return {
+            'blocks': [self._raw_block(b) for b in blocks[offset:offset + limit]],
+            'count': len(blocks),
+        }
+
+    def _get_blocks_get(self, params) -> Dict:
+        block = self._by_id.get(params['id'])
+        if block is None:
+            raise LookupError('Block not found')
+        return {'block': self._raw_block(block)}
+
+    def _put_transactions(self, data) -> Dict:
+        accepted = []
+        invalid = []
+        for raw in data['transactions']:
+            tx_id = str(raw['id'])
+            if tx_id in self._seen:
+                invalid.append({'id': tx_id, 'reason': 'Transaction is already processed'})
+            elif not raw.get('signature'):
+                invalid.append({'id': tx_id, 'reason': 'Missing signature'})
+            else:
+                self._seen.add(tx_id)
+                self._pending.append(raw)
+                accepted.append(tx_id)
+        return {'accepted': accepted, 'invalid': invalid}
+
+
+class LoadReport(NamedTuple):
+    submitted: int
+    accepted: int
+    rejected: int
+    failed: int
+    confirmed: int
+    # Seconds from the first to the last submission result
+    duration: float
+    # Seconds from submit() to the node's answer, for the accepted transactions
+    latencies: List[float]
+    # Seconds from submit() to the inclusion in a block
+    confirmation_latencies: List[float]
+    reasons: Counter
+
+    @property
+    def throughput(self) -> float:
+        return self.accepted / self.duration if self.duration > 0 else 0.0
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """
+    Return the p-th percentile of the values with the nearest-rank method.
+
+    >>> percentile([4, 1, 3, 2], 50)
+    2
+    >>> percentile([4, 1, 3, 2], 99)
+    4
+    """
+    if not values:
+        raise ValueError('No values')
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+def sender_keys(count: int, prefix: str = 'loadgen') -> List[SecretKey]:
+    """
+    Derive the secret keys of the sender accounts from the passphrases '<prefix> <i>'.
+    """
+    return [SecretKey.from_passphrase('{} {}'.format(prefix, i)) for i in range(count)]
+
+
+def _unsigned(
+    public_keys: Sequence[PublicKey],
+    count: int,
+    amount: Amount,
+    fee: Amount,
+    timestamp: Timestamp,
+) -> Iterator[List[SendTx]]:
+    # Every sender sends to the next one. The amounts differ by one raw so that the otherwise
+    # identical transactions get different ids.
+    addresses = [pk.derive_address() for pk in public_keys]
+    n = len(public_keys)
+    for (i, pk) in enumerate(public_keys):
+        yield [
+            SendTx(
+                sender_public_key=pk,
+                recipient=addresses[(i + 1) % n],
+                amount=Amount(amount + j),
+                fee=fee,
+                timestamp=timestamp,
+            )
+            for j in range(count // n + (1 if i < count % n else 0))
+        ]
+
+
+def presign(
+    keys: Sequence[SecretKey],
+    count: int,
+    amount: Amount,
+    fee: Amount,
+    timestamp: Optional[Timestamp] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[SendTx]:
+    """
+    Create and sign count transactions between the senders, interleaved by sender.
+
+    The transactions are signed with Keyring.sign_many(), in chunks of chunk_size.
+    """
+    if not keys:
+        raise ValueError('At least one sender is needed')
+    if timestamp is None:
+        timestamp = Timestamp.now()
+    keyring = Keyring(Signer(k) for k in keys)
+    public_keys = [signer.public_key for signer in keyring]
+    per_sender = list(_unsigned(public_keys, count, amount, fee, timestamp))
+    interleaved = itertools.zip_longest(*per_sender)
+    txs = [tx for row in interleaved for tx in row if tx is not None]
+    return keyring.sign_many(txs, workers, chunk_size)
+
+
+class LoadGenerator(object):
+    """
+    Submits pre-signed transactions through a SubmissionPipeline and measures the results.
+
+    rate is the target number of transactions per second; with None, the transactions are
+    submitted as fast as the pipeline takes them. The inclusion of the accepted transactions
+    is followed with a BlockFollower and a ConfirmationTracker, polling every poll_interval
+    seconds, for up to confirm_timeout seconds after the last submission.
+    """
+    rate: Optional[float]
+    poll_interval: float
+    confirm_timeout: float
+
+    def __init__(
+        self,
+        client: Client,
+        rate: Optional[float] = None,
+        batch_size: int = 25,
+        max_in_flight: int = 4,
+        poll_interval: float = 1.0,
+        confirm_timeout: float = 120.0,
+    ):
+        self._client = client
+        self.rate = rate
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.confirm_timeout = confirm_timeout
+
+    def _follow(self, tracker: ConfirmationTracker, stop: threading.Event):
+        follower = BlockFollower(self._client, poll_interval=self.poll_interval)
+        while True:
+            for event in follower.poll():
+                tracker.apply(event)
+            if stop.wait(self.poll_interval):
+                return
+
+    def run(self, txs: Sequence[BaseTx]) -> LoadReport:
+        tracker = ConfirmationTracker()
+        stop = threading.Event()
+        follower = threading.Thread(target=self._follow, args=(tracker, stop), daemon=True)
+        follower.start()
+
+        lock = threading.Lock()
+        latencies: List[float] = []
+        confirmation_latencies: List[float] = []
+        reasons: Counter = Counter()
+        counts: Counter = Counter()
+        finished = [0.0]
+
+        def on_result(started: float, confirmed: Future, future: Future):
+            now = time.monotonic()
+            exc = future.exception()
+            with lock:
+                finished[0] = max(finished[0], now)
+                if exc is None:
+                    counts['accepted'] += 1
+                    latencies.append(now - started)
+                elif isinstance(exc, TransactionRejectedError):
+                    counts['rejected'] += 1
+                    reasons[exc.reason] += 1
+                else:
+                    counts['failed'] += 1
+                    reasons[str(exc)] += 1
+            if exc is None:
+                # Outside of the lock, as the callback runs right away when already confirmed
+                confirmed.add_done_callback(functools.partial(on_confirmed, started))
+
+        def on_confirmed(started: float, future: Future):
+            if not future.cancelled() and future.exception() is None:
+                with lock:
+                    confirmation_latencies.append(time.monotonic() - started)
+
+        begin = time.monotonic()
+        with SubmissionPipeline(
+            self._client,
+            batch_size=self._batch_size,
+            max_in_flight=self._max_in_flight,
+        ) as pipeline:
+            for (i, tx) in enumerate(txs):
+                if self.rate:
+                    delay = begin + i / self.rate - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                # Track before submitting, so that a quick inclusion can't be missed
+                confirmed = tracker.track(tx)
+                started = time.monotonic()
+                future = pipeline.submit(tx)
+                future.add_done_callback(functools.partial(on_result, started, confirmed))
+
+        deadline = time.monotonic() + self.confirm_timeout
+        while time.monotonic() < deadline:
+            with lock:
+                if len(confirmation_latencies) >= counts['accepted']:
+                    break
+            time.sleep(min(self.poll_interval, 0.1))
+        stop.set()
+        follower.join()
+
+        with lock:
+            return LoadReport(
+                submitted=len(txs),
+                accepted=counts['accepted'],
+                rejected=counts['rejected'],
+                failed=counts['failed'],
+                confirmed=len(confirmation_latencies),
+                duration=max(0.0, finished[0] - begin),
+                latencies=list(latencies),
+                confirmation_latencies=list(confirmation_latencies),
+                reasons=Counter(reasons),
+            )
+
+
+def print_report(report: LoadReport, out: Optional[IO[str]] = None):
+    if out is None:
+        out = sys.stdout
+    print('submitted   {}'.format(report.submitted), file=out)
+    print('accepted    {}'.format(report.accepted), file=out)
+    print('rejected    {}'.format(report.rejected), file=out)
+    print('failed      {}'.format(report.failed), file=out)
+    print('confirmed   {}'.format(report.confirmed), file=out)
+    print('duration    {:.2f} s'.format(report.duration), file=out)
+    print('throughput  {:.1f} tx/s'.format(report.throughput), file=out)
+    for (name, values) in (
+        ('latency', report.latencies),
+        ('confirmation', report.confirmation_latencies),
+    ):
+        if values:
+            print('{:<11} {}'.format(name, '  '.join(
+                'p{}={:.3f}s'.format(p, percentile(values, p)) for p in (50, 90, 99, 100)
+            )), file=out)
+    for (reason, count) in report.reasons.most_common(5):
+        print('  {} x {}'.format(count, reason), file=out)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='rise-loadgen',
+        description='Measure the transaction submission throughput of a RISE node.',
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--node', default='http://127.0.0.1:5566',
+                        help='base URL of the node (default: %(default)s)')
+    target.add_argument('--stub', action='store_true',
+                        help='send the transactions to an in-process stub node')
+    parser.add_argument('--senders', type=int, default=10,
+                        help='number of sender accounts (default: %(default)s)')
+    parser.add_argument('--passphrase-prefix', default='loadgen',
+                        help='sender passphrases are "<prefix> <i>" (default: %(default)s)')
+    parser.add_argument('--count', type=int, default=1000,
+                        help='number of transactions (default: %(default)s)')
+    parser.add_argument('--amount', type=int, default=1,
+                        help='amount of each transaction in raws (default: %(default)s)')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='target transactions per second (default: as fast as possible)')
+    parser.add_argument('--batch-size', type=int, default=25,
+                        help='transactions per request (default: %(default)s)')
+    parser.add_argument('--max-in-flight', type=int, default=4,
+                        help='concurrent requests (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='signing processes (default: number of CPUs)')
+    parser.add_argument('--poll-interval', type=float, default=1.0,
+                        help='seconds between block polls (default: %(default)s)')
+    parser.add_argument('--confirm-timeout', type=float, default=120.0,
+                        help='seconds to wait for inclusion (default: %(default)s)')
+    parser.add_argument('--stub-block-time', type=float, default=2.0,
+                        help='block time of the stub node (default: %(default)s)')
+    parser.add_argument('--stub-latency', type=float, default=0.0,
+                        help='delay of every stub node request (default: %(default)s)')
+    args = parser.parse_args(argv)
+    if args.senders < 1 or args.count < 1:
+        parser.error('--senders and --count must be positive')
+
+    if args.stub:
+        session: Any = StubNode(block_time=args.stub_block_time, latency=args.stub_latency)
+        client = Client(STUB_URL, session=session)
+    else:
+        client = Client(args.node)
+
+    fee = client.blocks.get_fees().fees.send
+    keys = sender_keys(args.senders, args.passphrase_prefix)
+    started = time.monotonic()
+    txs = presign(keys, args.count, Amount(args.amount), fee, workers=args.workers)
+    print('signed {} transactions from {} senders in {:.2f} s'.format(
+        len(txs), len(keys), time.monotonic() - started))
+
+    generator = LoadGenerator(
+        client,
+        rate=args.rate,
+        batch_size=args.batch_size,
+        max_in_flight=args.max_in_flight,
+        poll_interval=args.poll_interval,
+        confirm_timeout=args.confirm_timeout,
+    )
+    print_report(generator.run(txs))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
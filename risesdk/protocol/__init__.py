@@ -15,6 +15,18 @@ from risesdk.protocol.transactions import (
     VoteTx,
 )
 
+from risesdk.protocol.signer import (
+    Signer,
+    Keyring,
+    verify_many,
+)
+
+from risesdk.protocol.blocks import (
+    BlockHeader,
+    BlockVerification,
+    verify_blocks,
+)
+
 __all__ = [
     'Timestamp',
     'Amount',
@@ -27,4 +39,10 @@ __all__ = [
     'RegisterSecondSignatureTx',
     'RegisterDelegateTx',
     'VoteTx',
+    'Signer',
+    'Keyring',
+    'verify_many',
+    'BlockHeader',
+    'BlockVerification',
+    'verify_blocks',
 ]
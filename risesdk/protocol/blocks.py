@@ -0,0 +1,202 @@
+import hashlib
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from risesdk.protocol.primitives import Timestamp, Amount, PublicKey, SecretKey, Signature
+from risesdk.protocol.transactions import BaseTx
+from risesdk.protocol.signer import verify_many
+
+
+class BlockHeader(object):
+    """
+    The signed fields of a block, as used for the block id and the generator signature.
+    """
+    version: int
+    timestamp: Timestamp
+    previous_block_id: Optional[str]
+    number_of_transactions: int
+    total_amount: Amount
+    total_fee: Amount
+    reward: Amount
+    payload_length: int
+    payload_hash: bytes
+    generator_public_key: PublicKey
+    block_signature: Optional[Signature]
+
+    def __init__(
+        self,
+        version: int,
+        timestamp: Timestamp,
+        previous_block_id: Optional[str],
+        number_of_transactions: int,
+        total_amount: Amount,
+        total_fee: Amount,
+        reward: Amount,
+        payload_length: int,
+        payload_hash: bytes,
+        generator_public_key: PublicKey,
+        block_signature: Optional[Signature] = None,
+    ):
+        self.version = version
+        self.timestamp = timestamp
+        self.previous_block_id = previous_block_id
+        self.number_of_transactions = number_of_transactions
+        self.total_amount = total_amount
+        self.total_fee = total_fee
+        self.reward = reward
+        self.payload_length = payload_length
+        self.payload_hash = payload_hash
+        self.generator_public_key = generator_public_key
+        self.block_signature = block_signature
+
+    @staticmethod
+    def for_transactions(
+        txs: Sequence[BaseTx],
+        timestamp: Timestamp,
+        previous_block_id: Optional[str],
+        reward: Amount,
+        generator_public_key: PublicKey,
+        version: int = 0,
+    ) -> 'BlockHeader':
+        """
+        Create the (unsigned) header of a block with the transactions.
+        """
+        (payload_length, payload_hash) = derive_payload(txs)
+        return BlockHeader(
+            version=version,
+            timestamp=timestamp,
+            previous_block_id=previous_block_id,
+            number_of_transactions=len(txs),
+            total_amount=Amount(sum(tx._amount for tx in txs)),
+            total_fee=Amount(sum(tx.fee for tx in txs)),
+            reward=reward,
+            payload_length=payload_length,
+            payload_hash=payload_hash,
+            generator_public_key=generator_public_key,
+        )
+
+    def to_bytes(self, skip_signature: bool = False) -> bytes:
+        """
+        Serialize the block header to binary format.
+
+        The header without the signature is what the generator signs, the header with the
+        signature is hashed into the block id.
+        """
+        buf = bytearray()
+        buf += self.version.to_bytes(4, byteorder='little')
+        buf += self.timestamp.to_bytes(4, byteorder='little')
+        if self.previous_block_id:
+            buf += int(self.previous_block_id).to_bytes(8, byteorder='big')
+        else:
+            buf += bytes(8)
+        buf += self.number_of_transactions.to_bytes(4, byteorder='little')
+        buf += self.total_amount.to_bytes(8, byteorder='little')
+        buf += self.total_fee.to_bytes(8, byteorder='little')
+        buf += self.reward.to_bytes(8, byteorder='little')
+        buf += self.payload_length.to_bytes(4, byteorder='little')
+        buf += self.payload_hash
+        buf += self.generator_public_key
+        if not skip_signature and self.block_signature:
+            buf += self.block_signature
+        return bytes(buf)
+
+    def derive_id(self) -> str:
+        """
+        Compute the block id from the signed header.
+        """
+        digest = hashlib.sha256(self.to_bytes()).digest()
+        return str(int.from_bytes(digest[:8], byteorder='little'))
+
+    def sign(self, secret: SecretKey) -> Signature:
+        """
+        Sign the header with the secret of the generator, filling in block_signature.
+        """
+        self.block_signature = secret.sign(self.to_bytes(skip_signature=True))
+        return self.block_signature
+
+    def verify_signature(self) -> bool:
+        if not self.block_signature:
+            return False
+        return self.generator_public_key.verify(
+            self.block_signature, self.to_bytes(skip_signature=True))
+
+
+def derive_payload(txs: Iterable[BaseTx]) -> Tuple[int, bytes]:
+    """
+    Compute the payload length and hash of the transactions, in block order.
+    """
+    payload = hashlib.sha256()
+    length = 0
+    for tx in txs:
+        data = tx.to_bytes()
+        payload.update(data)
+        length += len(data)
+    return (length, payload.digest())
+
+
+class BlockVerification(NamedTuple):
+    block_id: str
+    # The id matches the signed header
+    valid_id: bool
+    # The transaction count, totals, payload length and payload hash match the transactions
+    valid_payload: bool
+    # The header is signed by the generator
+    valid_signature: bool
+    # Ids of the transactions with an invalid (first) signature, when those were checked
+    invalid_transactions: List[str]
+
+    @property
+    def valid(self) -> bool:
+        return (self.valid_id and self.valid_payload and self.valid_signature
+                and not self.invalid_transactions)
+
+
+def verify_blocks(
+    blocks: Iterable[Tuple[str, BlockHeader, Sequence[BaseTx]]],
+    transactions: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[BlockVerification]:
+    """
+    Verify (block id, header, transactions) triples against each other.
+
+    The id, payload and totals are checked in the current process; the generator signatures
+    (and with transactions=True, the signatures of the transactions) are checked in one
+    verify_many() call, which spreads large batches over a pool of worker processes. The
+    transactions have to be in the order of the block payload.
+    """
+    checks = []
+    items: List[Tuple[PublicKey, Signature, bytes]] = []
+    for (block_id, header, txs) in blocks:
+        (payload_length, payload_hash) = derive_payload(txs)
+        valid_payload = (
+            header.number_of_transactions == len(txs)
+            and header.total_amount == sum(tx._amount for tx in txs)
+            and header.total_fee == sum(tx.fee for tx in txs)
+            and header.payload_length == payload_length
+            and header.payload_hash == payload_hash
+        )
+        signed = header.block_signature is not None
+        if header.block_signature is not None:
+            items.append((
+                header.generator_public_key,
+                header.block_signature,
+                header.to_bytes(skip_signature=True),
+            ))
+        tx_ids = []
+        if transactions:
+            for tx in txs:
+                tx_ids.append(tx.derive_id())
+                items.append((
+                    tx.sender_public_key,
+                    tx.signature or Signature(bytes(64)),
+                    tx.to_bytes(skip_signature=True, skip_second_signature=True),
+                ))
+        checks.append((block_id, header.derive_id() == block_id, valid_payload, signed, tx_ids))
+
+    results = iter(verify_many(items, workers=workers, chunk_size=chunk_size))
+    verified = []
+    for (block_id, valid_id, valid_payload, signed, tx_ids) in checks:
+        valid_signature = next(results) if signed else False
+        invalid = [tx_id for tx_id in tx_ids if not next(results)]
+        verified.append(BlockVerification(
+            block_id, valid_id, valid_payload, valid_signature, invalid))
+    return verified
@@ -0,0 +1,277 @@
+import hashlib
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+import ed25519
+from risesdk.protocol.primitives import PublicKey, SecretKey, Signature
+from risesdk.protocol.transactions import BaseTx
+
+# Signing keys of the worker processes, expanded once per secret
+_signing_keys: Dict[bytes, ed25519.SigningKey] = {}
+
+# (secret, second secret) of a sender, as sent to the worker processes
+_KeyPair = Tuple[bytes, Optional[bytes]]
+
+T = TypeVar('T', bound=BaseTx)
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(items)
+    return iter(lambda: list(itertools.islice(it, size)), [])
+
+
+def _map_chunks(
+    func: Callable[..., Any],
+    chunks: Iterator[List[Any]],
+    args_of: Callable[[List[Any]], Tuple],
+    workers: Optional[int],
+) -> Iterator[Tuple[List[Any], Any]]:
+    """
+    Run func(*args_of(chunk)) for every chunk in a process pool, yielding the chunks in order
+    along with the results.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of chunks in flight so that streams aren't read ahead
+        limit = 2 * workers
+        pending: Deque[Tuple[List[Any], Future]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(func, *args_of(chunk))))
+            if len(pending) >= limit:
+                (done, future) = pending.popleft()
+                yield (done, future.result())
+        while pending:
+            (done, future) = pending.popleft()
+            yield (done, future.result())
+
+
+def _signing_key(secret: bytes) -> ed25519.SigningKey:
+    sk = _signing_keys.get(secret)
+    if sk is None:
+        sk = _signing_keys[secret] = ed25519.SigningKey(secret)
+    return sk
+
+
+def _sign(
+    sk: ed25519.SigningKey,
+    sk2: Optional[ed25519.SigningKey],
+    msg: bytes,
+) -> Tuple[bytes, Optional[bytes]]:
+    sig = sk.sign(hashlib.sha256(msg).digest())
+    sig2 = None
+    if sk2 is not None:
+        # The second signature covers the transaction including the first signature
+        sig2 = sk2.sign(hashlib.sha256(msg + sig).digest())
+    return (sig, sig2)
+
+
+def _sign_chunk(
+    keys: List[_KeyPair],
+    messages: List[Tuple[int, bytes]],
+) -> List[Tuple[bytes, Optional[bytes]]]:
+    expanded = [
+        (_signing_key(secret), None if second is None else _signing_key(second))
+        for (secret, second) in keys
+    ]
+    return [_sign(*expanded[i], msg) for (i, msg) in messages]
+
+
+class Signer(object):
+    """
+    Signs transactions of one account, optionally with a second signature.
+
+    The ed25519 signing keys are expanded once, when the signer is created, instead of on
+    every SecretKey.sign() call. sign_tx() serialises the transaction once for both of the
+    signatures.
+    """
+    public_key: PublicKey
+    second_public_key: Optional[PublicKey]
+
+    def __init__(self, secret: SecretKey, second_secret: Optional[SecretKey] = None):
+        self._secret = bytes(secret)
+        self._second_secret = None if second_secret is None else bytes(second_secret)
+        self._sk = ed25519.SigningKey(self._secret)
+        self.public_key = PublicKey(self._sk.get_verifying_key().to_bytes())
+        self._sk2: Optional[ed25519.SigningKey] = None
+        self.second_public_key = None
+        if self._second_secret is not None:
+            self._sk2 = ed25519.SigningKey(self._second_secret)
+            self.second_public_key = PublicKey(self._sk2.get_verifying_key().to_bytes())
+
+    def sign(self, message: bytes) -> Signature:
+        """
+        Sign the message with the (first) secret, like SecretKey.sign().
+        """
+        return Signature(self._sk.sign(hashlib.sha256(message).digest()))
+
+    def sign_tx(self, tx: T) -> T:
+        """
+        Fill in the signature (and second signature) of the transaction and return it.
+        """
+        if tx.sender_public_key != self.public_key:
+            raise ValueError('Transaction is not sent by {}'.format(self.public_key.hex()))
+        msg = tx.to_bytes(skip_signature=True, skip_second_signature=True)
+        _apply(tx, _sign(self._sk, self._sk2, msg))
+        return tx
+
+    def sign_many(
+        self,
+        txs: Iterable[T],
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> List[T]:
+        """
+        Sign the transactions in a pool of worker processes, see Keyring.sign_iter().
+        """
+        return Keyring([self]).sign_many(txs, workers, chunk_size)
+
+    def sign_iter(
+        self,
+        txs: Iterable[T],
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[T]:
+        return Keyring([self]).sign_iter(txs, workers, chunk_size)
+
+
+class Keyring(object):
+    """
+    Signers of many accounts, looked up by the sender of the transaction.
+
+    sign_many() and sign_iter() split the transactions into chunks of chunk_size and sign them
+    in a pool of worker processes (workers defaults to the number of CPUs). Every worker
+    expands the signing keys of an account only once. Input that fits in a single chunk, or
+    workers=1, is signed in the current process.
+    """
+
+    def __init__(self, signers: Iterable[Signer] = ()):
+        self._signers: Dict[PublicKey, Signer] = {}
+        for signer in signers:
+            self._signers[signer.public_key] = signer
+
+    def add(self, secret: SecretKey, second_secret: Optional[SecretKey] = None) -> Signer:
+        signer = Signer(secret, second_secret)
+        self._signers[signer.public_key] = signer
+        return signer
+
+    def __len__(self) -> int:
+        return len(self._signers)
+
+    def __contains__(self, public_key: PublicKey) -> bool:
+        return public_key in self._signers
+
+    def __getitem__(self, public_key: PublicKey) -> Signer:
+        return self._signers[public_key]
+
+    def __iter__(self) -> Iterator[Signer]:
+        return iter(self._signers.values())
+
+    def _signer_of(self, tx: BaseTx) -> Signer:
+        signer = self._signers.get(tx.sender_public_key)
+        if signer is None:
+            raise ValueError('No signer for sender {}'.format(tx.sender_public_key.hex()))
+        return signer
+
+    def sign_tx(self, tx: T) -> T:
+        return self._signer_of(tx).sign_tx(tx)
+
+    def sign_many(
+        self,
+        txs: Iterable[T],
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> List[T]:
+        return list(self.sign_iter(txs, workers, chunk_size))
+
+    def sign_iter(
+        self,
+        txs: Iterable[T],
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[T]:
+        """
+        Sign the transactions, yielding them in order as they're signed.
+
+        The input is consumed lazily, with a bounded number of chunks in flight.
+        """
+        chunks = _chunks(txs, chunk_size)
+        head = list(itertools.islice(chunks, 2))
+        if workers == 1 or len(head) < 2:
+            for chunk in itertools.chain(head, chunks):
+                for tx in chunk:
+                    yield self.sign_tx(tx)
+            return
+
+        for (chunk, signatures) in _map_chunks(
+            _sign_chunk, itertools.chain(head, chunks), self._chunk_args, workers):
+            yield from _apply_all(chunk, signatures)
+
+    def _chunk_args(self, chunk: Sequence[BaseTx]) -> Tuple[List[_KeyPair], List[Tuple[int, bytes]]]:
+        keys: List[_KeyPair] = []
+        index: Dict[PublicKey, int] = {}
+        messages = []
+        for tx in chunk:
+            signer = self._signer_of(tx)
+            i = index.get(signer.public_key)
+            if i is None:
+                i = index[signer.public_key] = len(keys)
+                keys.append((signer._secret, signer._second_secret))
+            messages.append((i, tx.to_bytes(skip_signature=True, skip_second_signature=True)))
+        return (keys, messages)
+
+
+def _apply(tx: BaseTx, signatures: Tuple[bytes, Optional[bytes]]):
+    (sig, sig2) = signatures
+    tx.signature = Signature(sig)
+    tx.second_signature = None if sig2 is None else Signature(sig2)
+
+
+def _apply_all(
+    chunk: List[T],
+    signatures: List[Tuple[bytes, Optional[bytes]]],
+) -> Iterator[T]:
+    for (tx, s) in zip(chunk, signatures):
+        _apply(tx, s)
+        yield tx
+
+
+def _verify(public_key: bytes, signature: bytes, message: bytes) -> bool:
+    try:
+        ed25519.VerifyingKey(public_key).verify(signature, hashlib.sha256(message).digest())
+        return True
+    except ed25519.BadSignatureError:
+        return False
+
+
+def _verify_chunk(items: List[Tuple[bytes, bytes, bytes]]) -> List[bool]:
+    return [_verify(*item) for item in items]
+
+
+def verify_many(
+    items: Iterable[Tuple[PublicKey, Signature, bytes]],
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+) -> List[bool]:
+    """
+    Verify many (public key, signature, message) items, returning whether each is valid.
+
+    The checks are the same as PublicKey.verify(), so the messages are hashed before being
+    verified. The items are verified in chunks of chunk_size in a pool of worker processes
+    (workers defaults to the number of CPUs), or in the current process when they fit in a
+    single chunk or workers=1.
+    """
+    chunks = _chunks(
+        ((bytes(pk), bytes(sig), bytes(msg)) for (pk, sig, msg) in items), chunk_size)
+    head = list(itertools.islice(chunks, 2))
+    results: List[bool] = []
+    if workers == 1 or len(head) < 2:
+        for chunk in itertools.chain(head, chunks):
+            results += _verify_chunk(chunk)
+        return results
+
+    for (_, valid) in _map_chunks(
+        _verify_chunk, itertools.chain(head, chunks), lambda chunk: (chunk,), workers):
+        results += valid
+    return results
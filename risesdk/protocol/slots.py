@@ -0,0 +1,83 @@
+import hashlib
+from typing import List
+from risesdk.protocol.primitives import PublicKey, Timestamp
+
+# Seconds between two consecutive blocks
+BLOCK_TIME = 30
+
+# Number of delegates that forge blocks in a round
+ACTIVE_DELEGATES = 101
+
+
+def slot_number(timestamp: Timestamp) -> int:
+    """
+    Return the number of the forging slot that the timestamp falls into.
+
+    >>> slot_number(Timestamp(95))
+    3
+    """
+    return int(timestamp) // BLOCK_TIME
+
+
+def slot_time(slot: int) -> Timestamp:
+    """
+    Return the timestamp at which the forging slot starts.
+
+    Blocks are stamped with the start time of the slot they were forged in.
+
+    >>> slot_time(3)
+    90
+    """
+    return Timestamp(slot * BLOCK_TIME)
+
+
+def next_slot_time(timestamp: Timestamp) -> Timestamp:
+    """
+    Return the start time of the slot that follows the one of the timestamp.
+
+    >>> next_slot_time(Timestamp(90))
+    120
+    """
+    return slot_time(slot_number(timestamp) + 1)
+
+
+def round_of(height: int) -> int:
+    """
+    Return the delegate round that the block at the height belongs to.
+
+    >>> round_of(101), round_of(102)
+    (1, 2)
+    """
+    return (height + ACTIVE_DELEGATES - 1) // ACTIVE_DELEGATES
+
+
+def generate_delegate_list(round_number: int, public_keys: List[PublicKey]) -> List[PublicKey]:
+    """
+    Shuffle the active delegates into the forging order of the round.
+
+    The public keys must be ordered the way the node ranks the delegates (by vote, descending).
+    The order is seeded with the SHA-256 hash of the round number, which is re-hashed after
+    every group of four swaps. Like the node, the index is advanced once more after each group
+    so that every fifth position is not swapped by its own group.
+    """
+    delegates = list(public_keys)
+    count = len(delegates)
+    seed = hashlib.sha256(str(round_number).encode('utf8')).digest()
+    i = 0
+    while i < count:
+        x = 0
+        while x < 4 and i < count:
+            new_index = seed[x] % count
+            (delegates[new_index], delegates[i]) = (delegates[i], delegates[new_index])
+            i += 1
+            x += 1
+        i += 1
+        seed = hashlib.sha256(seed).digest()
+    return delegates
+
+
+def slot_delegate(slot: int, delegate_list: List[PublicKey]) -> PublicKey:
+    """
+    Return the delegate that is allowed to forge in the slot, given the order of the round.
+    """
+    return delegate_list[slot % len(delegate_list)]
@@ -1,10 +1,15 @@
 import hashlib
-from typing import Dict, Type, Optional, List
+from typing import Any, Dict, Type, Optional, List
 from abc import ABC, abstractmethod
 from risesdk.protocol.primitives import Timestamp, Amount, Address, PublicKey, Signature
 
 _tx_type_registry: Dict[int, Type['BaseTx']] = {}
 
+# Optional fields of the binary format, see BaseTx.bytes_flags()
+_HAS_SIGNATURE = 0x01
+_HAS_SECOND_SIGNATURE = 0x02
+_HAS_REQUESTER_PUBLIC_KEY = 0x04
+
 
 def transaction_type(type_id: int):
     """
@@ -77,6 +82,10 @@ class BaseTx(ABC):
     def _asset_json(self):
         raise NotImplementedError()
 
+    @classmethod
+    def _parse_bytes(cls, asset: bytes, recipient: Optional[Address], amount: Amount):
+        raise NotImplementedError('{} does not support from_bytes'.format(cls.__name__))
+
     @property
     def _recipient(self) -> Optional[Address]:
         return None
@@ -146,6 +155,100 @@ class BaseTx(ABC):
         except KeyError as err:
             raise ValueError('Data dictionary is missing "{}" item'.format(err.args[0]))
 
+    @staticmethod
+    def from_bytes(
+        data: bytes,
+        fee: Amount,
+        has_signature: bool = True,
+        has_second_signature: bool = False,
+        has_requester_public_key: bool = False,
+    ) -> 'BaseTx':
+        """
+        Deserialize the transaction from the binary format produced by to_bytes().
+
+        The binary format doesn't contain the fee, nor does it mark which of the optional fields
+        are present, so these have to be provided by the caller. Store them next to the bytes
+        (like TransactionArchive does with the fee and bytes_flags()) and use
+        from_bytes_with_flags() to parse them back.
+
+        Transaction types registered outside of this module that don't implement _parse_bytes()
+        raise NotImplementedError.
+        """
+        data = bytes(data)
+        if not data or data[0] not in _tx_type_registry:
+            raise ValueError('Data contains unknown transaction type')
+        cls = _tx_type_registry[data[0]]
+
+        offset = 1
+        requester_public_key = None
+        signature = None
+        second_signature = None
+        try:
+            timestamp = Timestamp(int.from_bytes(data[offset:offset + 4], byteorder='little'))
+            offset += 4
+            sender_public_key = PublicKey(data[offset:offset + 32])
+            offset += 32
+            if has_requester_public_key:
+                requester_public_key = PublicKey(data[offset:offset + 32])
+                offset += 32
+            recipient_id = int.from_bytes(data[offset:offset + 8], byteorder='big')
+            recipient = Address('{}R'.format(recipient_id)) if recipient_id else None
+            offset += 8
+            amount = Amount(int.from_bytes(data[offset:offset + 8], byteorder='little'))
+            offset += 8
+
+            end = len(data)
+            if has_second_signature:
+                second_signature = Signature(data[end - 64:end])
+                end -= 64
+            if has_signature:
+                signature = Signature(data[end - 64:end])
+                end -= 64
+            if end < offset:
+                raise ValueError('Data is too short')
+            asset = data[offset:end]
+        except ValueError as err:
+            raise ValueError('Invalid transaction bytes: {}'.format(err.args[0]))
+
+        base: Dict[str, Any] = {
+            'timestamp': timestamp,
+            'sender_public_key': sender_public_key,
+            'requester_public_key': requester_public_key,
+            'fee': fee,
+            'signature': signature,
+            'second_signature': second_signature,
+        }
+        return cls(**base, **cls._parse_bytes(asset, recipient, amount))
+
+    def bytes_flags(self) -> int:
+        """
+        Return which of the optional fields are present in the to_bytes() form, as an integer.
+
+        Store the flags (along with the fee) next to the binary form to parse it back with
+        from_bytes_with_flags().
+        """
+        flags = 0
+        if self.signature:
+            flags |= _HAS_SIGNATURE
+        if self.second_signature:
+            flags |= _HAS_SECOND_SIGNATURE
+        if self.requester_public_key:
+            flags |= _HAS_REQUESTER_PUBLIC_KEY
+        return flags
+
+    @staticmethod
+    def from_bytes_with_flags(data: bytes, fee: Amount, flags: int) -> 'BaseTx':
+        """
+        Deserialize the transaction from the binary format and the bytes_flags() of it.
+        """
+        return BaseTx.from_bytes(
+            data,
+            fee=fee,
+            has_signature=bool(flags & _HAS_SIGNATURE),
+            has_second_signature=bool(flags & _HAS_SECOND_SIGNATURE),
+            has_requester_public_key=bool(flags & _HAS_REQUESTER_PUBLIC_KEY),
+        )
+
     @staticmethod
     def from_json(data) -> 'BaseTx':
         """
@@ -223,6 +326,15 @@ class SendTx(BaseTx):
     def _recipient(self) -> Optional[Address]:
         return self.recipient
 
+    @classmethod
+    def _parse_bytes(cls, asset: bytes, recipient: Optional[Address], amount: Amount):
+        if recipient is None:
+            raise ValueError('Invalid transaction bytes: missing recipient')
+        return {
+            'recipient': recipient,
+            'amount': amount,
+        }
+
     @classmethod
     def parse_json(cls, data):
         base = super().parse_json(data)
@@ -273,6 +385,15 @@ class RegisterSecondSignatureTx(BaseTx):
             },
         }
 
+    @classmethod
+    def _parse_bytes(cls, asset: bytes, recipient: Optional[Address], amount: Amount):
+        try:
+            return {
+                'second_public_key': PublicKey(asset),
+            }
+        except ValueError as err:
+            raise ValueError('Invalid transaction bytes: {}'.format(err.args[0]))
+
     @classmethod
     def parse_json(cls, data):
         base = super().parse_json(data)
@@ -334,6 +455,12 @@ class RegisterDelegateTx(BaseTx):
             }
         }
 
+    @classmethod
+    def _parse_bytes(cls, asset: bytes, recipient: Optional[Address], amount: Amount):
+        return {
+            'username': asset.decode('utf8'),
+        }
+
     @classmethod
     def parse_json(cls, data):
         base = super().parse_json(data)
@@ -409,6 +536,25 @@ class VoteTx(BaseTx):
             ],
         }
 
+    @classmethod
+    def _parse_bytes(cls, asset: bytes, recipient: Optional[Address], amount: Amount):
+        add_votes: List[PublicKey] = []
+        remove_votes: List[PublicKey] = []
+        text = asset.decode('utf8')
+        # Each vote is a +/- sign followed by the hex encoded public key
+        for i in range(0, len(text), 65):
+            val = text[i:i + 65]
+            if val[0] == '-':
+                remove_votes.append(PublicKey.fromhex(val[1:]))
+            elif val[0] == '+':
+                add_votes.append(PublicKey.fromhex(val[1:]))
+            else:
+                raise ValueError('Invalid transaction bytes: malformed vote')
+        return {
+            'add_votes': add_votes,
+            'remove_votes': remove_votes,
+        }
+
     @classmethod
     def parse_json(cls, data):
         base = super().parse_json(data)
@@ -61,6 +61,7 @@ setup(
     packages=find_packages(exclude=[
         'tests',
         'tests.*',
+        'benchmarks',
     ]),
 
     # Alternatively, if you want to distribute just a my_module.py, uncomment
@@ -84,6 +85,9 @@ setup(
     #     'dev': ['check-manifest'],
     #     'test': ['coverage'],
     # },
+    extras_require={
+        'numpy': ['numpy'],
+    },
 
     # If there are data files included in your packages that need to be
     # installed, specify them here.  If using Python 2.6 or less, then these
@@ -101,9 +105,9 @@ setup(
     # To provide executable scripts, use entry points in preference to the
     # "scripts" keyword. Entry points provide cross-platform support and allow
     # pip to create the appropriate form of executable for the target platform.
-    # entry_points={
-    #     'console_scripts': [
-    #         'sample=sample:main',
-    #     ],
-    # },
+    entry_points={
+        'console_scripts': [
+            'rise-loadgen=risesdk.loadgen:main',
+        ],
+    },
 )
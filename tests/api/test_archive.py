@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from risesdk.protocol import Amount, RegisterDelegateTx
+from risesdk.api.transactions import TransactionInfo
+from risesdk.api.archive import TransactionArchive
+from tests.fixtures.chain import ChainBuilder
+
+
+class TestTransactionArchive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        chain = ChainBuilder()
+        w = chain.wallets
+        for i in range(20):
+            ts = chain.next_timestamp()
+            chain.add_block([w[i % 5].send(w[(i + 2) % 5].address, i + 1, ts) for _ in range(i % 3)])
+        tx = RegisterDelegateTx(
+            sender_public_key=w[0].public_key,
+            username='archived',
+            fee=Amount(2500000000),
+            timestamp=chain.next_timestamp(),
+        )
+        tx.signature = w[0].secret.sign(tx.to_bytes())
+        chain.add_block([tx])
+        cls.infos = [TransactionInfo(t) for t in chain.raw_transactions()]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'txs.bin')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        archive = TransactionArchive(self.path)
+        archive.extend(self.infos)
+        self.assertEqual(len(archive), len(self.infos))
+        for (info, record) in zip(self.infos, archive):
+            self.assertEqual(record.tx_id, info.tx_id)
+            self.assertEqual(bytes(record.data), info.tx.to_bytes())
+            self.assertEqual(record.decode().to_json(), info.tx.to_json())
+        archive.close()
+
+        archive = TransactionArchive(self.path)
+        last = self.infos[-1]
+        self.assertEqual(archive[-1].decode().username, 'archived')
+        self.assertEqual(archive.get(last.tx_id).height, last.height)
+        self.assertIsNone(archive.get('1'))
+        expected = [i.tx_id for i in self.infos if i.height == 10]
+        self.assertEqual([r.tx_id for r in archive.at_height(10)], expected)
+        self.assertEqual(archive.at_height(11), [])
+        archive.close()
+
+    def test_truncate(self):
+        archive = TransactionArchive(self.path)
+        archive.extend(self.infos)
+        archive.truncate(15)
+        self.assertEqual(len(archive), len([i for i in self.infos if i.height <= 15]))
+        self.assertIsNone(archive.get(self.infos[-1].tx_id))
+        archive.append(self.infos[-1])
+        self.assertEqual(archive[-1].tx_id, self.infos[-1].tx_id)
+        with self.assertRaises(ValueError):
+            archive.append(self.infos[0])
+        archive.close()
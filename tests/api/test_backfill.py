@@ -0,0 +1,69 @@
+import unittest
+import requests
+from risesdk.api import APIError, Client
+from risesdk.api.backfill import BlockBackfill
+from tests.fixtures.chain import ChainBuilder
+from tests.fixtures.node import FakeNode
+
+
+class BrokenNode(FakeNode):
+    def get_blocks(self, params):
+        raise LookupError('Node is syncing')
+
+
+class UnreachableNode(FakeNode):
+    def get(self, url, params=None):
+        raise requests.ConnectionError('Connection refused')
+
+
+class TestBlockBackfill(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.chain = ChainBuilder()
+        cls.chain.add_blocks(349)
+
+    def test_ordered(self):
+        nodes = [FakeNode(self.chain), FakeNode(self.chain)]
+        progress = []
+        backfill = BlockBackfill(
+            [Client('http://node', session=n) for n in nodes],
+            chunk_size=40,
+            workers=3,
+            on_progress=progress.append,
+        )
+        heights = [b.height for b in backfill]
+        self.assertEqual(heights, list(range(1, 351)))
+        self.assertGreater(nodes[0].calls['/blocks'], 0)
+        self.assertGreater(nodes[1].calls['/blocks'], 0)
+        self.assertEqual(progress[-1].blocks, 350)
+        self.assertEqual(progress[-1].total, 350)
+        self.assertEqual(progress[-1].height, 350)
+
+    def test_range(self):
+        client = Client('http://node', session=FakeNode(self.chain))
+        previous = self.chain.blocks[98]['id']
+        backfill = BlockBackfill(client, from_height=100, to_height=120, chunk_size=7,
+                                 previous_block_id=previous)
+        self.assertEqual([b.height for b in backfill], list(range(100, 121)))
+
+    def test_retry_on_other_node(self):
+        clients = [
+            Client('http://node', session=BrokenNode(self.chain)),
+            Client('http://node', session=FakeNode(self.chain)),
+        ]
+        backfill = BlockBackfill(clients, to_height=100, chunk_size=10)
+        self.assertEqual(len(list(backfill)), 100)
+
+    def test_retry_on_connection_error(self):
+        clients = [
+            Client('http://node', session=UnreachableNode(self.chain)),
+            Client('http://node', session=FakeNode(self.chain)),
+        ]
+        backfill = BlockBackfill(clients, to_height=100, chunk_size=10)
+        self.assertEqual(len(list(backfill)), 100)
+
+    def test_broken_link(self):
+        client = Client('http://node', session=FakeNode(self.chain))
+        backfill = BlockBackfill(client, from_height=10, to_height=20, previous_block_id='1')
+        with self.assertRaises(APIError):
+            list(backfill)
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.bloom import AddressBloomIndex
+from tests.fixtures.chain import ChainBuilder, Wallet
+
+
+class TestAddressBloomIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        chain = ChainBuilder()
+        w = chain.wallets
+        chain.add_blocks(50)
+        chain.add_block([w[0].send(w[1].address, 1, chain.next_timestamp())])
+        chain.add_blocks(200)
+        chain.add_block([w[2].send(w[0].address, 1, chain.next_timestamp())])
+        chain.add_blocks(10)
+        cls.chain = chain
+        cls.blocks = [BlockInfo(chain.raw_block(b)) for b in chain.blocks]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'addresses.idx')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lookup(self):
+        w = self.chain.wallets
+        index = AddressBloomIndex(self.path, group_size=20)
+        for block in self.blocks:
+            index.add_block(block)
+        self.assertEqual(index.height, 263)
+        self.assertEqual(index.candidate_ranges(w[0].address), [(41, 60), (241, 260)])
+        self.assertEqual(index.candidate_ranges(w[0].public_key), [(41, 60), (241, 260)])
+        self.assertEqual(index.candidate_ranges(w[1].address), [(41, 60)])
+        self.assertEqual(index.candidate_ranges(Wallet('nobody').address), [])
+        index.close()
+
+        # Reopen the index and continue where it was left off
+        index = AddressBloomIndex(self.path)
+        self.assertEqual(index.group_size, 20)
+        self.assertEqual(index.height, 263)
+        self.assertEqual(index.candidate_ranges(w[2].address), [(241, 260)])
+        index.close()
+
+    def test_revert(self):
+        index = AddressBloomIndex(self.path, group_size=20)
+        for block in self.blocks[:100]:
+            index.add_block(block)
+        index.revert_to(90)
+        with self.assertRaises(ValueError):
+            index.add_block(self.blocks[99])
+        for block in self.blocks[90:]:
+            index.add_block(block)
+        self.assertEqual(index.candidate_ranges(self.chain.wallets[2].address), [(241, 260)])
+        index.close()
@@ -0,0 +1,54 @@
+import unittest
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.deposits import DepositWatcher, DepositSeen, DepositConfirmed, DepositReverted
+from tests.fixtures.chain import ChainBuilder, Wallet
+
+
+class TestDepositWatcher(unittest.TestCase):
+    def setUp(self):
+        self.chain = ChainBuilder()
+        self.deposit_wallets = [Wallet('deposit {}'.format(i)) for i in range(3)]
+        addresses = [w.address for w in self.deposit_wallets]
+        addresses += ['{}R'.format(i) for i in range(1000, 20000, 7)]
+        self.watcher = DepositWatcher(addresses, confirmations=3)
+
+    def block(self, txs=None, fork=''):
+        return BlockInfo(self.chain.raw_block(self.chain.add_block(txs, fork=fork)))
+
+    def test_deposits(self):
+        w = self.chain.wallets
+        target = self.deposit_wallets[1].address
+        self.assertIn(target, self.watcher)
+        self.assertNotIn(w[0].address, self.watcher)
+
+        events = self.watcher.apply_block(self.block([
+            w[0].send(target, 500, self.chain.next_timestamp()),
+            w[0].send(w[1].address, 500, self.chain.next_timestamp()),
+        ]))
+        self.assertEqual([type(e) for e in events], [DepositSeen])
+        self.assertEqual(events[0].deposit.address, target)
+        self.assertEqual(events[0].deposit.sender, w[0].address)
+        self.assertEqual(events[0].deposit.amount, 500)
+
+        self.assertEqual(self.watcher.apply_block(self.block()), [])
+        events = self.watcher.apply_block(self.block())
+        self.assertEqual([type(e) for e in events], [DepositConfirmed])
+        self.assertEqual(events[0].deposit.confirmations, 3)
+        self.assertEqual(self.watcher.pending, [])
+
+    def test_revert(self):
+        w = self.chain.wallets
+        target = self.deposit_wallets[0].address
+        block = self.block([w[0].send(target, 1, self.chain.next_timestamp())])
+        self.watcher.apply_block(block)
+        self.assertEqual(len(self.watcher.pending), 1)
+        events = self.watcher.revert_block(block)
+        self.assertEqual([type(e) for e in events], [DepositReverted])
+        self.assertEqual(self.watcher.pending, [])
+
+    def test_watch(self):
+        wallet = Wallet('late')
+        self.assertNotIn(wallet.address, self.watcher)
+        self.watcher.watch([wallet.address])
+        self.assertIn(wallet.address, self.watcher)
+        self.assertIn(self.deposit_wallets[2].address, self.watcher)
@@ -0,0 +1,91 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from decimal import Decimal
+from risesdk.api import Client
+from risesdk.api.blocks import BlockInfo
+from tests.fixtures.chain import ChainBuilder
+from tests.fixtures.node import FakeNode
+
+try:
+    import numpy
+    from risesdk.api.export import export_blocks, export_transactions, iter_transactions
+except ImportError:
+    numpy = None  # type: ignore
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None  # type: ignore
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        w = self.chain.wallets
+        for i in range(6):
+            self.chain.add_block([
+                w[i % 5].send(w[(i + 1) % 5].address, 150000000 + i, self.chain.next_timestamp()),
+                w[(i + 2) % 5].send(w[(i + 3) % 5].address, 1, self.chain.next_timestamp()),
+            ])
+        self.client = Client('http://node', session=self.node)
+
+    def path(self, name):
+        return os.path.join(self.dir.name, name)
+
+    def test_transactions_csv(self):
+        w = self.chain.wallets
+        addresses = [w[0].address, w[1].address]
+        rows = export_transactions(
+            iter_transactions(self.client, addresses, page_size=2), self.path('txs.csv'),
+            batch_size=3)
+        with open(self.path('txs.csv')) as f:
+            data = list(csv.DictReader(f))
+        self.assertEqual(len(data), rows)
+        ids = [r['id'] for r in data]
+        self.assertEqual(len(ids), len(set(ids)))
+        expected = {
+            t['id'] for t in self.chain.raw_transactions()
+            if t['senderId'] in addresses or t['recipientId'] in addresses
+        }
+        self.assertEqual(set(ids), expected)
+        first = next(r for r in data if r['amount'].startswith('1.5'))
+        self.assertEqual(first['amount'], '1.50000000')
+        self.assertEqual(first['fee'], '0.10000000')
+        self.assertEqual(first['timestamp'], '2016-05-24T17:00:30Z')
+
+    def test_blocks_jsonl(self):
+        blocks = (BlockInfo(self.chain.raw_block(b)) for b in self.chain.blocks)
+        self.assertEqual(export_blocks(blocks, self.path('blocks.jsonl'), batch_size=4), 7)
+        with open(self.path('blocks.jsonl')) as f:
+            data = [json.loads(line) for line in f]
+        self.assertEqual([b['height'] for b in data], list(range(1, 8)))
+        self.assertEqual(data[1]['reward'], '15.00000000')
+        self.assertEqual(data[1]['total_amount'], '1.50000001')
+        self.assertEqual(data[0]['previous_block_id'], '')
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_blocks_parquet(self):
+        blocks = [BlockInfo(self.chain.raw_block(b)) for b in self.chain.blocks]
+        self.assertEqual(export_blocks(iter(blocks), self.path('blocks.parquet'), batch_size=4), 7)
+        data = pyarrow.parquet.read_table(self.path('blocks.parquet')).to_pydict()
+        self.assertEqual(data['height'], list(range(1, 8)))
+        self.assertEqual(data['reward'][1], Decimal('15.00000000'))
+        self.assertEqual(data['total_amount'], [b.total_amount.to_unit() for b in blocks])
+        self.assertEqual(data['total_fee'][1], Decimal('0.20000000'))
+        for (dt, block) in zip(data['timestamp'], blocks):
+            self.assertEqual(dt.utcoffset(), timedelta(0))
+            self.assertEqual(dt.replace(tzinfo=None), block.timestamp.to_datetime())
+
+    def test_format(self):
+        with self.assertRaises(ValueError):
+            export_blocks([], self.path('blocks.xml'))
+        self.assertEqual(export_blocks([], self.path('blocks'), format='csv'), 0)
@@ -0,0 +1,45 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.fees import FeeSchedule
+from tests.fixtures.chain import FEE
+from tests.fixtures.node import FakeNode
+
+
+class TestFeeSchedule(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.chain.add_blocks(30)
+        self.node.fees = [(1, 10, FEE), (11, 20, FEE * 2), (21, None, FEE * 3)]
+        self.client = Client('http://node', session=self.node)
+        self.schedule = FeeSchedule(self.client)
+
+    def calls(self):
+        return self.node.calls['/blocks/getFees']
+
+    def test_cached_ranges(self):
+        self.assertEqual(self.schedule.fees_at(5).send, FEE)
+        self.assertEqual(self.schedule.fees_at(15).send, FEE * 2)
+        self.assertEqual(self.calls(), 2)
+        for height in range(1, 21):
+            self.schedule.fees_at(height)
+        self.assertEqual(self.calls(), 2)
+        self.assertEqual(self.schedule.get_fees(12).from_height, 11)
+
+        self.assertEqual(self.schedule.fees_at().send, FEE * 3)
+        self.assertEqual(self.schedule.fees_at(25).send, FEE * 3)
+        self.assertEqual(self.calls(), 3)
+        self.assertEqual(len(self.schedule), 3)
+
+    def test_milestone_change(self):
+        self.assertEqual(self.schedule.fees_at(25).send, FEE * 3)
+        self.schedule.fees_at(28)
+        self.assertEqual(self.calls(), 1)
+
+        self.node.fees[-1:] = [(21, 26, FEE * 3), (27, None, FEE * 4)]
+        self.node.milestone += 1
+        self.client.head.refresh()
+        self.assertEqual(self.schedule.fees_at(28).send, FEE * 4)
+        self.assertEqual(self.schedule.fees_at(25).send, FEE * 3)
+        self.assertEqual(self.calls(), 3)
+        self.assertEqual(self.schedule.get_fees(25).to_height, 26)
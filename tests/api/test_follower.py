@@ -0,0 +1,100 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.follower import (
+    BlockFollower,
+    BlockApplied,
+    BlockReverted,
+    BlockVerificationError,
+)
+from tests.fixtures.node import FakeNode
+
+
+class TestBlockFollower(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+
+    def test_follow_from_height(self):
+        self.chain.add_blocks(250)
+        follower = BlockFollower(self.client, from_height=1)
+        events = follower.poll()
+        self.assertTrue(all(isinstance(e, BlockApplied) for e in events))
+        self.assertEqual([e.block.height for e in events], list(range(1, 252)))
+        self.assertEqual(follower.poll(), [])
+
+        self.chain.add_blocks(1)
+        self.node.calls.clear()
+        events = follower.poll()
+        self.assertEqual([e.block.height for e in events], [252])
+        self.assertEqual(self.node.calls['/blocks'], 1)
+
+    def test_only_new_blocks(self):
+        self.chain.add_blocks(10)
+        follower = BlockFollower(self.client)
+        self.assertEqual(follower.poll(), [])
+        self.chain.add_blocks(2)
+        self.assertEqual([e.block.height for e in follower.poll()], [12, 13])
+
+    def test_fork(self):
+        self.chain.add_blocks(10)
+        follower = BlockFollower(self.client, from_height=1)
+        follower.poll()
+        orphaned = self.chain.rollback(3)
+        for _ in range(4):
+            self.chain.add_block(fork='b')
+
+        events = follower.poll()
+        reverted = [e.block.block_id for e in events if isinstance(e, BlockReverted)]
+        applied = [e.block.height for e in events if isinstance(e, BlockApplied)]
+        self.assertEqual(reverted, [b['id'] for b in reversed(orphaned)])
+        self.assertEqual(applied, [9, 10, 11, 12])
+        self.assertEqual(follower.last_block.block_id, self.chain.blocks[-1]['id'])
+
+    def test_status_ahead_of_blocks(self):
+        self.chain.add_blocks(10)
+        follower = BlockFollower(self.client, from_height=1)
+        follower.poll()
+        status = self.node.get_blocks_getStatus
+
+        # The status reports blocks that /blocks doesn't serve yet
+        def ahead(params):
+            return {**status(params), 'height': self.chain.height + 3}
+
+        self.node.get_blocks_getStatus = ahead  # type: ignore
+        self.assertEqual(follower.poll(), [])
+        self.assertEqual(follower.last_block.height, 11)
+
+        self.chain.add_blocks(2)
+        self.assertEqual([e.block.height for e in follower.poll()], [12, 13])
+
+    def test_shorter_fork(self):
+        self.chain.add_blocks(10)
+        follower = BlockFollower(self.client, from_height=1)
+        follower.poll()
+        self.chain.rollback(2)
+        events = follower.poll()
+        self.assertEqual([type(e) for e in events], [BlockReverted, BlockReverted])
+        self.assertEqual(follower.last_block.height, 9)
+
+    def test_resume_from_block_id(self):
+        self.chain.add_blocks(10)
+        follower = BlockFollower(self.client, from_block_id=self.chain.blocks[4]['id'])
+        events = follower.poll()
+        self.assertEqual([e.block.height for e in events], list(range(6, 12)))
+
+    def test_verify(self):
+        w = self.chain.wallets
+        for i in range(5):
+            self.chain.add_block([w[i].send(w[(i + 1) % 5].address, 100 + i, 1000 + i)])
+        follower = BlockFollower(self.client, from_height=1, verify=True)
+        self.assertEqual(len(follower.poll()), 6)
+
+        self.chain.add_block([w[0].send(w[1].address, 5, 2000)])
+        # A node that tampers with the amount of a transaction
+        self.chain.blocks[-1]['transactions'][0]['amount'] = 6
+        with self.assertRaises(BlockVerificationError) as ctx:
+            follower.poll()
+        self.assertEqual(ctx.exception.verification.block_id, self.chain.blocks[-1]['id'])
+        self.assertFalse(ctx.exception.verification.valid_payload)
+        self.assertEqual(follower.last_block.height, 6)
@@ -0,0 +1,58 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.forging import ForgingSchedule, MissedSlot
+from risesdk.protocol import Timestamp
+from risesdk.protocol.slots import generate_delegate_list, slot_number
+from tests.fixtures.chain import ChainBuilder, BLOCK_TIME
+from tests.fixtures.node import FakeNode
+
+
+class TestForgingSchedule(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode(ChainBuilder(delegates=5))
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+        self.schedule = ForgingSchedule(self.client, grace=5)
+
+    def block(self, timestamp=None):
+        return BlockInfo(self.chain.raw_block(self.chain.add_block(timestamp=timestamp)))
+
+    def test_delegate_list(self):
+        ranked = [d['publicKey'] for d in self.node._delegates()]
+        order = self.schedule.delegate_list(1)
+        self.assertEqual([k.hex() for k in order],
+                         [k.hex() for k in generate_delegate_list(1, [bytes.fromhex(k) for k in ranked])])
+        self.assertIs(self.schedule.delegate_list(1), order)
+        self.assertEqual(self.schedule.forger_at(7, 5), order[2])
+
+        upcoming = self.schedule.upcoming(3, now=Timestamp(1000))
+        self.assertEqual([u[0] for u in upcoming], [34, 35, 36])
+        self.assertEqual(upcoming[0][1], 1020)
+        self.assertEqual(upcoming[1][2], order[0])
+
+    def test_missed_slots(self):
+        self.assertEqual(self.schedule.apply_block(self.block()), [])
+        last = self.chain.blocks[-1]['timestamp']
+
+        # Two slots are missed before the next block arrives
+        block = self.block(last + 3 * BLOCK_TIME)
+        missed = self.schedule.apply_block(block)
+        self.assertEqual([m.slot for m in missed], [slot_number(last) + 1, slot_number(last) + 2])
+        self.assertIsInstance(missed[0], MissedSlot)
+        self.assertEqual(missed[0].height, block.height)
+        self.assertEqual(missed[0].public_key, self.schedule.forger_at(missed[0].slot, block.height))
+
+    def test_check(self):
+        self.schedule.apply_block(self.block())
+        last = self.chain.blocks[-1]['timestamp']
+        now = Timestamp(last + BLOCK_TIME + 1)
+        self.assertEqual(self.schedule.check(now), [])
+        now = Timestamp(last + 2 * BLOCK_TIME + 5)
+        missed = self.schedule.check(now)
+        self.assertEqual([m.slot for m in missed], [slot_number(last) + 1])
+        self.assertEqual(self.schedule.check(now), [])
+
+        # Already reported slots aren't reported again by the next block
+        missed = self.schedule.apply_block(self.block(last + 3 * BLOCK_TIME))
+        self.assertEqual([m.slot for m in missed], [slot_number(last) + 2])
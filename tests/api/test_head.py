@@ -0,0 +1,72 @@
+import threading
+import unittest
+from unittest import mock
+from risesdk.api import Client
+from risesdk.api.head import ChainHead
+from tests.fixtures.node import FakeNode
+
+
+class TestChainHead(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+        self.now = 1000.0
+        patcher = mock.patch.object(ChainHead, '_now', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def calls(self):
+        return self.node.calls['/blocks/getStatus']
+
+    def test_slot_aligned(self):
+        head = self.client.head
+        self.assertEqual(head.height, self.chain.height)
+        self.assertEqual(self.calls(), 1)
+
+        # Cached until the next slot (1020) plus the propagation delay
+        self.chain.add_block()
+        self.now = 1021.0
+        self.assertEqual(head.height, self.chain.height - 1)
+        self.assertEqual(self.calls(), 1)
+        self.now = 1022.0
+        self.assertEqual(head.height, self.chain.height)
+        self.assertEqual(self.calls(), 2)
+
+        # A missed slot is retried with a growing interval, but no later than the next slot
+        self.now = 1052.0
+        head.status()
+        self.now = 1053.0
+        head.status()
+        self.assertEqual(self.calls(), 3)
+        self.now = 1054.0
+        head.status()
+        self.now = 1057.0
+        head.status()
+        self.assertEqual(self.calls(), 4)
+        self.now = 1058.0
+        head.status()
+        self.assertEqual(self.calls(), 5)
+
+    def test_refresh(self):
+        head = self.client.head
+        head.status()
+        self.chain.add_block()
+        self.assertEqual(head.refresh().height, self.chain.height)
+        self.assertEqual(self.calls(), 2)
+
+    def test_wait_for_height(self):
+        head = self.client.head
+        target = self.chain.height + 1
+        with self.assertRaises(TimeoutError):
+            head.wait_for_height(target, timeout=0.01)
+
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(head.wait_for_height(target, 5)))
+        waiter.start()
+        self.chain.add_block()
+        self.now = 1022.0
+        # Any reader's refresh wakes up the waiters
+        head.status()
+        waiter.join()
+        self.assertEqual(result[0].height, target)
@@ -0,0 +1,113 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.history import BalanceHistory
+from tests.fixtures.chain import FEE, Wallet
+from tests.fixtures.node import FakeNode
+
+
+class TestBalanceHistory(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.node.genesis_balance = 0
+        self.client = Client('http://node', session=self.node)
+        w = self.chain.wallets
+        d = self.chain.delegates
+        genesis = Wallet('genesis')
+        self.chain.add_block([
+            genesis.send(account.address, 10 ** 12, self.chain.next_timestamp())
+            for account in w + d
+        ])
+        for i in range(30):
+            sender = d[i % 3] if i % 2 else w[i % 5]
+            self.chain.add_block([sender.send(w[(i + 1) % 5].address, 1000 + i, self.chain.next_timestamp())])
+
+    def expected_balance(self, address, height):
+        blocks = self.chain.blocks
+        self.chain.blocks = blocks[:height]
+        try:
+            return self.node.balance(address)
+        finally:
+            self.chain.blocks = blocks
+
+    def test_balance_at(self):
+        history = BalanceHistory(self.client, page_size=7)
+        addresses = [self.chain.wallets[1].address, self.chain.delegates[2].address]
+        for address in addresses:
+            history.load(address)
+        for address in addresses:
+            for height in range(0, self.chain.height + 1):
+                self.assertEqual(history.balance_at(address, height),
+                                 self.expected_balance(address, height))
+
+        # Timestamps map to the same balances as the blocks they belong to
+        for address in addresses:
+            for block in self.chain.blocks:
+                self.assertEqual(history.balance_at_time(address, block['timestamp']),
+                                 history.balance_at(address, block['height']))
+
+    def test_old_transaction_timestamps(self):
+        w = self.chain.wallets
+        # Transactions created long before the block that includes them
+        for i in range(3):
+            self.chain.add_block([w[2].send(w[3].address, 10 + i, 5 + i)])
+        history = BalanceHistory(self.client)
+        history.load(w[3].address)
+        self.assertEqual(
+            [history.balance_at_time(w[3].address, b['timestamp']) for b in self.chain.blocks],
+            [history.balance_at(w[3].address, b['height']) for b in self.chain.blocks],
+        )
+
+        # Live blocks are placed in time the same way as loaded ones
+        live = BalanceHistory(self.client)
+        live.load(w[3].address)
+        for raw in self.chain.rollback(2):
+            live.revert_block(BlockInfo(self.chain.raw_block(raw)))
+            self.chain.blocks.append(raw)
+        for raw in self.chain.blocks[-2:]:
+            live.apply_block(BlockInfo(self.chain.raw_block(raw)))
+        for b in self.chain.blocks:
+            self.assertEqual(live.balance_at_time(w[3].address, b['timestamp']),
+                             history.balance_at_time(w[3].address, b['timestamp']))
+
+    def test_negative_balance(self):
+        # The funding of the account isn't part of its transactions, e.g. in the genesis block
+        self.node.genesis_balance = 10 ** 12
+        fresh = Wallet('fresh')
+        self.chain.add_block([fresh.send(self.chain.wallets[0].address, 100, 1000)])
+        history = BalanceHistory(self.client)
+        history.load(fresh.address)
+        self.assertEqual(history.balance_at(fresh.address, self.chain.height), -100 - FEE)
+        self.assertEqual(history.changes(fresh.address), [(self.chain.height, -100 - FEE)])
+
+    def test_block_requests(self):
+        w = self.chain.wallets
+        for i in range(250):
+            self.chain.add_block([w[0].send(w[1].address, 1 + i, self.chain.next_timestamp())])
+        history = BalanceHistory(self.client, workers=2)
+        self.node.calls.clear()
+        history.load(w[1].address, w[1].public_key)
+        # The timestamps of the ~260 heights are fetched in pages, plus one forged blocks query
+        self.assertLessEqual(self.node.calls['/blocks'], 4)
+        for b in self.chain.blocks:
+            self.assertEqual(history.balance_at_time(w[1].address, b['timestamp']),
+                             history.balance_at(w[1].address, b['height']))
+
+    def test_incremental(self):
+        d = self.chain.delegates[0]
+        history = BalanceHistory(self.client)
+        history.load(d.address)
+        w = self.chain.wallets
+        new = [
+            self.chain.add_block([w[0].send(d.address, 5, self.chain.next_timestamp())]),
+            self.chain.add_block(),
+        ]
+        for raw in new:
+            history.apply_block(BlockInfo(self.chain.raw_block(raw)))
+        self.assertEqual(history.balance_at(d.address, self.chain.height),
+                         self.expected_balance(d.address, self.chain.height))
+
+        history.revert_block(BlockInfo(self.chain.raw_block(new[1])))
+        self.assertEqual(history.balance_at(d.address, self.chain.height),
+                         self.expected_balance(d.address, self.chain.height - 1))
@@ -0,0 +1,179 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from risesdk.api.journal import JournalState, TransactionJournal
+from tests.fixtures.chain import ChainBuilder, Wallet
+
+
+class TestTransactionJournal(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, 'journal')
+        self.chain = ChainBuilder()
+
+    def send(self, i):
+        w = self.chain.wallets
+        return w[i % 5].send(w[(i + 1) % 5].address, i + 1, self.chain.next_timestamp())
+
+    def test_replay(self):
+        txs = [self.send(i) for i in range(5)]
+        journal = TransactionJournal(self.path)
+        for tx in txs:
+            journal.add(tx)
+        journal.update(txs[0].derive_id(), JournalState.SUBMITTED)
+        journal.update(txs[1].derive_id(), JournalState.ACCEPTED)
+        journal.update(txs[2].derive_id(), JournalState.CONFIRMED)
+        journal.update(txs[3].derive_id(), JournalState.REJECTED)
+        journal.close()
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual(len(journal), 5)
+        self.assertEqual(journal.state(txs[2].derive_id()), JournalState.CONFIRMED)
+        self.assertEqual([tx.derive_id() for tx in journal.to_submit()],
+                         [txs[0].derive_id(), txs[4].derive_id()])
+        self.assertEqual(journal.to_track(), [txs[1].derive_id()])
+        restored = journal.to_submit()[0]
+        self.assertEqual(restored.to_bytes(), txs[0].to_bytes())
+        self.assertEqual(restored.fee, txs[0].fee)
+        with self.assertRaises(KeyError):
+            journal.update('123', JournalState.SUBMITTED)
+        journal.close()
+
+    def test_second_signature(self):
+        tx = self.send(1)
+        tx.second_signature = Wallet('second').secret.sign(tx.to_bytes())
+        journal = TransactionJournal(self.path)
+        journal.add(tx)
+        journal.close()
+        journal = TransactionJournal(self.path)
+        entry = next(journal.in_flight())
+        journal.close()
+        self.assertEqual(entry.tx.second_signature, tx.second_signature)
+        self.assertEqual(entry.tx_id, tx.derive_id())
+
+    def test_torn_tail(self):
+        journal = TransactionJournal(self.path)
+        journal.add(self.send(1))
+        journal.add(self.send(2))
+        journal.close()
+        size = os.path.getsize(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(size - 10)
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual(len(journal), 1)
+        journal.add(self.send(3))
+        journal.close()
+        journal = TransactionJournal(self.path)
+        self.assertEqual(len(journal), 2)
+        journal.close()
+
+    def test_group_commit(self):
+        journal = TransactionJournal(self.path)
+        txs = [self.send(i) for i in range(40)]
+
+        def write(part):
+            for tx in part:
+                journal.commit(journal.add(tx))
+        threads = [threading.Thread(target=write, args=(txs[i::4],)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        journal.close()
+        journal = TransactionJournal(self.path)
+        self.assertEqual(len(journal), 40)
+        journal.close()
+
+    def test_compact(self):
+        txs = [self.send(i) for i in range(10)]
+        journal = TransactionJournal(self.path)
+        for tx in txs:
+            journal.add(tx)
+        for tx in txs[:8]:
+            journal.update(tx.derive_id(), JournalState.CONFIRMED)
+        journal.commit()
+        size = os.path.getsize(self.path)
+        journal.compact()
+        self.assertLess(os.path.getsize(self.path), size)
+        journal.update(txs[8].derive_id(), JournalState.ACCEPTED)
+        journal.close()
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual(len(journal), 2)
+        self.assertEqual(journal.to_track(), [txs[8].derive_id()])
+        journal.close()
+
+    def test_compact_during_commit(self):
+        txs = [self.send(i) for i in range(3)]
+        journal = TransactionJournal(self.path)
+        journal.commit(journal.add(txs[0]))
+        journal.update(txs[0].derive_id(), JournalState.CONFIRMED)
+        journal.add(txs[1])
+
+        writing = threading.Event()
+        release = threading.Event()
+        fsync = os.fsync
+
+        def slow_fsync(fd):
+            if threading.current_thread() is committer:
+                writing.set()
+                release.wait(10)
+            fsync(fd)
+        with mock.patch('os.fsync', slow_fsync):
+            committer = threading.Thread(target=TransactionJournal.commit, args=(journal,))
+            committer.start()
+            self.assertTrue(writing.wait(10))
+            # Start compacting in the window after its own commit() returned
+            compactor = threading.Thread(target=journal.compact)
+            journal.commit = lambda sequence=None: None  # type: ignore
+            compactor.start()
+            journal.add(txs[2])
+            compactor.join(0.2)
+            # compact() must not replace the file while the commit is still writing to it
+            self.assertTrue(compactor.is_alive())
+            release.set()
+            committer.join(10)
+            compactor.join(10)
+        del journal.commit
+        journal.close()
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual([tx.derive_id() for tx in journal.to_submit()],
+                         [txs[1].derive_id(), txs[2].derive_id()])
+        journal.close()
+
+    def test_failed_write(self):
+        txs = [self.send(i) for i in range(4)]
+        journal = TransactionJournal(self.path)
+        journal.commit(journal.add(txs[0]))
+
+        class TornFile(object):
+            # Writes part of the data and fails, like a full disk
+            def __init__(self, f):
+                self._f = f
+
+            def write(self, data):
+                self._f.write(data[:len(data) // 3])
+                raise OSError('No space left on device')
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+        f = journal._file
+        journal._file = TornFile(f)  # type: ignore
+        journal.add(txs[1])
+        journal.add(txs[2])
+        with self.assertRaises(OSError):
+            journal.commit()
+        journal._file = f
+        journal.add(txs[3])
+        journal.commit()
+        journal.close()
+
+        journal = TransactionJournal(self.path)
+        self.assertEqual([tx.derive_id() for tx in journal.to_submit()],
+                         [tx.derive_id() for tx in txs])
+        journal.close()
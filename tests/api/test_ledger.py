@@ -0,0 +1,58 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.follower import BlockFollower
+from risesdk.api.ledger import BalanceLedger
+from tests.fixtures.chain import REWARD
+from tests.fixtures.node import FakeNode
+
+
+class TestBalanceLedger(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+
+    def transfer(self, sender, recipient, amount, fork=''):
+        tx = sender.send(recipient.address, amount, self.chain.next_timestamp())
+        return self.chain.add_block([tx], fork=fork)
+
+    def test_follow(self):
+        w = self.chain.wallets
+        d = self.chain.delegates
+        changes = []
+        ledger = BalanceLedger(self.client, [w[0].address, w[1].address, d[0].address],
+                               on_change=changes.append)
+        height = ledger.load()
+        follower = BlockFollower(self.client, from_height=height + 1)
+        start = ledger.balance(w[0].address)
+
+        self.transfer(w[0], w[1], 1000)
+        self.transfer(w[2], w[0], 50)
+        self.chain.add_blocks(2)
+        for event in follower.poll():
+            ledger.apply(event)
+
+        self.assertEqual(ledger.balance(w[0].address), start - 1000 - 10000000 + 50)
+        self.assertEqual(len([c for c in changes if c.address == w[0].address]), 2)
+        self.assertEqual(changes[0].delta, -1000 - 10000000)
+        self.assertEqual(changes[0].tx_id, self.chain.blocks[-4]['transactions'][0]['id'])
+        for address in ledger.addresses:
+            self.assertEqual(ledger.balance(address), self.node.balance(address))
+
+        # Revert the last 3 blocks and replace them with a different fork
+        self.chain.rollback(3)
+        self.transfer(w[1], w[0], 7, fork='b')
+        for event in follower.poll():
+            ledger.apply(event)
+        for address in ledger.addresses:
+            self.assertEqual(ledger.balance(address), self.node.balance(address))
+        self.assertEqual(ledger.reconcile(), {})
+
+    def test_reconcile(self):
+        w = self.chain.wallets
+        ledger = BalanceLedger(self.client, [w[0].address], reconcile_every=1)
+        ledger.load()
+        self.node.genesis_balance += REWARD
+        self.chain.add_blocks(1)
+        ledger.apply_block(BlockFollower(self.client, from_height=2).poll()[0].block)
+        self.assertEqual(ledger.balance(w[0].address), self.node.balance(w[0].address))
@@ -0,0 +1,53 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.mempool import MempoolWatcher, PendingAdded, PendingRemoved, PendingConfirmed
+from tests.fixtures.node import FakeNode
+
+
+class TestMempoolWatcher(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+        self.watcher = MempoolWatcher(self.client)
+
+    def send(self, i):
+        w = self.chain.wallets
+        return w[i % 5].send(w[(i + 1) % 5].address, i + 1, self.chain.next_timestamp())
+
+    def test_diff(self):
+        txs = [self.send(i) for i in range(4)]
+        self.node.unconfirmed = txs[:3]
+        self.node.queued = txs[3:]
+        events = self.watcher.poll()
+        self.assertEqual([type(e) for e in events], [PendingAdded] * 4)
+        self.assertEqual([e.pool for e in events], ['unconfirmed'] * 3 + ['queued'])
+        self.assertIn(txs[0].derive_id(), self.watcher)
+        self.assertEqual(events[3].info.tx.to_bytes(), txs[3].to_bytes())
+
+        # Nothing changed, so the pools aren't fetched
+        self.node.calls.clear()
+        self.assertEqual(self.watcher.poll(), [])
+        self.assertEqual(self.node.calls['/transactions/unconfirmed'], 0)
+
+        # Two get confirmed, one is dropped and one new arrives
+        self.node.unconfirmed = txs[:2]
+        self.node.forge()
+        self.node.queued = [self.send(10)]
+        events = self.watcher.poll()
+        confirmed = {e.info.tx_id for e in events if isinstance(e, PendingConfirmed)}
+        removed = {e.tx_id for e in events if isinstance(e, PendingRemoved)}
+        added = [e.info.tx_id for e in events if isinstance(e, PendingAdded)]
+        self.assertEqual(confirmed, {txs[0].derive_id(), txs[1].derive_id()})
+        self.assertEqual(removed, {txs[2].derive_id(), txs[3].derive_id()})
+        self.assertEqual(added, [self.node.queued[0].derive_id()])
+        self.assertEqual(len(self.watcher), 1)
+
+    def test_adaptive_interval(self):
+        self.watcher.poll()
+        idle = self.watcher.interval
+        self.watcher.poll()
+        self.assertGreater(self.watcher.interval, idle)
+        self.node.unconfirmed = [self.send(1)]
+        self.watcher.poll()
+        self.assertLess(self.watcher.interval, idle * 1.5)
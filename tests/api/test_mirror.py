@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from risesdk.api import Client
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.mirror import ChainMirror
+from tests.fixtures.node import FakeNode
+
+
+class TestChainMirror(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mirror = ChainMirror(os.path.join(self.tmp.name, 'chain.db'), self.client, commit_every=50)
+
+    def tearDown(self):
+        self.mirror.close()
+        self.tmp.cleanup()
+
+    def add_transfers(self, count: int):
+        w = self.chain.wallets
+        for i in range(count):
+            self.chain.add_block([w[i % 5].send(w[(i + 1) % 5].address, i + 1, self.chain.next_timestamp())])
+
+    def test_sync(self):
+        self.add_transfers(300)
+        self.assertEqual(self.mirror.sync(), 301)
+        self.assertEqual(self.mirror.height, 301)
+        self.assertGreater(self.node.calls['/blocks'], 0)
+
+        self.add_transfers(5)
+        self.assertEqual(self.mirror.sync(), 5)
+
+        block = self.mirror.get_block(height=200)
+        self.assertEqual(block.block_id, self.chain.blocks[199]['id'])
+        self.assertEqual(len(block.transactions), 1)
+        self.assertEqual(block.transactions[0].confirmations, 107)
+
+        address = self.chain.wallets[0].address
+        txs = list(self.mirror.transactions('sender_id = ? OR recipient_id = ?', [address, address]))
+        self.assertEqual(len(txs), 122)
+        tx_id = txs[0].tx_id
+        self.assertEqual(self.mirror.get_transaction(tx_id).tx.to_bytes(), txs[0].tx.to_bytes())
+
+    def test_fork(self):
+        self.add_transfers(20)
+        self.mirror.sync()
+        orphaned = self.chain.rollback(3)
+        for _ in range(2):
+            self.chain.add_block(fork='b')
+
+        self.mirror.sync()
+        self.assertEqual(self.mirror.height, 20)
+        self.assertIsNone(self.mirror.get_block(block_id=orphaned[0]['id']))
+        self.assertIsNone(self.mirror.get_transaction(orphaned[0]['transactions'][0]['id']))
+        self.assertEqual(self.mirror.get_block(height=20).block_id, self.chain.blocks[-1]['id'])
+
+    def test_insert_reforged(self):
+        self.add_transfers(20)
+        self.mirror.sync()
+        orphaned = self.chain.rollback(3)
+        blocks = [BlockInfo(self.chain.raw_block(self.chain.add_block(fork='b'))) for _ in range(3)]
+
+        # Backfilling over the stored heights replaces the blocks along with their transactions
+        self.mirror.insert_blocks(blocks)
+        self.assertEqual(self.mirror.get_block(height=21).block_id, blocks[-1].block_id)
+        for block in orphaned:
+            self.assertIsNone(self.mirror.get_transaction(block['transactions'][0]['id']))
@@ -0,0 +1,64 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.fees import FeeSchedule
+from risesdk.api.payouts import PayoutBuilder
+from risesdk.protocol import Amount, Timestamp
+from tests.fixtures.chain import FEE, Wallet
+from tests.fixtures.node import FakeNode
+
+
+class TestPayoutBuilder(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.client = Client('http://node', session=self.node)
+        self.wallet = Wallet('payout')
+        self.second = Wallet('payout second')
+        self.payouts = [('{}R'.format(1000 + i % 7), Amount(100 + i % 3)) for i in range(40)]
+
+    def check(self, batches, second=False):
+        self.assertEqual([len(b) for b in batches], [25, 15])
+        txs = [tx for b in batches for tx in b]
+        self.assertEqual([(tx.recipient, tx.amount) for tx in txs], self.payouts)
+        self.assertEqual(len({tx.derive_id() for tx in txs}), len(txs))
+        for tx in txs:
+            self.assertEqual(tx.fee, FEE)
+            self.assertTrue(self.wallet.public_key.verify(
+                tx.signature, tx.to_bytes(skip_signature=True, skip_second_signature=True)))
+            if second:
+                self.assertTrue(self.second.public_key.verify(
+                    tx.second_signature, tx.to_bytes(skip_second_signature=True)))
+            else:
+                self.assertIsNone(tx.second_signature)
+
+    def test_build(self):
+        builder = PayoutBuilder(self.client, self.wallet.secret, workers=1)
+        batches = list(builder.build(iter(self.payouts), timestamp=Timestamp(1000)))
+        self.check(batches)
+        self.assertEqual(batches[0][0].timestamp, 1000)
+        self.assertEqual(self.node.calls['/blocks/getFees'], 1)
+
+    def test_not_in_future(self):
+        builder = PayoutBuilder(self.client, self.wallet.secret, workers=1)
+        batches = list(builder.build(self.payouts))
+        now = Timestamp.now()
+        self.check(batches)
+        self.assertLessEqual(max(tx.timestamp for b in batches for tx in b), now)
+
+    def test_repeated_at_epoch(self):
+        builder = PayoutBuilder(self.client, self.wallet.secret, workers=1)
+        batches = list(builder.build(self.payouts, timestamp=Timestamp(1)))
+        self.check(batches)
+        self.assertEqual(min(tx.timestamp for b in batches for tx in b), 0)
+        with self.assertRaises(ValueError):
+            list(builder.build(self.payouts, timestamp=Timestamp(0)))
+
+    def test_process_pool(self):
+        builder = PayoutBuilder(
+            self.client,
+            self.wallet.secret,
+            second_secret=self.second.secret,
+            fees=FeeSchedule(self.client),
+            chunk_size=8,
+            workers=2,
+        )
+        self.check(list(builder.build(self.payouts)), second=True)
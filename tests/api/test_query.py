@@ -0,0 +1,94 @@
+import unittest
+from risesdk.protocol import Amount, SendTx, VoteTx
+from risesdk.api.transactions import TransactionInfo
+from risesdk.api.query import TransactionStore
+from tests.fixtures.chain import ChainBuilder
+
+
+class TestTransactionStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        chain = ChainBuilder()
+        w = chain.wallets
+        for i in range(10):
+            ts = chain.next_timestamp()
+            chain.add_block([
+                w[i % 3].send(w[(i + 1) % 3].address, 100 * (i + 1), ts),
+                w[3].send(w[4].address, 5000 + i, ts),
+            ])
+        vote = VoteTx(
+            sender_public_key=w[0].public_key,
+            add_votes=[chain.delegates[0].public_key],
+            remove_votes=[],
+            fee=Amount(100000000),
+            timestamp=chain.next_timestamp(),
+        )
+        vote.signature = w[0].secret.sign(vote.to_bytes())
+        chain.add_block([vote])
+        cls.chain = chain
+        cls.wallets = w
+        cls.infos = [TransactionInfo(t) for t in chain.raw_transactions()]
+        cls.store = TransactionStore(cls.infos)
+
+    def test_or_filters(self):
+        w = self.wallets
+        r = self.store.get_transactions(
+            sender=w[0].address,
+            recipient=w[0].address,
+            limit=1000,
+        )
+        expected = [
+            i for i in self.infos
+            if i.tx.sender_public_key == w[0].public_key or i.tx._recipient == w[0].address
+        ]
+        self.assertEqual(r.count, len(expected))
+        self.assertEqual({i.tx_id for i in r.transactions}, {i.tx_id for i in expected})
+
+    def test_and_filters(self):
+        w = self.wallets
+        r = self.store.get_transactions(
+            and__type_cls=SendTx,
+            sender=w[0].address,
+            recipient=w[0].address,
+            and__from_height=5,
+        )
+        for info in r.transactions:
+            self.assertIsInstance(info.tx, SendTx)
+            self.assertGreaterEqual(info.height, 5)
+        self.assertEqual(r.count, 5)
+
+    def test_amount_and_heights(self):
+        r = self.store.get_transactions(
+            and__min_amount=Amount(5000),
+            and__max_amount=Amount(5004),
+            order_by='amount:asc',
+        )
+        self.assertEqual([int(i.tx._amount) for i in r.transactions], list(range(5000, 5005)))
+
+        r = self.store.get_transactions(from_height=11, order_by='height:asc')
+        self.assertEqual([i.height for i in r.transactions], [11, 11, 12])
+
+    def test_order_and_paging(self):
+        r = self.store.get_transactions(
+            recipients=[self.wallets[4].address],
+            order_by='height:desc',
+            offset=2,
+            limit=3,
+        )
+        self.assertEqual(r.count, 10)
+        self.assertEqual([i.height for i in r.transactions], [9, 8, 7])
+
+    def test_confirmations(self):
+        store = TransactionStore(self.infos, chain_height=20)
+        r = store.get_transactions(and__min_confirmations=15, order_by='height:asc', limit=1000)
+        self.assertEqual({i.height for i in r.transactions}, {2, 3, 4, 5, 6})
+        self.assertEqual(r.transactions[0].confirmations, 19)
+
+    def test_remove_block(self):
+        store = TransactionStore(self.infos)
+        block_id = self.chain.blocks[-1]['id']
+        removed = store.remove_block(block_id)
+        self.assertEqual(len(removed), 1)
+        self.assertEqual(len(store), len(self.infos) - 1)
+        self.assertEqual(store.get_transactions(block_id=block_id).count, 0)
+        self.assertEqual(store.get_transactions(from_height=12).count, 0)
@@ -0,0 +1,49 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.registry import DelegateRegistry
+from tests.fixtures.chain import ChainBuilder
+from tests.fixtures.node import FakeNode
+
+
+class TestDelegateRegistry(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode(ChainBuilder(delegates=5))
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+        self.registry = DelegateRegistry(self.client, page_size=2)
+
+    def test_load(self):
+        changed = self.registry.load()
+        self.assertEqual(len(changed), 5)
+        self.assertEqual(len(self.registry), 5)
+        self.assertEqual(self.node.calls['/delegates'], 3)
+
+        d = self.chain.delegates[3]
+        info = self.registry.by_public_key(d.public_key)
+        self.assertIsNotNone(info)
+        self.assertIs(self.registry.by_address(d.address), info)
+        self.assertIs(self.registry.get(username=info.username), info)
+        self.assertIn(d.public_key, self.registry)
+        self.assertEqual([i.rank for i in self.registry.ranked], [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.registry.active), 5)
+        with self.assertRaises(ValueError):
+            self.registry.get()
+
+    def test_refresh(self):
+        self.registry.load()
+        before = {i.public_key: i for i in self.registry}
+        self.assertEqual(self.registry.refresh(), [])
+        self.assertEqual(self.node.calls['/delegates/count'], 1)
+
+        # Votes move the voted delegate to the top in the next round
+        w = self.chain.wallets
+        d = self.chain.delegates[4]
+        self.chain.add_block([w[0].vote([d.public_key], [], self.chain.next_timestamp())])
+        self.chain.add_blocks(100)
+        self.client.head.refresh()
+        changed = self.registry.refresh()
+        self.assertIn(d.public_key, {i.public_key for i in changed})
+        self.assertEqual(self.registry.top(1)[0].public_key, d.public_key)
+        for info in self.registry:
+            if info not in changed:
+                self.assertIs(info, before[info.public_key])
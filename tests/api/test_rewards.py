@@ -0,0 +1,74 @@
+import random
+import unittest
+from fractions import Fraction
+from risesdk.api import Client
+from tests.fixtures.chain import ChainBuilder, REWARD, FEE
+from tests.fixtures.node import FakeNode
+
+try:
+    import numpy
+    from risesdk.api.rewards import RewardCalculator, distribute
+    from risesdk.api.voters import VoterGraph
+except ImportError:
+    numpy = None  # type: ignore
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestDistribute(unittest.TestCase):
+    def test_exact(self):
+        rng = random.Random(1)
+        weights = [rng.randrange(10 ** 12) for _ in range(20000)]
+        shares = distribute(123456789, weights)
+        self.assertEqual(int(shares.sum()), 123456789)
+        total = sum(weights)
+        for (w, s) in zip(weights[:100], shares[:100].tolist()):
+            self.assertLessEqual(abs(s * total - 123456789 * w), total)
+
+    def test_largest_remainder(self):
+        self.assertEqual(distribute(10, [1, 1, 1]).tolist(), [4, 3, 3])
+        self.assertEqual(distribute(10, [1, 2, 2]).tolist(), [2, 4, 4])
+        self.assertEqual(distribute(5, [0, 0]).tolist(), [0, 0])
+
+    def test_large_values(self):
+        # The products don't fit into int64, so Python integers are used
+        weights = [10 ** 17, 3 * 10 ** 17 + 1, 7]
+        shares = distribute(10 ** 15 + 1, weights)
+        self.assertEqual(sum(shares.tolist()), 10 ** 15 + 1)
+        for (w, s) in zip(weights, shares.tolist()):
+            self.assertIn(s - (10 ** 15 + 1) * w // sum(weights), (0, 1))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestRewardCalculator(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode(ChainBuilder(delegates=2))
+        self.chain = self.node.chain
+        self.delegate = self.chain.delegates[0]
+        w = self.chain.wallets
+        self.chain.add_block([
+            w[i].vote([self.delegate.public_key], [], self.chain.next_timestamp())
+            for i in range(3)
+        ])
+        self.chain.add_blocks(10)
+        self.client = Client('http://node', session=self.node)
+
+    def test_calculate(self):
+        calculator = RewardCalculator(self.client, page_size=2)
+        forged = calculator.forged(self.delegate.public_key, 3, 10)
+        self.assertEqual(forged.blocks, 4)
+        self.assertEqual(forged.rewards, 4 * REWARD)
+
+        shares = calculator.calculate(self.delegate.public_key, 1, 12, share='0.8')
+        summary = calculator.forged(self.delegate.public_key, 1, 12)
+        self.assertEqual(summary.fees, 3 * FEE)
+        self.assertEqual(sum(s.amount for s in shares), summary.forged * 4 // 5)
+        self.assertEqual({s.address for s in shares}, {w.address for w in self.chain.wallets[:3]})
+
+        graph = VoterGraph(self.client)
+        graph.build()
+        from_graph = RewardCalculator(self.client, graph=graph).calculate(
+            self.delegate.public_key, 1, 12, share=Fraction(4, 5))
+        self.assertEqual(sorted(from_graph), sorted(shares))
+
+        with self.assertRaises(ValueError):
+            calculator.calculate(self.delegate.public_key, 1, 12, share=2)
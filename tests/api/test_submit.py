@@ -0,0 +1,62 @@
+import threading
+import unittest
+from risesdk.api import Client
+from risesdk.api.base import APIError
+from risesdk.api.submit import SubmissionPipeline, TransactionRejectedError
+from tests.fixtures.node import FakeNode
+
+
+class TestSubmissionPipeline(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode()
+        self.chain = self.node.chain
+        self.client = Client('http://node', session=self.node)
+
+    def send(self, i):
+        w = self.chain.wallets
+        return w[i % 5].send(w[(i + 1) % 5].address, i + 1, self.chain.next_timestamp())
+
+    def test_batches(self):
+        txs = [self.send(i) for i in range(100)]
+        self.node.reject[txs[7].derive_id()] = 'Insufficient balance'
+        futures = []
+        with SubmissionPipeline(self.client, batch_size=10, max_delay=0.5) as pipeline:
+            def produce(part):
+                futures.extend(pipeline.submit_many(part))
+            threads = [threading.Thread(target=produce, args=(txs[i::4],)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(self.node.calls['/transactions'], 10)
+        self.assertEqual(len(self.node.unconfirmed), 99)
+
+        accepted = [f.result() for f in futures if f.exception() is None]
+        self.assertEqual(set(accepted), {tx.derive_id() for tx in txs} - {txs[7].derive_id()})
+        rejected = [f.exception() for f in futures if f.exception() is not None]
+        self.assertEqual(len(rejected), 1)
+        self.assertIsInstance(rejected[0], TransactionRejectedError)
+        self.assertEqual(rejected[0].reason, 'Insufficient balance')
+        self.assertIs(rejected[0].tx, txs[7])
+
+    def test_duplicates(self):
+        tx = self.send(1)
+        with SubmissionPipeline(self.client, max_delay=0.5) as pipeline:
+            # Duplicates share the future of the first submission
+            futures = pipeline.submit_many([tx, self.send(2), tx])
+            self.assertIs(futures[0], futures[2])
+        self.assertEqual(len(self.node.unconfirmed), 2)
+
+    def test_request_failure(self):
+        self.node.put_transactions = lambda data: {}  # type: ignore
+        with SubmissionPipeline(self.client) as pipeline:
+            future = pipeline.submit(self.send(1))
+        self.assertIsInstance(future.exception(), Exception)
+        with self.assertRaises(RuntimeError):
+            pipeline.submit(self.send(2))
+
+    def test_latency_budget(self):
+        pipeline = SubmissionPipeline(self.client, max_delay=0.01)
+        future = pipeline.submit(self.send(1))
+        self.assertEqual(future.result(timeout=5), self.node.unconfirmed[0].derive_id())
+        pipeline.close()
@@ -0,0 +1,100 @@
+import threading
+import unittest
+from risesdk.api import Client
+from risesdk.api.blocks import BlockInfo
+from risesdk.api.follower import BlockApplied, BlockReverted
+from risesdk.api.mempool import PendingRemoved
+from risesdk.api.tracker import ConfirmationTracker, TransactionDroppedError
+from tests.fixtures.chain import ChainBuilder
+from tests.fixtures.node import FakeNode
+
+
+class TestConfirmationTracker(unittest.TestCase):
+    def setUp(self):
+        self.chain = ChainBuilder()
+        self.tracker = ConfirmationTracker(drop_grace=2)
+
+    def block(self, txs=None, fork=''):
+        return BlockInfo(self.chain.raw_block(self.chain.add_block(txs, fork=fork)))
+
+    def send(self, i):
+        w = self.chain.wallets
+        return w[i].send(w[i + 1].address, i + 1, self.chain.next_timestamp())
+
+    def test_confirmations(self):
+        txs = [self.send(i) for i in range(3)]
+        first = self.tracker.track_many(txs)
+        deep = self.tracker.track(txs[0], confirmations=3)
+        self.assertEqual(len(self.tracker), 3)
+
+        self.tracker.apply(BlockApplied(self.block(txs[:2])))
+        self.assertTrue(first[0].done())
+        self.assertTrue(first[1].done())
+        self.assertFalse(first[2].done())
+        self.assertEqual(first[0].result().tx_id, txs[0].derive_id())
+        self.assertEqual(first[0].result().confirmations, 1)
+
+        self.tracker.apply(BlockApplied(self.block()))
+        self.assertFalse(deep.done())
+        self.tracker.apply(BlockApplied(self.block([txs[2]])))
+        self.assertEqual(deep.result().confirmations, 3)
+        self.assertTrue(first[2].done())
+        self.assertEqual(len(self.tracker), 0)
+
+    def test_revert(self):
+        tx = self.send(0)
+        future = self.tracker.track(tx.derive_id(), confirmations=2)
+        block = self.block([tx])
+        self.tracker.apply(BlockApplied(block))
+        self.tracker.apply(BlockReverted(block))
+        self.chain.rollback(1)
+        self.tracker.apply(BlockApplied(self.block(fork='b')))
+        self.assertFalse(future.done())
+        self.tracker.apply(BlockApplied(self.block([tx], fork='b')))
+        self.tracker.apply(BlockApplied(self.block(fork='b')))
+        self.assertEqual(future.result().height, self.chain.height - 1)
+
+    def test_dropped(self):
+        (dropped, late) = (self.send(0), self.send(1))
+        futures = [self.tracker.track(dropped), self.tracker.track(late)]
+        self.tracker.apply(BlockApplied(self.block()))
+        self.tracker.apply(PendingRemoved(dropped.derive_id()))
+        self.tracker.apply(PendingRemoved(late.derive_id()))
+        self.tracker.apply(BlockApplied(self.block([late])))
+        self.assertFalse(futures[0].done())
+        self.tracker.apply(BlockApplied(self.block()))
+        with self.assertRaises(TransactionDroppedError):
+            futures[0].result()
+        self.assertEqual(futures[1].result().confirmations, 1)
+
+    def test_callback_tracks(self):
+        tx = self.send(0)
+        deeper = [self.tracker.track(tx, confirmations=2)]
+        # The callback runs when the future resolves and calls back into the tracker
+        self.tracker.track(tx).add_done_callback(
+            lambda f: deeper.append(self.tracker.track(tx, confirmations=1)))
+        block = self.block([tx])
+        thread = threading.Thread(target=self.tracker.apply, args=(BlockApplied(block),))
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(deeper[1].result(timeout=1).confirmations, 1)
+        self.assertFalse(deeper[0].done())
+
+    def test_already_confirmed(self):
+        tracker = ConfirmationTracker(Client('http://node', session=FakeNode(self.chain)))
+        (tx, pending) = (self.send(0), self.send(1))
+        self.chain.add_block([tx])
+        self.chain.add_block()
+
+        # Included before tracking started, so only the lookup on the node can resolve these
+        self.assertEqual(tracker.track(tx, confirmations=2).result(timeout=1).confirmations, 2)
+        deep = tracker.track(tx, confirmations=4)
+        later = tracker.track(pending)
+        self.assertFalse(deep.done())
+        tracker.apply(BlockApplied(self.block()))
+        tracker.apply(BlockApplied(self.block([pending])))
+        self.assertEqual(deep.result(timeout=1).confirmations, 4)
+        self.assertEqual(later.result(timeout=1).confirmations, 1)
+        self.assertEqual(len(tracker), 0)
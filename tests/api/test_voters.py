@@ -0,0 +1,103 @@
+import unittest
+from risesdk.api import Client
+from risesdk.api.blocks import BlockInfo
+from tests.fixtures.chain import ChainBuilder, Wallet
+from tests.fixtures.node import FakeNode
+
+try:
+    import numpy
+    from risesdk.api.voters import VoterGraph
+except ImportError:
+    numpy = None  # type: ignore
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestVoterGraph(unittest.TestCase):
+    def setUp(self):
+        self.node = FakeNode(ChainBuilder(delegates=4))
+        self.chain = self.node.chain
+        d = [w.public_key for w in self.chain.delegates]
+        w = self.chain.wallets
+        self.chain.add_block([
+            w[0].vote([d[0], d[1]], [], self.chain.next_timestamp()),
+            w[1].vote([d[1]], [], self.chain.next_timestamp()),
+            w[2].vote([d[1], d[2]], [], self.chain.next_timestamp()),
+        ])
+        self.client = Client('http://node', session=self.node)
+        self.graph = VoterGraph(self.client, workers=2)
+        self.graph.build()
+
+    def node_weights(self):
+        return {d['publicKey']: d['vote'] for d in self.node._delegates()}
+
+    def test_build(self):
+        d = [w.public_key for w in self.chain.delegates]
+        w = self.chain.wallets
+        self.assertEqual(len(self.graph), 3)
+        self.assertEqual(self.graph.edge_count, 5)
+        self.assertEqual({a for (a, _) in self.graph.voters_of(d[1])},
+                         {w[0].address, w[1].address, w[2].address})
+        self.assertEqual(self.graph.voters_of(d[3]), [])
+        self.assertEqual(set(self.graph.delegates_of(w[2].address)), {d[1], d[2]})
+        self.assertEqual(self.graph.delegates_of(w[4].address), [])
+        weights = self.graph.weights()
+        self.assertEqual({pk.hex(): v for (pk, v) in weights.items()}, self.node_weights())
+        self.assertEqual(self.graph.weight_of(d[1]), weights[d[1]])
+
+    def test_blocks(self):
+        d = [w.public_key for w in self.chain.delegates]
+        w = self.chain.wallets
+        funder = w[4]
+        block = BlockInfo(self.chain.raw_block(self.chain.add_block([
+            w[0].vote([d[3]], [d[0]], self.chain.next_timestamp()),
+            w[3].vote([d[0]], [], self.chain.next_timestamp()),
+            funder.send(w[1].address, 12345, self.chain.next_timestamp()),
+        ])))
+        self.graph.apply_block(block)
+        self.assertEqual(set(self.graph.delegates_of(w[0].address)), {d[1], d[3]})
+        self.assertEqual(self.graph.delegates_of(w[3].address), [d[0]])
+        self.assertEqual({pk.hex(): v for (pk, v) in self.graph.weights().items()},
+                         self.node_weights())
+
+        self.chain.rollback(1)
+        self.graph.revert_block(block)
+        self.assertEqual(set(self.graph.delegates_of(w[0].address)), {d[0], d[1]})
+        self.assertEqual(self.graph.delegates_of(w[3].address), [])
+        weights = {pk.hex(): v for (pk, v) in self.graph.weights().items()}
+        self.assertEqual(weights, self.node_weights())
+
+    def test_new_voter(self):
+        d = self.chain.delegates[0].public_key
+        voter = Wallet('new voter')
+        self.assertEqual(self.graph.delegates_of(voter.address), [])
+        self.chain.wallets.append(voter)
+        self.chain.add_block([self.chain.wallets[0].send(voter.address, 10 ** 9, self.chain.next_timestamp())])
+        block = BlockInfo(self.chain.raw_block(self.chain.add_block([
+            voter.vote([d], [], self.chain.next_timestamp()),
+        ])))
+        self.graph.apply_block(block)
+        self.assertEqual(self.graph.delegates_of(voter.address), [d])
+        self.assertEqual(self.graph.balance(voter.address), self.node.balance(voter.address))
+
+    def test_new_voter_replay(self):
+        d = self.chain.delegates[0].public_key
+        voter = Wallet('new voter')
+        self.chain.wallets.append(voter)
+        funding = BlockInfo(self.chain.raw_block(self.chain.add_block([
+            self.chain.wallets[0].send(voter.address, 10 ** 9, self.chain.next_timestamp()),
+        ])))
+        block = BlockInfo(self.chain.raw_block(self.chain.add_block([
+            voter.vote([d], [], self.chain.next_timestamp()),
+        ])))
+        later = BlockInfo(self.chain.raw_block(self.chain.add_block([
+            self.chain.wallets[1].send(voter.address, 5 * 10 ** 8, self.chain.next_timestamp()),
+        ])))
+        # The node is already past the vote, so the voter's current balance is too high
+        self.graph.apply_block(funding)
+        self.graph.apply_block(block)
+        self.assertEqual(self.graph.balance(voter.address),
+                         self.node.balance(voter.address) - 5 * 10 ** 8)
+        self.graph.apply_block(later)
+        self.assertEqual(self.graph.balance(voter.address), self.node.balance(voter.address))
+        weights = {pk.hex(): v for (pk, v) in self.graph.weights().items()}
+        self.assertEqual(weights, self.node_weights())
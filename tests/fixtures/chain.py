@@ -0,0 +1,151 @@
+from typing import List, Optional
+from risesdk.protocol import (
+    Timestamp,
+    Amount,
+    Address,
+    SecretKey,
+    SendTx,
+    VoteTx,
+    PublicKey,
+    BaseTx,
+    BlockHeader,
+)
+
+BLOCK_TIME = 30
+REWARD = Amount(1500000000)
+FEE = Amount(10000000)
+
+
+class Wallet(object):
+    def __init__(self, passphrase: str):
+        self.secret = SecretKey.from_passphrase(passphrase)
+        self.public_key = self.secret.derive_public_key()
+        self.address = self.public_key.derive_address()
+
+    def send(self, recipient: Address, amount: int, timestamp: int, fee: int = FEE) -> SendTx:
+        tx = SendTx(
+            sender_public_key=self.public_key,
+            recipient=recipient,
+            amount=Amount(amount),
+            fee=Amount(fee),
+            timestamp=Timestamp(timestamp),
+        )
+        tx.signature = self.secret.sign(tx.to_bytes())
+        return tx
+
+    def vote(
+        self,
+        add: List[PublicKey],
+        remove: List[PublicKey],
+        timestamp: int,
+        fee: int = FEE,
+    ) -> VoteTx:
+        tx = VoteTx(
+            sender_public_key=self.public_key,
+            add_votes=add,
+            remove_votes=remove,
+            fee=Amount(fee),
+            timestamp=Timestamp(timestamp),
+        )
+        tx.signature = self.secret.sign(tx.to_bytes())
+        return tx
+
+
+class ChainBuilder(object):
+    """
+    Builds a synthetic chain of raw (node JSON formatted) blocks for the tests.
+    """
+
+    def __init__(self, delegates: int = 3):
+        self.delegates = [Wallet('delegate {}'.format(i)) for i in range(delegates)]
+        self.wallets = [Wallet('wallet {}'.format(i)) for i in range(5)]
+        self.blocks: List[dict] = []
+        self.add_block()
+
+    @property
+    def height(self) -> int:
+        return len(self.blocks)
+
+    def next_timestamp(self) -> int:
+        if not self.blocks:
+            return 0
+        return self.blocks[-1]['timestamp'] + BLOCK_TIME
+
+    def add_block(
+        self,
+        txs: Optional[List[BaseTx]] = None,
+        timestamp: Optional[int] = None,
+        generator: Optional[Wallet] = None,
+        fork: str = '',
+    ) -> dict:
+        txs = txs or []
+        height = len(self.blocks) + 1
+        prev_id = self.blocks[-1]['id'] if self.blocks else None
+        if timestamp is None:
+            timestamp = self.next_timestamp()
+        if generator is None:
+            # Blocks of a fork are forged by the next delegate, so that they get different ids
+            generator = self.delegates[(height + (1 if fork else 0)) % len(self.delegates)]
+        header = BlockHeader.for_transactions(
+            txs,
+            timestamp=Timestamp(timestamp),
+            previous_block_id=prev_id,
+            reward=Amount(0 if height == 1 else REWARD),
+            generator_public_key=generator.public_key,
+        )
+        signature = header.sign(generator.secret)
+        block_id = header.derive_id()
+        raw_txs = []
+        for tx in txs:
+            raw_tx = tx.to_json()
+            raw_tx['height'] = height
+            raw_tx['blockId'] = block_id
+            raw_txs.append(raw_tx)
+        block = {
+            'id': block_id,
+            'version': 0,
+            'timestamp': timestamp,
+            'height': height,
+            'previousBlock': prev_id,
+            'numberOfTransactions': header.number_of_transactions,
+            'totalAmount': header.total_amount,
+            'totalFee': header.total_fee,
+            'reward': header.reward,
+            'payloadLength': header.payload_length,
+            'payloadHash': header.payload_hash.hex(),
+            'generatorPublicKey': generator.public_key.hex(),
+            'blockSignature': signature.hex(),
+            'transactions': raw_txs,
+        }
+        self.blocks.append(block)
+        return block
+
+    def address_of(self, public_key: str) -> str:
+        for w in self.delegates + self.wallets:
+            if w.public_key.hex() == public_key:
+                return w.address
+        raise KeyError(public_key)
+
+    def add_blocks(self, count: int) -> List[dict]:
+        return [self.add_block() for _ in range(count)]
+
+    def rollback(self, count: int) -> List[dict]:
+        removed = self.blocks[-count:]
+        del self.blocks[-count:]
+        return removed
+
+    def raw_block(self, block: dict) -> dict:
+        """
+        Return a copy of the block with confirmation counts filled in.
+        """
+        confirmations = self.height - block['height'] + 1
+        return {
+            **block,
+            'transactions': [
+                {**t, 'confirmations': confirmations}
+                for t in block['transactions']
+            ],
+        }
+
+    def raw_transactions(self) -> List[dict]:
+        return [t for b in self.blocks for t in self.raw_block(b)['transactions']]
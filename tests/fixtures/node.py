@@ -0,0 +1,296 @@
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from risesdk.protocol import Address, Amount, BaseTx
+from risesdk.protocol.transactions import _tx_type_registry
+from risesdk.api.query import TransactionStore
+from risesdk.api.transactions import TransactionInfo
+from tests.fixtures.chain import ChainBuilder, REWARD, FEE
+
+# Node query parameters of /transactions and the matching TransactionStore arguments
+_TX_PARAMS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    'blockId': ('block_id', str),
+    'type': ('type_cls', lambda v: _tx_type_registry[int(v)]),
+    'senderId': ('sender', Address),
+    'recipientId': ('recipient', Address),
+    'fromHeight': ('from_height', int),
+    'toHeight': ('to_height', int),
+    'minAmount': ('min_amount', Amount),
+    'limit': ('limit', int),
+    'offset': ('offset', int),
+    'orderBy': ('order_by', str),
+}
+
+
+class FakeResponse(object):
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class FakeNode(object):
+    """
+    Minimal stand-in for a RISE node, usable as the requests session of a Client.
+
+    The node serves the blocks of a ChainBuilder and counts the calls made to each endpoint.
+    """
+
+    def __init__(self, chain: Optional[ChainBuilder] = None):
+        self.chain = chain or ChainBuilder()
+        self.calls: Counter = Counter()
+        self.milestone = 0
+        self.genesis_balance = 10 ** 14
+        self.unconfirmed: List[BaseTx] = []
+        self.queued: List[BaseTx] = []
+        self.reject: Dict[str, str] = {}
+        # Fee schedules as (from height, to height, send fee), the last one open-ended
+        self.fees: List[Tuple[int, Optional[int], int]] = [(1, None, FEE)]
+
+    def get(self, url: str, params: Any = None) -> FakeResponse:
+        return self._dispatch('GET', url, params)
+
+    def put(self, url: str, json: Any = None) -> FakeResponse:
+        return self._dispatch('PUT', url, json)
+
+    def post(self, url: str, json: Any = None) -> FakeResponse:
+        return self._dispatch('POST', url, json)
+
+    def _dispatch(self, method: str, url: str, data: Any) -> FakeResponse:
+        path = urlparse(url).path
+        self.calls[path] += 1
+        params = {k: v for (k, v) in (data or {}).items() if v is not None}
+        name = '{}_{}'.format(method.lower(), path.strip('/').replace('/', '_'))
+        handler = getattr(self, name, None)
+        if handler is None:
+            return FakeResponse({'success': False, 'error': 'Unknown endpoint {}'.format(path)})
+        try:
+            result = handler(params)
+        except LookupError as err:
+            return FakeResponse({'success': False, 'error': err.args[0]})
+        return FakeResponse({'success': True, **result})
+
+    def get_blocks_getStatus(self, params) -> Dict:
+        head = self.chain.blocks[-1]
+        return {
+            'broadhash': head['payloadHash'],
+            'epoch': '2016-05-24T17:00:00.000Z',
+            'fee': FEE,
+            'height': self.chain.height,
+            'milestone': self.milestone,
+            'nethash': 'cd8171332c012514864edd8eb6f68fc3ea6cb2afbaf21c56e12751022684cea5',
+            'reward': REWARD,
+            'supply': 10000000000000000,
+        }
+
+    def get_blocks_getFees(self, params) -> Dict:
+        height = int(params.get('height', self.chain.height))
+        for (from_height, to_height, send) in self.fees:
+            if from_height <= height and (to_height is None or height <= to_height):
+                break
+        return {
+            'fees': {
+                'send': send,
+                'vote': send * 10,
+                'secondsignature': send * 50,
+                'delegate': send * 250,
+                'multisignature': send * 50,
+                'dapp': send * 250,
+            },
+            'fromHeight': from_height,
+            'toHeight': to_height,
+            'height': height,
+        }
+
+    def get_blocks(self, params) -> Dict:
+        blocks = self.chain.blocks
+        if 'height' in params:
+            blocks = [b for b in blocks if b['height'] == int(params['height'])]
+        if 'previousBlock' in params:
+            blocks = [b for b in blocks if b['previousBlock'] == params['previousBlock']]
+        if 'generatorPublicKey' in params:
+            blocks = [b for b in blocks if b['generatorPublicKey'] == params['generatorPublicKey']]
+        field, _, direction = params.get('orderBy', 'height:desc').partition(':')
+        blocks = sorted(blocks, key=lambda b: b[field], reverse=direction == 'desc')
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 100))
+        return {
+            'blocks': [self.chain.raw_block(b) for b in blocks[offset:offset + limit]],
+            'count': len(blocks),
+        }
+
+    def get_blocks_get(self, params) -> Dict:
+        for b in self.chain.blocks:
+            if b['id'] == params['id']:
+                return {'block': self.chain.raw_block(b)}
+        raise LookupError('Block not found')
+
+    def get_transactions(self, params) -> Dict:
+        store = TransactionStore(
+            [TransactionInfo(t) for t in self.chain.raw_transactions()],
+            chain_height=self.chain.height,
+        )
+        kwargs: Dict[str, Any] = {}
+        for (key, value) in params.items():
+            prefix = 'and__' if key.startswith('and:') else ''
+            (name, conv) = _TX_PARAMS[key[len('and:'):] if prefix else key]
+            kwargs[prefix + name] = conv(value)
+        r = store.get_transactions(**kwargs)
+        return {
+            'transactions': [t.to_json() for t in r.transactions],
+            'count': r.count,
+        }
+
+    def balance(self, address: str) -> int:
+        balance = self.genesis_balance
+        for b in self.chain.blocks:
+            for t in b['transactions']:
+                if t['senderId'] == address:
+                    balance -= int(t['amount']) + int(t['fee'])
+                if t['recipientId'] == address:
+                    balance += int(t['amount'])
+            if self.chain.address_of(b['generatorPublicKey']) == address:
+                balance += int(b['reward']) + int(b['totalFee'])
+        return balance
+
+    def votes(self) -> Dict[str, Set[str]]:
+        """
+        Return the public keys of the delegates that each account votes for.
+        """
+        votes: Dict[str, Set[str]] = {}
+        for t in self.chain.raw_transactions():
+            if t['type'] != 3:
+                continue
+            voted = votes.setdefault(t['senderId'], set())
+            for vote in t['asset']['votes']:
+                if vote[0] == '+':
+                    voted.add(vote[1:])
+                else:
+                    voted.discard(vote[1:])
+        return votes
+
+    def _delegates(self) -> List[Dict]:
+        voters: Dict[str, List[str]] = {}
+        for (address, voted) in self.votes().items():
+            for public_key in voted:
+                voters.setdefault(public_key, []).append(address)
+        delegates: List[Dict[str, Any]] = []
+        for (i, w) in enumerate(self.chain.delegates):
+            public_key = w.public_key.hex()
+            produced = sum(1 for b in self.chain.blocks if b['generatorPublicKey'] == public_key)
+            delegates.append({
+                'address': w.address,
+                'publicKey': public_key,
+                'username': 'delegate_{}'.format(i),
+                'approval': 0,
+                'productivity': 100,
+                'missedblocks': 0,
+                'producedblocks': produced,
+                'vote': sum(self.balance(a) for a in voters.get(public_key, [])),
+            })
+        delegates.sort(key=lambda d: (-d['vote'], d['publicKey']))
+        for (rank, d) in enumerate(delegates, 1):
+            d['rank'] = rank
+        return delegates
+
+    def get_delegates_count(self, params) -> Dict:
+        return {'count': len(self.chain.delegates)}
+
+    def get_delegates(self, params) -> Dict:
+        delegates = self._delegates()
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 101))
+        return {
+            'delegates': delegates[offset:offset + limit],
+            'totalCount': len(delegates),
+        }
+
+    def get_delegates_voters(self, params) -> Dict:
+        accounts = []
+        for (address, voted) in sorted(self.votes().items()):
+            if params['publicKey'] in voted:
+                accounts.append({
+                    'address': address,
+                    'publicKey': self.public_key_of(address),
+                    'username': None,
+                    'balance': self.balance(address),
+                })
+        return {'accounts': accounts}
+
+    def public_key_of(self, address: str) -> Optional[str]:
+        for w in self.chain.delegates + self.chain.wallets:
+            if w.address == address:
+                return w.public_key.hex()
+        return None
+
+    def get_accounts(self, params) -> Dict:
+        address = params['address']
+        public_key = self.public_key_of(address)
+        return {
+            'account': {
+                'address': address,
+                'balance': self.balance(address),
+                'unconfirmedBalance': self.balance(address),
+                'publicKey': public_key,
+                'secondPublicKey': None,
+                'secondSignature': 0,
+                'unconfirmedSignature': 0,
+            },
+        }
+
+    def forge(self) -> dict:
+        """
+        Forge a block with all of the unconfirmed transactions.
+        """
+        txs = self.unconfirmed
+        self.unconfirmed = []
+        return self.chain.add_block(txs)
+
+    def get_transactions_count(self, params) -> Dict:
+        return {
+            'confirmed': len(self.chain.raw_transactions()),
+            'unconfirmed': len(self.unconfirmed),
+            'queued': len(self.queued),
+        }
+
+    def _pool(self, txs: List[BaseTx], params) -> Dict:
+        return {
+            'transactions': [tx.to_json() for tx in txs],
+            'count': len(txs),
+        }
+
+    def get_transactions_unconfirmed(self, params) -> Dict:
+        return self._pool(self.unconfirmed, params)
+
+    def get_transactions_queued(self, params) -> Dict:
+        return self._pool(self.queued, params)
+
+    def _pool_get(self, txs: List[BaseTx], params) -> Dict:
+        for tx in txs:
+            if tx.derive_id() == params['id']:
+                return {'transaction': tx.to_json()}
+        raise LookupError('Transaction not found')
+
+    def get_transactions_unconfirmed_get(self, params) -> Dict:
+        return self._pool_get(self.unconfirmed, params)
+
+    def get_transactions_queued_get(self, params) -> Dict:
+        return self._pool_get(self.queued, params)
+
+    def get_transactions_get(self, params) -> Dict:
+        for t in self.chain.raw_transactions():
+            if t['id'] == params['id']:
+                return {'transaction': t}
+        raise LookupError('Transaction not found')
+
+    def put_transactions(self, data) -> Dict:
+        accepted = []
+        invalid = []
+        for raw in data['transactions']:
+            if raw['id'] in self.reject:
+                invalid.append({'id': raw['id'], 'reason': self.reject[raw['id']]})
+            else:
+                accepted.append(raw['id'])
+                self.unconfirmed.append(BaseTx.from_json(raw))
+        return {'accepted': accepted, 'invalid': invalid}
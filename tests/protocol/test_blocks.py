@@ -0,0 +1,96 @@
+import unittest
+from risesdk.protocol import (
+    Amount,
+    BlockHeader,
+    SecretKey,
+    Signature,
+    Timestamp,
+    verify_blocks,
+)
+from risesdk.protocol.blocks import derive_payload
+from risesdk.api.blocks import BlockInfo
+from tests.fixtures.chain import ChainBuilder, REWARD
+
+
+class TestBlocks(unittest.TestCase):
+    def setUp(self):
+        self.chain = ChainBuilder()
+        self.generator = SecretKey.from_passphrase('generator')
+        w = self.chain.wallets
+        self.txs = [w[i].send(w[(i + 1) % 5].address, 10 + i, 500) for i in range(5)]
+
+    def header(self, txs=None, previous_block_id='12345678901234567890') -> BlockHeader:
+        header = BlockHeader.for_transactions(
+            self.txs if txs is None else txs,
+            timestamp=Timestamp(1000),
+            previous_block_id=previous_block_id,
+            reward=REWARD,
+            generator_public_key=self.generator.derive_public_key(),
+        )
+        header.sign(self.generator)
+        return header
+
+    def test_to_bytes(self):
+        header = self.header()
+        data = header.to_bytes()
+        self.assertEqual(len(data), 176)
+        self.assertEqual(data[:4], bytes(4))
+        self.assertEqual(data[4:8], (1000).to_bytes(4, 'little'))
+        self.assertEqual(data[8:16], (12345678901234567890).to_bytes(8, 'big'))
+        self.assertEqual(data[16:20], (5).to_bytes(4, 'little'))
+        self.assertEqual(data[20:28], sum(range(10, 15)).to_bytes(8, 'little'))
+        self.assertEqual(data[36:44], REWARD.to_bytes(8, 'little'))
+        (length, digest) = derive_payload(self.txs)
+        self.assertEqual(data[44:48], length.to_bytes(4, 'little'))
+        self.assertEqual(data[48:80], digest)
+        self.assertEqual(data[80:112], self.generator.derive_public_key())
+        self.assertEqual(data[112:], header.block_signature)
+        self.assertEqual(header.to_bytes(skip_signature=True), data[:112])
+        self.assertEqual(self.header(previous_block_id=None).to_bytes()[8:16], bytes(8))
+
+    def test_verify_signature(self):
+        header = self.header()
+        self.assertTrue(header.verify_signature())
+        header.reward = Amount(header.reward + 1)
+        self.assertFalse(header.verify_signature())
+        header.block_signature = None
+        self.assertFalse(header.verify_signature())
+
+    def test_verify_blocks(self):
+        header = self.header()
+        block_id = header.derive_id()
+        self.assertTrue(verify_blocks([(block_id, header, self.txs)])[0].valid)
+
+        # Tampered transaction amount, wrong id, forged signature, bad transaction signature
+        tampered = list(self.txs)
+        tampered[2] = self.chain.wallets[2].send(self.chain.wallets[3].address, 99, 500)
+        forged = self.header()
+        forged.block_signature = Signature(bytes(64))
+        bad_tx = self.chain.wallets[0].send(self.chain.wallets[1].address, 1, 500)
+        bad_tx.signature = self.txs[0].signature
+        bad_header = self.header([bad_tx])
+
+        blocks = [
+            (block_id, header, self.txs),
+            (block_id, header, tampered),
+            ('1', header, self.txs),
+            (forged.derive_id(), forged, self.txs),
+            (bad_header.derive_id(), bad_header, [bad_tx]),
+        ] * 40
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = verify_blocks(blocks, transactions=True, workers=workers, chunk_size=50)
+                self.assertEqual([r.valid for r in results[:5]], [True, False, False, False, False])
+                self.assertFalse(results[1].valid_payload)
+                self.assertTrue(results[1].valid_id and results[1].valid_signature)
+                self.assertFalse(results[2].valid_id)
+                self.assertFalse(results[3].valid_signature)
+                self.assertEqual(results[3].invalid_transactions, [])
+                self.assertEqual(results[4].invalid_transactions, [bad_tx.derive_id()])
+                self.assertTrue(results[4].valid_payload and results[4].valid_signature)
+                self.assertEqual(results[5:10], results[:5])
+
+    def test_chain_blocks(self):
+        self.chain.add_block(self.txs)
+        for raw in self.chain.blocks:
+            self.assertTrue(BlockInfo(self.chain.raw_block(raw)).verify(transactions=True).valid)
@@ -0,0 +1,110 @@
+import unittest
+from tests.fixtures import Fixtures
+from risesdk.protocol import (
+    Amount,
+    Keyring,
+    SecretKey,
+    SendTx,
+    Signer,
+    Timestamp,
+    BaseTx,
+    Signature,
+    verify_many,
+)
+
+
+class TestSigner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures = Fixtures()
+
+    def test_sign_tx_fixtures(self):
+        for (idx, item) in enumerate(self.fixtures.second_signature_txs):
+            with self.subTest(idx=idx):
+                signer = Signer(
+                    SecretKey.from_passphrase(item['secret']),
+                    SecretKey.from_passphrase(item['secondSecret']),
+                )
+                expected = BaseTx.from_json(item['tx'])
+                tx = BaseTx.from_json(item['tx'])
+                tx.signature = None
+                tx.second_signature = None
+                self.assertIs(signer.sign_tx(tx), tx)
+                self.assertEqual(tx.signature, expected.signature)
+                self.assertEqual(tx.second_signature, expected.second_signature)
+                self.assertEqual(tx.derive_id(), item['tx']['id'])
+
+    def test_sign(self):
+        secret = SecretKey.from_passphrase('signer')
+        signer = Signer(secret)
+        self.assertEqual(signer.public_key, secret.derive_public_key())
+        self.assertIsNone(signer.second_public_key)
+        self.assertEqual(signer.sign(b'message'), secret.sign(b'message'))
+
+    def test_wrong_sender(self):
+        signer = Signer(SecretKey.from_passphrase('signer'))
+        tx = self.send(Signer(SecretKey.from_passphrase('other')), 0)
+        with self.assertRaises(ValueError):
+            signer.sign_tx(tx)
+        with self.assertRaises(ValueError):
+            Keyring([signer]).sign_tx(tx)
+
+    @staticmethod
+    def send(signer: Signer, i: int) -> SendTx:
+        return SendTx(
+            sender_public_key=signer.public_key,
+            recipient=signer.public_key.derive_address(),
+            amount=Amount(i + 1),
+            fee=Amount(10000000),
+            timestamp=Timestamp(1000),
+        )
+
+    def check(self, keyring: Keyring, txs):
+        for tx in txs:
+            signer = keyring[tx.sender_public_key]
+            self.assertTrue(signer.public_key.verify(
+                tx.signature, tx.to_bytes(skip_signature=True, skip_second_signature=True)))
+            if signer.second_public_key is None:
+                self.assertIsNone(tx.second_signature)
+            else:
+                self.assertTrue(signer.second_public_key.verify(
+                    tx.second_signature, tx.to_bytes(skip_second_signature=True)))
+
+    def test_sign_many(self):
+        keyring = Keyring()
+        first = keyring.add(SecretKey.from_passphrase('first'))
+        second = keyring.add(
+            SecretKey.from_passphrase('second'), SecretKey.from_passphrase('second 2'))
+        self.assertEqual(len(keyring), 2)
+        self.assertIn(second.public_key, keyring)
+        txs = [self.send(first if i % 3 else second, i) for i in range(30)]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                for tx in txs:
+                    tx.signature = tx.second_signature = None
+                signed = keyring.sign_many(iter(txs), workers=workers, chunk_size=7)
+                self.assertEqual([id(tx) for tx in signed], [id(tx) for tx in txs])
+                self.check(keyring, signed)
+        # A single chunk is signed without a process pool
+        self.check(keyring, first.sign_many([self.send(first, i) for i in range(3)]))
+
+
+class TestVerifyMany(unittest.TestCase):
+    def test_verify_many(self):
+        signers = [Signer(SecretKey.from_passphrase('verify {}'.format(i))) for i in range(3)]
+        items = []
+        for i in range(40):
+            signer = signers[i % 3]
+            msg = 'message {}'.format(i).encode()
+            items.append((signer.public_key, signer.sign(msg), msg))
+        # Signature of a different message, and of a different key
+        items[5] = (items[5][0], items[6][1], items[5][2])
+        items[17] = (signers[0].public_key, items[17][1], items[17][2])
+        expected = [i not in (5, 17) for i in range(40)]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                self.assertEqual(verify_many(items, workers=workers, chunk_size=6), expected)
+        self.assertEqual(verify_many(iter(items[:3])), [True] * 3)
+        self.assertEqual(verify_many([]), [])
+        (pk, sig, msg) = items[5]
+        self.assertEqual(pk.verify(Signature(sig), msg), False)
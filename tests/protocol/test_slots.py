@@ -0,0 +1,31 @@
+import unittest
+from risesdk.protocol import PublicKey, Timestamp
+from risesdk.protocol.slots import (
+    generate_delegate_list,
+    next_slot_time,
+    round_of,
+    slot_delegate,
+    slot_number,
+    slot_time,
+)
+
+
+class TestSlots(unittest.TestCase):
+    def test_slots(self):
+        self.assertEqual(slot_number(Timestamp(0)), 0)
+        self.assertEqual(slot_number(Timestamp(29)), 0)
+        self.assertEqual(slot_number(Timestamp(30)), 1)
+        self.assertEqual(slot_time(slot_number(Timestamp(1000))), 990)
+        self.assertEqual(next_slot_time(Timestamp(1000)), 1020)
+
+    def test_round_of(self):
+        self.assertEqual([round_of(h) for h in (1, 100, 101, 102, 202, 203)], [1, 1, 1, 2, 2, 3])
+
+    def test_generate_delegate_list(self):
+        keys = [PublicKey(bytes([i]) * 32) for i in range(10)]
+        order = generate_delegate_list(1, keys)
+        self.assertEqual(sorted(order), keys)
+        self.assertEqual([k[0] for k in order], [7, 4, 8, 2, 1, 6, 3, 0, 5, 9])
+        self.assertEqual([k[0] for k in generate_delegate_list(2, keys)],
+                         [2, 5, 1, 7, 0, 4, 6, 8, 3, 9])
+        self.assertEqual(slot_delegate(13, order), order[3])
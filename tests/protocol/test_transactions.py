@@ -1,5 +1,6 @@
 import unittest
 from tests.fixtures import Fixtures
+from risesdk.protocol.transactions import _tx_type_registry, transaction_type
 from risesdk.protocol import (
     Timestamp,
     Amount,
@@ -52,6 +53,44 @@ class TestTransactions(unittest.TestCase):
                 sig2 = sk2.sign(msg2)
                 self.assertEqual(sig2, tx.second_signature)
 
+    def test_from_bytes_fixtures(self):
+        tests = [
+            ('send', self.fixtures.send_txs),
+            ('delegate', self.fixtures.delegate_txs),
+            ('vote_txs', self.fixtures.vote_txs),
+            ('second_signature', [raw['tx'] for raw in self.fixtures.second_signature_txs]),
+        ]
+        for (fixture, raw_txs) in tests:
+            for (idx, raw_tx) in enumerate(raw_txs):
+                with self.subTest(fixture=fixture, index=idx):
+                    tx = BaseTx.from_json(raw_tx)
+                    parsed = BaseTx.from_bytes(
+                        tx.to_bytes(),
+                        fee=tx.fee,
+                        has_second_signature=tx.second_signature is not None,
+                    )
+                    self.assertIs(type(parsed), type(tx))
+                    self.assertEqual(parsed.to_json(), tx.to_json())
+
+    def test_from_bytes_unsupported(self):
+        class CustomTx(BaseTx):
+            def _asset_bytes(self):
+                return b'custom'
+
+            def _asset_json(self):
+                return None
+
+            @classmethod
+            def parse_json(cls, data):
+                return super().parse_json(data)
+
+        transaction_type(99)(CustomTx)
+        self.addCleanup(_tx_type_registry.pop, 99)
+        secret = SecretKey.from_passphrase('robust swift grocery')
+        tx = CustomTx(secret.derive_public_key(), Amount(0), Timestamp(0))
+        with self.assertRaises(NotImplementedError):
+            BaseTx.from_bytes(tx.to_bytes(), fee=tx.fee, has_signature=False)
+
     def test_send_from_json(self):
         raw_tx = {
             'type': 0,
@@ -0,0 +1,77 @@
+import io
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+from risesdk.protocol import Amount
+from risesdk.api import Client, ConfirmationTracker
+from risesdk.loadgen import (
+    STUB_URL,
+    LoadGenerator,
+    StubNode,
+    main,
+    percentile,
+    presign,
+    sender_keys,
+)
+
+
+class TestLoadGenerator(unittest.TestCase):
+    def test_presign(self):
+        keys = sender_keys(3)
+        txs = presign(keys, 7, Amount(1), Amount(10000000), workers=1)
+        self.assertEqual(len(txs), 7)
+        self.assertEqual(len({tx.derive_id() for tx in txs}), 7)
+        # Interleaved by sender
+        senders = [keys.index(k) for tx in txs for k in keys
+                   if k.derive_public_key() == tx.sender_public_key]
+        self.assertEqual(senders, [0, 1, 2, 0, 1, 2, 0])
+        for tx in txs:
+            self.assertTrue(tx.sender_public_key.verify(
+                tx.signature, tx.to_bytes(skip_signature=True, skip_second_signature=True)))
+
+    def test_run(self):
+        node = StubNode(block_time=0.1)
+        client = Client(STUB_URL, session=node)
+        txs = presign(sender_keys(2), 40, Amount(1), Amount(10000000), workers=1)
+        generator = LoadGenerator(client, batch_size=8, poll_interval=0.05, confirm_timeout=5)
+        client.transactions.add_transactions(*txs[:5])
+        report = generator.run(txs)
+        self.assertEqual(report.submitted, 40)
+        self.assertEqual(report.accepted, 35)
+        self.assertEqual(report.rejected, 5)
+        self.assertEqual(report.confirmed, 35)
+        self.assertEqual(report.reasons['Transaction is already processed'], 5)
+        self.assertEqual(len(report.latencies), 35)
+
+    def test_already_confirmed(self):
+        def track(tx, confirmations=1):
+            future = Future()
+            future.set_result(None)
+            return future
+
+        client = Client(STUB_URL, session=StubNode(block_time=60))
+        txs = presign(sender_keys(2), 10, Amount(1), Amount(10000000), workers=1)
+        generator = LoadGenerator(client, batch_size=4, poll_interval=0.05, confirm_timeout=5)
+        reports = []
+        with mock.patch.object(ConfirmationTracker, 'track', side_effect=track):
+            thread = threading.Thread(
+                target=lambda: reports.append(generator.run(txs)), daemon=True)
+            thread.start()
+            thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(reports[0].accepted, 10)
+        self.assertEqual(reports[0].confirmed, 10)
+
+    def test_main(self):
+        out = io.StringIO()
+        with mock.patch('sys.stdout', out):
+            main(['--stub', '--senders', '2', '--count', '10', '--workers', '1', '--rate', '200',
+                  '--stub-block-time', '0.1', '--poll-interval', '0.05'])
+        self.assertIn('accepted    10', out.getvalue())
+        self.assertIn('confirmed   10', out.getvalue())
+
+    def test_percentile(self):
+        self.assertEqual(percentile(range(1, 101), 90), 90)
+        with self.assertRaises(ValueError):
+            percentile([], 50)